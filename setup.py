@@ -3,12 +3,53 @@
 
 import os
 
-from distutils import dir_util
+from distutils import dir_util, log
 from distutils.filelist import FileList
-from setuptools import find_packages, setup
+from setuptools import Command, find_packages, setup
+from setuptools.command.build_py import build_py
 from setuptools.command.sdist import sdist
 
 
+def _build_bundle(base_dir):
+    """Pack the template files into ``skelpy/templates`` under *base_dir*."""
+
+    from skelpy.templates import bundle
+
+    target_dir = os.path.join(base_dir, 'skelpy', 'templates')
+    dir_util.mkpath(target_dir)
+    count = bundle.build(target=os.path.join(target_dir, bundle.BUNDLE_FILE))
+    log.info("packed %d templates into '%s'", count, target_dir)
+
+
+class build_templates(Command):
+    """Pack the template files into a single bundle in the build directory.
+
+    The bundle is never written into the source tree, where it would hide
+    the templates being edited. See :mod:`skelpy.templates.bundle`.
+    """
+    description = "pack the template files into a single bundle"
+    user_options = [
+        ('build-lib=', 'd', "directory to build the bundle under"),
+    ]
+
+    def initialize_options(self):
+        self.build_lib = None
+
+    def finalize_options(self):
+        self.set_undefined_options('build_py', ('build_lib', 'build_lib'))
+
+    def run(self):
+        _build_bundle(self.build_lib)
+
+
+class build_py_with_templates(build_py):
+    """Build the template bundle after building the package."""
+
+    def run(self):
+        build_py.run(self)
+        self.run_command('build_templates')
+
+
 class ezip(sdist):
     """Create the ezip distribution.
 
@@ -36,6 +77,7 @@ class ezip(sdist):
                                      self.distribution.get_name())
 
             self.make_release_tree(base_dir, self.filelist.files)
+            _build_bundle(base_dir)
             archive_files = []             # remember names of files we create
 
             file = self.make_archive(ezip_name, 'zip',
@@ -95,5 +137,7 @@ setup(
         'Programming Language :: Python :: 3',
         'Topic :: Utilities'
     ],
-    cmdclass={'ezip': ezip},
+    cmdclass={'ezip': ezip,
+              'build_templates': build_templates,
+              'build_py': build_py_with_templates},
 )
@@ -1,3 +1,12 @@
 # -*- coding: utf-8 -*-
 
 __version__ = '1.0.0'
+
+
+def generate(spec, output=None):
+    """create a project in-process. See :func:`skelpy.api.generate`"""
+
+    #: imported here, so that ``import skelpy`` stays cheap for the command line
+    from skelpy.api import generate as _generate
+
+    return _generate(spec, output)
@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""run *skelpy* as a module, i.e., ``python -m skelpy``"""
+
+import sys
+
+from skelpy.main import run
+
+sys.exit(run())
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Programmatic interface to *skelpy*
+
+:func:`generate` creates a project in-process, without the command line,
+i.e., neither parsing arguments nor configuring logging nor printing anything::
+
+    >>> import skelpy
+    >>> result = skelpy.generate({'projectName': 'my_project', 'license': 'GPL3'})
+    >>> result.ok
+    True
+    >>> os.path.join(result.projectDir, 'LICENSE') in result.created
+    True
+
+The spec takes the same keys as a line of a batch manifest--see
+``skelpy batch --help``--, and the project is always created in the quiet
+mode, i.e., without the editor round-trip.
+
+Log messages go to the ``skelpy`` logger, which has a
+:class:`logging.NullHandler`, so they show up only where the application
+configures logging.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import logging
+from timeit import default_timer as timer
+
+from skelpy.utils import durability
+from skelpy.utils.report import Report, CREATED, OVERWRITTEN, UNCHANGED, SKIPPED
+
+#: options of the 'template' sub-command a spec does not give
+DEFAULTS = {
+    'projectName': '',
+    'format': 'basic',
+    'test': 'pytest',
+    'quiet': True,
+    'merge': False,
+    'force': False,
+    'durability': durability.STRICT,
+    'output': None,
+    'dedup': None,
+    'staging': False,
+}
+
+logging.getLogger('skelpy').addHandler(logging.NullHandler())
+
+
+class Result(object):
+    """outcome of :func:`generate`
+
+    Attributes:
+        ok (bool): True if the project is successfully created
+        projectDir (str): absolute path of the project directory
+        created (list): paths of the files created
+        overwritten (list): paths of the files overwritten with new content
+        unchanged (list): paths of the files which already had the content
+        skipped (list): paths of the existing files left alone, i.e., no ``force``
+        bytes_written (int): total size of the files created or overwritten
+        timings (dict): *Maker* name to the seconds it took
+        elapsed (float): seconds the whole generation took
+        backend (:class:`skelpy.utils.backends.Backend`): where the project was
+            written, e.g., a :class:`~skelpy.utils.backends.MemoryBackend`
+
+    """
+    def __init__(self, ok, projectDir, report, elapsed, backend):
+        self.ok = ok
+        self.projectDir = projectDir
+        self.created = list(report.files[CREATED])
+        self.overwritten = list(report.files[OVERWRITTEN])
+        self.unchanged = list(report.files[UNCHANGED])
+        self.skipped = list(report.files[SKIPPED])
+        self.bytes_written = report.bytes_written
+        self.timings = dict(report.timings)
+        self.elapsed = elapsed
+        self.backend = backend
+
+    def __bool__(self):
+        return self.ok
+
+    __nonzero__ = __bool__  # python 2
+
+    def __repr__(self):
+        return '<Result ok={} created={} overwritten={} unchanged={} skipped={}>'.format(
+            self.ok, len(self.created), len(self.overwritten),
+            len(self.unchanged), len(self.skipped))
+
+
+def generate(spec, output=None):
+    """create a project
+
+    Args:
+        spec (dict): project options and information, e.g., ``projectName``,
+            ``format``, ``description``, ``license``. ``projectName`` may be
+            a path, relative to the current directory.
+        output (str or :class:`skelpy.utils.backends.Backend`): where to write
+            the project. A path of an archive--see
+            :func:`skelpy.utils.backends.open_backend`--, or a backend such as
+            :class:`~skelpy.utils.backends.MemoryBackend`, which is not closed.
+            The file system if not given.
+
+    Returns:
+        :class:`Result`: the outcome
+
+    Raises:
+        ValueError: if the project name is missing or invalid, or the type of
+            *output* is unknown
+
+    """
+    from skelpy.main import _parse_projectName
+    from skelpy.makers import Settings, get_maker
+    from skelpy.utils.backends import Backend, open_backend
+
+    opts = dict(DEFAULTS)
+    opts.update(spec)
+    opts['quiet'] = True
+    if not opts['projectName']:
+        raise ValueError('projectName is required')
+    projectDir, projectName = _parse_projectName(opts['projectName'])
+    if not projectName:
+        raise ValueError("invalid project name: '{}'".format(opts['projectName']))
+    opts['projectDir'] = projectDir
+    opts['projectName'] = projectName
+
+    if isinstance(output, Backend):
+        backend, owned = output, False
+    else:
+        opts['output'] = output or opts['output']
+        backend = open_backend(opts['output'], os.path.dirname(projectDir))
+        owned = True
+
+    settings = Settings(opts)
+    settings.backend = backend
+    report = settings.report = Report()
+
+    start = timer()
+    ok = False
+    try:
+        maker_cls = get_maker('project')
+        ok = bool(maker_cls and maker_cls.from_settings(settings).generate())
+    finally:
+        if owned:
+            backend.close()
+
+    return Result(ok, projectDir, report, timer() - start, backend)
@@ -0,0 +1,377 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""benchmark suite of *skelpy*, run by ``skelpy bench``
+
+The suite times what a run of *skelpy* does, in the current process:
+
+    * ``generate_cold_{format}``: generating a project after all the
+      process-wide caches--templates, identity, executables, dedup--are cleared
+    * ``generate_warm_{format}``: generating a project against warm caches
+    * ``license_change``: changing the license of a project, alternately
+      between MIT and GPL3, like ``skelpy license`` does
+    * ``render_templates``: rendering all the templates with the settings of
+      a typical generation
+    * ``render_{how}``: rendering the largest template, i.e., the GPL3 license,
+      with the same settings in three ways--see :data:`RENDER_WAYS`--, i.e.,
+      :class:`string.Template` against
+      :class:`~skelpy.templates.CompiledTemplate`
+    * ``read_setup_cfg``: reading the ``setup.cfg`` of a generated project
+
+Projects are generated in both formats, i.e., ``basic`` and ``src``, into a
+scratch directory on a tmpfs--``/dev/shm``--if available, so that the disk
+does not dominate the results, and removed at the end.
+
+The inputs are fixed--e.g., the author is given rather than looked up--,
+so the results are comparable between releases. They come out as JSON::
+
+    {"skelpy": "1.0.0", "python": "3.7.0", "platform": "linux", ...
+     "results": {"generate_warm_basic": {"runs": 20, "min": 0.0051,
+                                         "median": 0.0054, "mean": 0.0056,
+                                         "total": 0.1120}, ...}}
+
+Times are in seconds.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+import shutil
+import tempfile
+from timeit import default_timer as timer
+
+#: project formats benchmarked
+FORMATS = ('basic', 'src')
+
+#: ways of rendering a template, compared by the ``render_{how}`` benchmarks:
+#:
+#:     * ``string_template``: ``string.Template(text).safe_substitute(**settings)``
+#:     * ``compiled``: the same call on the compiled template
+#:     * ``compiled_resolve``: what ``BaseMaker.write_file`` does, i.e.,
+#:       ``safe_substitute(settings.resolve(placeholders))``
+RENDER_WAYS = ('string_template', 'compiled', 'compiled_resolve')
+
+#: template rendered by the ``render_{how}`` benchmarks, the largest one
+RENDER_TEMPLATE = 'license_gpl_3.0'
+
+#: benchmarks in the order they run
+BENCHMARKS = tuple(['generate_cold_' + f for f in FORMATS]
+                   + ['generate_warm_' + f for f in FORMATS]
+                   + ['license_change', 'render_templates', 'read_setup_cfg']
+                   + ['render_' + how for how in RENDER_WAYS])
+
+#: fixed project information, so that nothing is looked up
+SPEC = {'author': 'skelpy', 'author_email': 'skelpy@example.com',
+        'description': 'benchmark project', 'url': 'https://example.com',
+        'version': '1.0.0', 'license': 'MIT'}
+
+#: tmpfs directory preferred for the scratch directory
+TMPFS_DIR = '/dev/shm'
+
+
+def scratch_root(directory=None):
+    """choose the directory to create the scratch directory in
+
+    Args:
+        directory (str): directory given by the user, if any
+
+    Returns:
+        str: *directory*, :data:`TMPFS_DIR` if writable, or the temporary directory
+
+    """
+    if directory:
+        return directory
+    if os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK):
+        return TMPFS_DIR
+
+    return tempfile.gettempdir()
+
+
+def stats(times):
+    """summarize the times of the runs of a benchmark
+
+    Args:
+        times (list): seconds each run took
+
+    Returns:
+        dict: ``runs``, ``min``, ``median``, ``mean`` and ``total``
+
+    """
+    times = sorted(times)
+    n = len(times)
+    if not n:
+        return {'runs': 0}
+    mid = n // 2
+    median = times[mid] if n % 2 else (times[mid - 1] + times[mid]) / 2.0
+
+    return {'runs': n, 'min': times[0], 'median': median,
+            'mean': sum(times) / n, 'total': sum(times)}
+
+
+def _clear_caches():
+    """clear the process-wide caches, i.e., make the next generation cold"""
+
+    from skelpy.templates import cache_clear
+    from skelpy.utils.identity import identity_cache
+    from skelpy.utils.executables import executable_index
+    from skelpy.utils.dedup import dedup_index
+
+    cache_clear()
+    identity_cache.clear()
+    executable_index.clear()
+    dedup_index.clear()
+
+
+def _generate(root, name, fmt, durability):
+    """generate a project and time it
+
+    Returns:
+        float: seconds it took
+
+    Raises:
+        RuntimeError: if the generation fails
+
+    """
+    from skelpy.api import generate
+
+    spec = dict(SPEC, projectName=os.path.join(root, name), format=fmt,
+                durability=durability)
+    start = timer()
+    result = generate(spec)
+    elapsed = timer() - start
+    if not result.ok:
+        raise RuntimeError("failed to generate '{}'".format(spec['projectName']))
+
+    return elapsed
+
+
+def bench_generate(root, fmt, number, cold, durability):
+    """time generating projects
+
+    Args:
+        root (str): scratch directory
+        fmt (str): project format, i.e., one of :data:`FORMATS`
+        number (int): number of projects
+        cold (bool): if True, the caches are cleared before each project.
+            Otherwise, they are warmed up before the first one.
+        durability (str): durability policy
+
+    Returns:
+        list: seconds each project took
+
+    """
+    kind = 'cold' if cold else 'warm'
+    if not cold:
+        _generate(root, '{}_{}_warm_up'.format(kind, fmt), fmt, durability)
+
+    times = []
+    for i in range(number):
+        if cold:
+            _clear_caches()
+        times.append(_generate(root, '{}_{}_{}'.format(kind, fmt, i), fmt, durability))
+
+    return times
+
+
+def bench_license_change(projectDir, number):
+    """time changing the license of a project
+
+    Args:
+        projectDir (str): directory of a generated project
+        number (int): number of changes
+
+    Returns:
+        list: seconds each change took
+
+    """
+    from skelpy.makers import Settings
+    from skelpy.makers.license_change import Maker
+
+    cwd = os.getcwd()
+    times = []
+    try:
+        #: the license is changed in the current directory
+        os.chdir(projectDir)
+        for i in range(number):
+            start = timer()
+            maker = Maker(list_option=False, license=('GPL3', 'MIT')[i % 2],
+                          settings=Settings({'author': SPEC['author']}))
+            ok = maker.generate()
+            times.append(timer() - start)
+            if not ok:
+                raise RuntimeError("failed to change the license: '{}'".format(projectDir))
+    finally:
+        os.chdir(cwd)
+
+    return times
+
+
+def _render_settings():
+    """settings of a typical generation, to render templates with"""
+
+    from skelpy.makers import Settings
+
+    return Settings({'projectName': 'project', 'projectDir': '/tmp/project',
+                     'format': 'basic', 'test': 'pytest', 'today': '2019-01-01',
+                     'year': '2019', 'packageDir': 'project', 'docsDir': 'docs',
+                     'testsDir': 'tests', 'package_dir': '.',
+                     'python_version': '3.7.0', 'python_version_short': '3.7'},
+                    dict(SPEC))
+
+
+def bench_render_templates(number):
+    """time rendering all the templates
+
+    Args:
+        number (int): number of rounds, each rendering all the templates
+
+    Returns:
+        list: seconds each round took
+
+    """
+    from skelpy.templates import get_template, placeholders, template_names
+
+    settings = _render_settings()
+    templates = [(get_template(name), placeholders(name)) for name in template_names()]
+
+    times = []
+    for _ in range(number):
+        start = timer()
+        for template, names in templates:
+            template.safe_substitute(settings.resolve(names))
+        times.append(timer() - start)
+
+    return times
+
+
+def bench_render_template(how, number, tpl_name=RENDER_TEMPLATE):
+    """time rendering a template in one of :data:`RENDER_WAYS`
+
+    Args:
+        how (str): one of :data:`RENDER_WAYS`
+        number (int): number of renders
+        tpl_name (str): template to render
+
+    Returns:
+        list: seconds each render took
+
+    Raises:
+        RuntimeError: if the template is rendered differently from
+            :class:`string.Template`
+
+    """
+    import string
+    from skelpy.templates import CompiledTemplate, get_template
+
+    settings = _render_settings()
+    compiled = CompiledTemplate(get_template(tpl_name).template)
+    if how == 'string_template':
+        plain = string.Template(compiled.template)
+        render = lambda: plain.safe_substitute(**settings)
+    elif how == 'compiled':
+        render = lambda: compiled.safe_substitute(**settings)
+    else:
+        render = lambda: compiled.safe_substitute(settings.resolve(compiled.placeholders))
+
+    if render() != string.Template(compiled.template).safe_substitute(**settings):
+        raise RuntimeError("'{}' renders '{}' differently".format(how, tpl_name))
+
+    times = []
+    for _ in range(number):
+        start = timer()
+        render()
+        times.append(timer() - start)
+
+    return times
+
+
+def bench_read_setup_cfg(cfgFile, number):
+    """time reading ``setup.cfg``
+
+    Args:
+        cfgFile (str): path of ``setup.cfg`` of a generated project
+        number (int): number of reads
+
+    Returns:
+        list: seconds each read took
+
+    """
+    from skelpy.utils.helpers import read_setup_cfg
+
+    times = []
+    for _ in range(number):
+        start = timer()
+        read_setup_cfg(cfgFile)
+        times.append(timer() - start)
+
+    return times
+
+
+def run(number=20, repeat=100, directory=None, durability='strict', only=None):
+    """run the benchmark suite
+
+    Args:
+        number (int): number of projects generated per benchmark, and of
+            license changes
+        repeat (int): number of rounds of the benchmarks not writing files,
+            i.e., rendering templates and reading ``setup.cfg``
+        directory (str): where to create the scratch directory. A tmpfs if
+            available--see :func:`scratch_root`--if not given.
+        durability (str): durability policy of the generations
+        only (list): names of the benchmarks to run. All of :data:`BENCHMARKS`
+            if not given.
+
+    Returns:
+        dict: environment and the results of the benchmarks, see :func:`stats`
+
+    Raises:
+        ValueError: if an unknown benchmark is given
+        RuntimeError: if a benchmark fails
+
+    """
+    import platform
+    import skelpy
+
+    selected = list(only or BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError('unknown benchmarks: {}'.format(', '.join(unknown)))
+
+    root = scratch_root(directory)
+    scratch = tempfile.mkdtemp(prefix='skelpy-bench-', dir=root)
+    results = {}
+    try:
+        for fmt in FORMATS:
+            for cold in (True, False):
+                name = 'generate_{}_{}'.format('cold' if cold else 'warm', fmt)
+                if name in selected:
+                    results[name] = stats(
+                        bench_generate(scratch, fmt, number, cold, durability))
+
+        if set(selected) & set(['license_change', 'read_setup_cfg']):
+            projectDir = os.path.join(scratch, 'fixture')
+            _generate(scratch, 'fixture', 'basic', durability)
+            if 'license_change' in selected:
+                results['license_change'] = stats(bench_license_change(projectDir, number))
+            if 'read_setup_cfg' in selected:
+                results['read_setup_cfg'] = stats(
+                    bench_read_setup_cfg(os.path.join(projectDir, 'setup.cfg'), repeat))
+
+        if 'render_templates' in selected:
+            results['render_templates'] = stats(bench_render_templates(repeat))
+        for how in RENDER_WAYS:
+            if 'render_' + how in selected:
+                results['render_' + how] = stats(bench_render_template(how, repeat))
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    return {'skelpy': skelpy.__version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': sys.platform,
+            'directory': root,
+            'number': number,
+            'repeat': repeat,
+            'durability': durability,
+            'results': results}
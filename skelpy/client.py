@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""thin client of the *skelpy* server
+
+When the environment variable ``SKELPY_SOCKET`` names the socket of a running
+server--see :mod:`skelpy.server`--, ``skelpy`` forwards its invocation to
+the server instead of doing the job itself. See :func:`forward`.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+
+#: environment variable holding the socket path of a running server
+ENV_SOCKET = 'SKELPY_SOCKET'
+
+
+def _is_forwardable(argv):
+    """check if the invocation can run in the server
+
+    Invocations that need the local terminal--i.e., the editor round-trip of
+    the 'template' sub-command without ``-q/--quiet``, a batch manifest read
+    from the standard input or a project streamed to the standard output--,
+    traced invocations, ``bench`` and ``serve`` itself are not forwarded.
+    Nor are projects given information by the environment variables, e.g.,
+    ``SKELPY_DESCRIPTION``, which the server does not see.
+
+    Args:
+        argv (list): command-line arguments
+
+    Returns:
+        bool: True if the invocation can be forwarded, False otherwise
+
+    """
+    command = argv[0] if argv else ''
+    if command in ('serve', 'bench'):
+        return False
+    #: tracing measures this process
+    if any(arg == '--timings' or arg.startswith('--trace') for arg in argv):
+        return False
+    if command == 'batch':
+        return '-' not in argv[1:]
+    if command in ('license', 'update'):
+        return True
+    #: project information given by the environment of this process
+    if any(key.startswith('SKELPY_') and key != ENV_SOCKET for key in os.environ):
+        return False
+    for option, value in zip(argv, argv[1:]):
+        if option in ('-o', '--output') and value == '-':
+            return False
+    if '--output=-' in argv:
+        return False
+
+    for arg in argv:
+        if arg in ('-h', '--help', '--quiet'):
+            return True
+        if arg.startswith('-') and not arg.startswith('--') and 'q' in arg:
+            return True
+
+    return False
+
+
+def forward(argv, socket_path=None):
+    """forward a command-line invocation to a running server
+
+    Args:
+        argv (list): command-line arguments
+        socket_path (str): socket of the server. ``$SKELPY_SOCKET`` if not given.
+
+    Returns:
+        int or None: exit status of the invocation, or None if the invocation
+        was not forwarded--e.g., no server is running--and should run locally.
+
+    """
+    socket_path = socket_path or os.environ.get(ENV_SOCKET)
+    if not socket_path or not _is_forwardable(argv):
+        return None
+
+    #: imported here not to slow down the start-up when no server is used
+    import json
+    import socket
+
+    family = getattr(socket, 'AF_UNIX', None)
+    if family is None:
+        return None
+
+    request = {'argv': list(argv), 'cwd': os.getcwd()}
+    conn = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(1.0)
+        try:
+            conn.connect(socket_path)
+        except (IOError, OSError):
+            return None
+        conn.settimeout(None)
+
+        conn.sendall((json.dumps(request) + '\n').encode('utf-8'))
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        conn.close()
+
+    try:
+        response = json.loads(b''.join(chunks).decode('utf-8'))
+    except ValueError:
+        sys.stderr.write("[skelpy] Invalid response from the server\n")
+        return 1
+
+    sys.stdout.write(response.get('stdout', ''))
+    sys.stderr.write(response.get('stderr', ''))
+    return response.get('status', 1)
@@ -9,28 +9,60 @@ the project-structure accordingly.
 from __future__ import absolute_import, print_function
 
 import sys
-import logging
 import os
 
-from skelpy.makers import settings, get_maker
-from skelpy.utils.defaultsubparse import DefaultSubcommandArgParser
-import skelpy.utils.helpers as helpers
+#: Keep the imports above to the minimum. ``skelpy --help`` and
+#: ``skelpy license --list`` should not pay for what they do not use.
+#: Other modules, e.g., :mod:`logging` or :mod:`skelpy.makers`, are imported
+#: in the functions that need them.
 
+#: format of log messages
+LOG_FORMAT = '%(asctime)-s %(message)s'
+
+#: project information which can be given instead of editing the info file,
+#: i.e., the fields of ``info.tpl``
+INFO_FIELDS = ('version', 'description', 'url', 'license', 'author', 'author_email')
+
+#: prefix of the environment variables giving the project information,
+#: e.g., ``SKELPY_DESCRIPTION``
+INFO_ENV_PREFIX = 'SKELPY_'
 
-def _setup_arg_parser():
-    """Setup command-line option parser
+
+def _add_trace_arguments(parser):
+    """add the tracing options shared by the sub-commands generating projects
+
+    Only the spans of this process are recorded, e.g., not those of the
+    worker processes of 'batch -j N'. See :mod:`skelpy.utils.trace`.
+
+    Args:
+        parser (obj): sub-parser of a sub-command
+
+    Returns:
+        None
 
     """
-    parser = DefaultSubcommandArgParser()
-    subparsers = parser.add_subparsers(title='sub-command')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='write where the time goes in the Chrome trace-event '
+                             'format, e.g., for chrome://tracing')
+    parser.add_argument('--timings', action='store_true',
+                        help='print a summary of where the time goes [default: %(default)s]')
 
-    #: main options
-    #: setting 'prog' prevents showing subparser's name in the usage output
-    main_parser = subparsers.add_parser('template',
-                                        prog='skelpy',
-                                        description='A simple template tool for a python project.',
-                                        epilog="For the 'license' sub-command, see 'skelpy license --help'.")
 
+def _add_template_arguments(main_parser):
+    """add the options of the 'template' sub-command
+
+    Args:
+        main_parser (obj): sub-parser of the 'template' sub-command
+
+    Returns:
+        None
+
+    """
+    from skelpy.utils import durability, dedup
+
+    main_parser.description = 'A simple template tool for a python project.'
+    main_parser.epilog = ("For the other sub-commands, i.e., 'license', 'bench', "
+                          "'batch', 'update' and 'serve', see 'skelpy SUB-COMMAND --help'.")
     main_parser.add_argument('projectName', metavar='ProjectName', nargs='?',
                              default='', help='project(directory) name to create')
     main_parser.add_argument('-F', '--format', default='basic',
@@ -40,36 +72,305 @@ def _setup_arg_parser():
                              choices=['unittest', 'pytest'],
                              help='testing tool [default: %(default)s]')
     main_parser.add_argument('-q', '--quiet', action='store_true',
-                             help='skip editing setup.cfg file [default: %(default)s]')
+                             help='skip editing the project information, applying the '
+                                  'defaults or the information given '
+                                  '[default: %(default)s]')
     main_parser.add_argument('-m', '--merge', action='store_true',
                              help='overlap project onto existing directory [default: %(default)s]')
     main_parser.add_argument('-f', '--force', action='store_true',
                              help='overwrite existing files [default: %(default)s]')
+    main_parser.add_argument('--durability', default=durability.STRICT,
+                             choices=durability.POLICIES,
+                             help='when to sync files to the disk: never, once at the end, '
+                                  'or after each file [default: %(default)s]')
+    main_parser.add_argument('-o', '--output', metavar='ARCHIVE',
+                             help="write the project into an archive instead of the "
+                                  "file system: a .zip, .tar, .tar.gz, .tar.bz2 or "
+                                  ".tar.xz file, or '-' for a tar stream to the "
+                                  "standard output")
+    main_parser.add_argument('--dedup', choices=dedup.MODES,
+                             help='materialize files identical to ones already written '
+                                  'in the run as hard links or reflinks. Hard-linked '
+                                  'files share their data: do not edit them in place')
+    main_parser.add_argument('--staging', action='store_true',
+                             help='render a new project into a staging directory and '
+                                  'rename it at last [default: %(default)s]')
+    _add_trace_arguments(main_parser)
     main_parser.add_argument('-v', '--verbose', action='store_true',
                              help='show verbose messages [default: %(default)s]')
+    _add_info_arguments(main_parser)
+    main_parser.set_defaults(func=_skel)
 
-    #: license sub-command options
-    lic_parser = subparsers.add_parser('license', prog='skelpy license')
+
+def _add_info_arguments(main_parser):
+    """add the options giving the project information, i.e., the fields of ``info.tpl``
+
+    Options not given are left out of the parsed arguments--rather than set to
+    None--, so they do not hide the defaults. See :func:`_collect_info`.
+
+    Args:
+        main_parser (obj): sub-parser of the 'template' sub-command
+
+    Returns:
+        None
+
+    """
+    from argparse import SUPPRESS
+
+    group = main_parser.add_argument_group(
+        'project information',
+        'Given any of these, or the environment variables {}VERSION, {}DESCRIPTION, '
+        'etc., the editor is skipped.'.format(INFO_ENV_PREFIX, INFO_ENV_PREFIX))
+    group.add_argument('--info', metavar='FILE', default=SUPPRESS,
+                       help='file with [Project] and [Author] sections, like the one '
+                            'opened in the editor')
+    group.add_argument('--project-version', dest='version', metavar='VERSION',
+                       default=SUPPRESS, help='version of the project')
+    group.add_argument('--description', default=SUPPRESS,
+                       help='short description of the project')
+    group.add_argument('--url', default=SUPPRESS, help='URL of the project')
+    group.add_argument('--license', default=SUPPRESS,
+                       help="license of the project. See 'skelpy license --list'")
+    group.add_argument('--author', default=SUPPRESS, help='name of the author(s)')
+    group.add_argument('--author-email', dest='author_email', metavar='EMAIL',
+                       default=SUPPRESS, help='email address of the author(s)')
+
+
+def _add_license_arguments(lic_parser):
+    """add the options of the 'license' sub-command
+
+    Args:
+        lic_parser (obj): sub-parser of the 'license' sub-command
+
+    Returns:
+        None
+
+    """
     lic_parser.add_argument('license', metavar='LICENSE', nargs='?', default=None,
                             help='new license to create or change to')
     lic_parser.add_argument('-l', '--list', action='store_true',
                             help='show licenses supported by templater')
     lic_parser.add_argument('-v', '--verbose', action='store_false',
                             help='show verbose messages [default: %(default)s]')
-
-    #: assign a front-end function to each sub-parser
-    main_parser.set_defaults(func=_skel)
     lic_parser.set_defaults(func=_license)
+
+
+def _add_bench_arguments(bench_parser):
+    """add the options of the 'bench' sub-command
+
+    Args:
+        bench_parser (obj): sub-parser of the 'bench' sub-command
+
+    Returns:
+        None
+
+    """
+    from skelpy.utils import durability
+
+    bench_parser.description = ('Run the benchmark suite, i.e., time generating projects '
+                                'cold and warm in both formats, changing licenses, '
+                                'rendering templates and reading setup.cfg, and write '
+                                'the results as JSON.')
+    bench_parser.add_argument('-n', '--number', type=int, default=20, metavar='N',
+                              help='projects generated per benchmark [default: %(default)s]')
+    bench_parser.add_argument('-r', '--repeat', type=int, default=100, metavar='N',
+                              help='rounds of the benchmarks not writing files '
+                                   '[default: %(default)s]')
+    bench_parser.add_argument('-d', '--dir', metavar='DIR',
+                              help='where to generate projects [default: /dev/shm if '
+                                   'available, otherwise the temporary directory]')
+    bench_parser.add_argument('--durability', default=durability.STRICT,
+                              choices=durability.POLICIES,
+                              help='when to sync files to the disk [default: %(default)s]')
+    bench_parser.add_argument('-b', '--only', action='append', metavar='BENCHMARK',
+                              help='run only this benchmark; may be repeated')
+    bench_parser.add_argument('-o', '--output', default='-', metavar='FILE',
+                              help="file to write the results to, or '-' for the "
+                                   "standard output [default: %(default)s]")
+    bench_parser.add_argument('-v', '--verbose', action='store_true',
+                              help='show verbose messages [default: %(default)s]')
+    bench_parser.set_defaults(func=_bench)
+
+
+def _add_batch_arguments(batch_parser):
+    """add the options of the 'batch' sub-command
+
+    Args:
+        batch_parser (obj): sub-parser of the 'batch' sub-command
+
+    Returns:
+        None
+
+    """
+    from skelpy.utils import durability, dedup
+
+    batch_parser.description = ('Create many projects in a single process. '
+                                'MANIFEST holds one JSON object per line with '
+                                "the options of the 'template' sub-command and "
+                                'the project information, e.g., '
+                                '{"projectName": "foo", "format": "src", '
+                                '"description": "...", "license": "MIT"}')
+    batch_parser.add_argument('manifest', metavar='MANIFEST',
+                              help="manifest file to read, or '-' for the standard input")
+    batch_parser.add_argument('--durability', choices=durability.POLICIES,
+                              help='durability policy for projects that do not specify one '
+                                   '[default: {}]'.format(durability.STRICT))
+    batch_parser.add_argument('--dedup', choices=dedup.MODES,
+                              help='materialize files identical across the projects as '
+                                   'hard links or reflinks, in each worker process')
+    batch_parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                              help='number of worker processes [default: %(default)s]')
+    _add_trace_arguments(batch_parser)
+    batch_parser.add_argument('-v', '--verbose', action='store_true',
+                              help='show verbose messages [default: %(default)s]')
+    batch_parser.set_defaults(func=_batch)
+
+
+def _add_update_arguments(update_parser):
+    """add the options of the 'update' sub-command
+
+    Args:
+        update_parser (obj): sub-parser of the 'update' sub-command
+
+    Returns:
+        None
+
+    """
+    from skelpy.utils import durability
+
+    update_parser.description = ('Render again the files of a project whose templates '
+                                 'or values have changed since the project was '
+                                 'generated, as recorded in .skelpy/manifest.json. '
+                                 'Files modified since generated are left alone.')
+    update_parser.add_argument('projectDir', metavar='ProjectDir', nargs='?',
+                               default='.', help='project directory [default: %(default)s]')
+    update_parser.add_argument('-f', '--force', action='store_true',
+                               help='overwrite files modified since generated as well '
+                                    '[default: %(default)s]')
+    update_parser.add_argument('--durability', default=durability.STRICT,
+                               choices=durability.POLICIES,
+                               help='when to sync files to the disk [default: %(default)s]')
+    _add_trace_arguments(update_parser)
+    update_parser.add_argument('-v', '--verbose', action='store_true',
+                               help='show verbose messages [default: %(default)s]')
+    update_parser.set_defaults(func=_update)
+
+
+def _add_serve_arguments(serve_parser):
+    """add the options of the 'serve' sub-command
+
+    Args:
+        serve_parser (obj): sub-parser of the 'serve' sub-command
+
+    Returns:
+        None
+
+    """
+    serve_parser.description = ('Serve generation requests over a Unix socket. '
+                                'While the server is running, skelpy forwards '
+                                'its invocations to it if the environment '
+                                'variable SKELPY_SOCKET names the socket.')
+    serve_parser.add_argument('-s', '--socket', required=True, metavar='PATH',
+                              help='path of the Unix socket to listen on')
+    serve_parser.add_argument('-v', '--verbose', action='store_true',
+                              help='show verbose messages [default: %(default)s]')
+    serve_parser.set_defaults(func=_serve)
+
+
+#: sub-commands: (name, prog, function adding the options)
+_SUB_COMMANDS = (('template', 'skelpy', _add_template_arguments),
+                 ('license', 'skelpy license', _add_license_arguments),
+                 ('bench', 'skelpy bench', _add_bench_arguments),
+                 ('batch', 'skelpy batch', _add_batch_arguments),
+                 ('update', 'skelpy update', _add_update_arguments),
+                 ('serve', 'skelpy serve', _add_serve_arguments))
+
+
+def _find_sub_command(argv):
+    """find the sub-command of the command line the same way as
+    :class:`DefaultSubcommandArgParser` does
+
+    Args:
+        argv (list): command-line arguments
+
+    Returns:
+        str: name of the sub-command, 'template' if none is given
+
+    """
+    names = set(name for name, _, _ in _SUB_COMMANDS)
+    for arg in argv:
+        if arg in names:
+            return arg
+
+    return 'template'
+
+
+def _setup_arg_parser(command=None):
+    """Setup command-line option parser
+
+    All sub-parsers are registered, but only the options of *command* are added
+    up front. The options of the others are added on demand, i.e., by
+    ``parser.sub_parser(name)`` or when the combined usage message is needed.
+
+    Args:
+        command (str): sub-command to parse. If None, the options of all
+            sub-commands are added.
+
+    Returns:
+        :class:`DefaultSubcommandArgParser`: command-line option parser
+
+    """
+    from skelpy.utils.defaultsubparse import DefaultSubcommandArgParser
+
+    parser = DefaultSubcommandArgParser(prog='skelpy')
+    subparsers = parser.add_subparsers(title='sub-command')
+
+    #: setting 'prog' prevents showing subparser's name in the usage output
+    sub_parsers = []
+    pending = {}
+    for name, prog, add_arguments in _SUB_COMMANDS:
+        sub_parsers.append(subparsers.add_parser(name, prog=prog))
+        pending[name] = add_arguments
+
+    def sub_parser(name):
+        """get the sub-parser of a sub-command, with its options added"""
+
+        index = [n for n, _, _ in _SUB_COMMANDS].index(name)
+        add_arguments = pending.pop(name, None)
+        if add_arguments:
+            add_arguments(sub_parsers[index])
+        return sub_parsers[index]
+
+    main_parser = sub_parsers[0]
+    combined = []
+
+    def combine_usage(format_message):
+        """wrap *format_message* to combine usage messages of all the sub-parsers first"""
+
+        def wrapper():
+            if not combined:
+                combined.append(True)
+                for name, _, _ in _SUB_COMMANDS:
+                    sub_parser(name)
+                main_parser.usage = parser.combine_usage(sub_parsers)
+            return format_message()
+        return wrapper
+
+    for name, _, _ in _SUB_COMMANDS:
+        if command in (None, name):
+            sub_parser(name)
+
     #: set the default sub-parser to main_parser
     parser.set_default_subparser('template')
-    #: combine usage messages of main_parser and lic_parser
-    main_parser.usage = parser.combine_usage([main_parser, lic_parser])
     #: replace the top-most parser's usage and help messages for main sub-parser's
+    main_parser.format_usage = combine_usage(main_parser.format_usage)
+    main_parser.format_help = combine_usage(main_parser.format_help)
     parser.format_usage = main_parser.format_usage
     parser.format_help = main_parser.format_help
     #: for easy reference to sub-parsers
-    parser.main_parser = main_parser
-    parser.lic_parser = lic_parser
+    parser.sub_parser = sub_parser
+    (parser.main_parser, parser.lic_parser, parser.bench_parser, parser.batch_parser,
+     parser.update_parser, parser.serve_parser) = sub_parsers
 
     return parser
 
@@ -81,16 +382,14 @@ def _setup_logger():
         none
 
     """
-    FORMAT = '%(asctime)-s %(message)s'
-    logging.basicConfig(format=FORMAT, level=logging.INFO)
+    import logging
+
+    logging.basicConfig(format=LOG_FORMAT, level=logging.INFO)
 
 
 def _parse_projectName(projectName):
     """parse :attr:`projectName` to get sheer projectName and projectDir
 
-    After parsing, this method updates ``projectDir`` and ``projectName`` values
-    in :attr:`settings`
-
     Args:
         projectName (str): project name the user input, possibly contains path
 
@@ -104,6 +403,8 @@ def _parse_projectName(projectName):
                ``os.path.split(projectDir)[-1] == projectName``
 
     """
+    from skelpy.utils import helpers
+
     root = helpers.root_path()
 
     if not projectName:
@@ -140,6 +441,92 @@ def _skel(opts, parser):
         bool
 
     """
+    from skelpy.utils.report import Report
+
+    if not _collect_info(opts):
+        return False
+
+    report = Report()
+    if not _generate_project(opts, report):
+        return False
+
+    _message_stream(opts).write("[skelpy] files: {}\n".format(report.summary()))
+    return True
+
+
+def _collect_info(opts):
+    """gather the project information given without the editor
+
+    The information is taken from, in order of precedence, the command-line
+    options, the file given by ``--info`` and the environment variables--see
+    :data:`INFO_ENV_PREFIX`. If any is given, the project is generated in
+    the quiet mode, i.e., neither the temporary file nor the editor is used.
+
+    Args:
+        opts (dict): options of the 'template' sub-command, updated in place
+
+    Returns:
+        bool: False if the ``--info`` file can not be read, True otherwise
+
+    """
+    info = {}
+    for field in INFO_FIELDS:
+        value = os.environ.get(INFO_ENV_PREFIX + field.upper())
+        if value:
+            info[field] = value
+
+    infoFile = opts.pop('info', None)
+    if infoFile:
+        from skelpy.utils.helpers import read_info_file
+
+        file_info = read_info_file(infoFile)
+        if file_info is None:
+            sys.stderr.write("[skelpy] Invalid info file: '{}'\n".format(infoFile))
+            return False
+        info.update(file_info)
+
+    given = bool(info) or any(field in opts for field in INFO_FIELDS)
+    for key, value in info.items():
+        opts.setdefault(key, value)
+    if given:
+        opts['quiet'] = True
+
+    return True
+
+
+def _message_stream(opts):
+    """get the stream for messages to the user
+
+    Args:
+        opts (dict): parsed arguments
+
+    Returns:
+        file: the standard error if the project is streamed to the standard
+        output, the standard output otherwise
+
+    """
+    return sys.stderr if opts.get('output') == '-' else sys.stdout
+
+
+def _generate_project(opts, report=None, manifest=None):
+    """create a project with the options given
+
+    This function is shared by the 'template' and the 'batch' sub-commands.
+
+    Args:
+        opts (dict): options of the 'template' sub-command, possibly with
+            project information such as ``description`` or ``license``
+        report (:class:`skelpy.utils.report.Report`): where the outcome of each
+            file is recorded. A new one if not given.
+        manifest (:class:`skelpy.utils.manifest.Manifest`): manifest of the
+            project. Read from the project directory if not given.
+
+    Returns:
+        bool
+
+    """
+    from skelpy.makers import Settings, get_maker
+
     projectDir, projectName = _parse_projectName(opts['projectName'])
     if not projectName:
         sys.stderr.write(
@@ -148,16 +535,302 @@ def _skel(opts, parser):
 
     opts['projectDir'] = projectDir
     opts['projectName'] = projectName
-    settings.update(opts)
+    settings = Settings(opts)
+    if report is not None:
+        settings.report = report
+    settings.manifest = manifest
 
     maker_cls = get_maker('project')
     if not maker_cls:
         return False
 
-    maker = maker_cls(**settings)
-    if not maker.generate():
+    if opts.get('output'):
+        from skelpy.utils.backends import open_backend
+        try:
+            settings.backend = open_backend(opts['output'], os.path.dirname(projectDir))
+        except (ValueError, IOError, OSError) as e:
+            sys.stderr.write("[skelpy] Invalid output: {}\n".format(e))
+            return False
+
+    maker = maker_cls.from_settings(settings)
+    try:
+        if not maker.generate():
+            return False
+    finally:
+        settings.backend.close()
+
+    return True
+
+
+def _read_manifest(manifest):
+    """read project specs from a manifest one line at a time
+
+    Blank lines and lines starting with '#' are ignored.
+
+    Args:
+        manifest (str): path of the manifest file, or '-' for the standard input
+
+    Yields:
+        tuple: (line number, spec dict or None if the line is not a valid spec)
+
+    """
+    import json
+
+    f = sys.stdin if manifest == '-' else open(manifest, 'r')
+    try:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                spec = json.loads(line)
+            except ValueError:
+                spec = None
+            if not isinstance(spec, dict) or not spec.get('projectName'):
+                spec = None
+            yield lineno, spec
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _warm_up(verbose=True):
+    """prepare a process for generating projects
+
+    Imports all *Maker* modules, loads all templates into the template cache,
+    detects external commands and resolves the user's identity. When run
+    before forking worker processes, the workers share the results
+    copy-on-write.
+
+    Args:
+        verbose (bool): if False, logging is disabled in this process
+
+    Returns:
+        None
+
+    """
+    import logging
+    from pkgutil import iter_modules
+    import skelpy.makers
+    from skelpy.makers import get_maker
+    from skelpy.templates import preload
+    from skelpy.utils import helpers
+
+    if not verbose:
+        logging.disable(logging.CRITICAL)
+
+    for _, mod_name, _ in iter_modules(skelpy.makers.__path__):
+        get_maker(mod_name)
+    preload()
+    helpers.has_command('git')
+    helpers.get_email()
+
+
+def _run_batch_task(task):
+    """create a project out of a batch task
+
+    This function runs either in the current process or in a worker process
+    of :func:`_imap_pool`. Every project gets its own :class:`Settings`,
+    so nothing leaks from one project to another.
+
+    Args:
+        task (tuple): (line number, options or None if the spec is invalid)
+
+    Returns:
+        tuple: (line number, project name or None, error message or None)
+
+    """
+    lineno, opts = task
+    if opts is None:
+        return lineno, None, 'Invalid project spec'
+
+    projectName = opts['projectName']
+    error = None
+    try:
+        if not _generate_project(opts):
+            error = 'Failed to create project'
+    except Exception as e:
+        error = repr(e)
+
+    return lineno, projectName, error
+
+
+def _imap_pool(tasks, jobs, verbose):
+    """run batch tasks across a pool of worker processes
+
+    At most a limited number of tasks are in flight at a time, so the memory use
+    stays bounded however many tasks there are. A new task is handed to the pool
+    as soon as a result comes back, so the workers never wait for each other.
+    Where available, workers are forked after :func:`_warm_up` has run in
+    the parent process.
+
+    Args:
+        tasks (iterable): batch tasks, see :func:`_run_batch_task`
+        jobs (int): number of worker processes
+        verbose (bool): whether workers log verbose messages
+
+    Yields:
+        tuple: results of :func:`_run_batch_task` in the order of completion
+
+    """
+    import threading
+    import multiprocessing
+
+    _warm_up(verbose)
+
+    try:
+        context = multiprocessing.get_context('fork')
+    except (AttributeError, ValueError):  # python 2.7, Windows
+        context = multiprocessing
+
+    chunksize = 4
+    in_flight = threading.Semaphore(jobs * chunksize * 4)
+    stopped = threading.Event()
+
+    def _feed():
+        #: runs in the task handler thread of the pool
+        for task in tasks:
+            in_flight.acquire()
+            if stopped.is_set():
+                return
+            yield task
+
+    pool = context.Pool(jobs, initializer=_warm_up, initargs=(verbose,))
+    try:
+        for result in pool.imap_unordered(_run_batch_task, _feed(), chunksize):
+            in_flight.release()
+            yield result
+        pool.close()
+    except BaseException:
+        #: unblock the feeder so that the pool can be terminated
+        stopped.set()
+        in_flight.release()
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+def _batch(opts, parser):
+    """create projects listed in a manifest file in a single process
+
+    Each line of the manifest is read, turned into a project and thrown away,
+    so the memory use does not grow with the size of the manifest.
+    Templates, the user's identity and the detection of external commands
+    are shared across the whole batch.
+
+    With ``-j/--jobs N``, projects are spread across *N* worker processes.
+    The results of all workers are gathered into one summary.
+
+    Projects are always created in the quiet mode, i.e., without
+    the editor round-trip. Project information such as ``description``
+    or ``license`` can be given in the spec instead.
+
+    Args:
+        opts (dict): arguments passed from command line, i.e, sys.argv[1:]
+        |FYI, sub-command is not passed
+        parser (obj): instance of :class:`DefaultSubcommandArgParser` class
+
+    Returns:
+        bool: True if all projects are successfully created, False otherwise
+
+    """
+    from skelpy.utils import helpers
+
+    if opts['jobs'] < 1:
+        parser.batch_parser.error("'-j/--jobs' must be a positive integer.")
+        return False
+
+    defaults = vars(parser.sub_parser('template').parse_args([]))
+    for key in ('func', 'verbose', 'trace', 'timings'):
+        defaults.pop(key)
+    #: resolved once for the whole batch
+    defaults['author'] = helpers.get_userName()
+    defaults['author_email'] = helpers.get_email()
+    defaults['quiet'] = True
+    if opts['durability']:
+        defaults['durability'] = opts['durability']
+    if opts['dedup']:
+        defaults['dedup'] = opts['dedup']
+
+    def _tasks():
+        for lineno, spec in _read_manifest(opts['manifest']):
+            if spec is None:
+                yield lineno, None
+                continue
+            project_opts = dict(defaults)
+            project_opts.update(spec)
+            project_opts['quiet'] = True
+            yield lineno, project_opts
+
+    if opts['jobs'] > 1:
+        results = _imap_pool(_tasks(), opts['jobs'], opts.get('verbose', False))
+    else:
+        results = (_run_batch_task(task) for task in _tasks())
+
+    succeeded = 0
+    failures = []
+    try:
+        for lineno, projectName, error in results:
+            if error:
+                failures.append((lineno, projectName, error))
+            else:
+                succeeded += 1
+    except (IOError, OSError) as e:
+        sys.stderr.write("[skelpy] " + repr(e) + "\n")
+        return False
+
+    sys.stdout.write(
+        "[skelpy] batch: {} succeeded, {} failed\n".format(succeeded, len(failures)))
+    for lineno, projectName, error in sorted(failures):
+        if projectName:
+            sys.stderr.write(
+                "[skelpy] line {}: '{}': {}\n".format(lineno, projectName, error))
+        else:
+            sys.stderr.write("[skelpy] line {}: {}\n".format(lineno, error))
+
+    return not failures
+
+
+def _update(opts, parser):
+    """render again the files of a project whose templates or values have changed
+
+    The project is generated again with the values and the options recorded
+    in its manifest--see :mod:`skelpy.utils.manifest`--, but only the files
+    whose templates or values have changed are rendered and written.
+
+    Args:
+        opts (dict): arguments passed from command line, i.e, sys.argv[1:]
+        |FYI, sub-command is not passed
+        parser (obj): instance of :class:`DefaultSubcommandArgParser` class
+
+    Returns:
+        bool
+
+    """
+    from skelpy.utils.manifest import Manifest
+    from skelpy.utils.report import Report
+
+    projectDir = os.path.abspath(opts['projectDir'])
+    manifest = Manifest.load(projectDir)
+    if manifest is None:
+        sys.stderr.write("[skelpy] No manifest found: '{}'\n".format(projectDir))
+        return False
+    manifest.updating = True
+    manifest.keep_modified = not opts['force']
+
+    project_opts = vars(parser.sub_parser('template').parse_args([]))
+    for key in ('func', 'verbose', 'trace', 'timings'):
+        project_opts.pop(key)
+    project_opts.update(manifest.settings)
+    project_opts.update({'projectName': projectDir, 'quiet': True, 'merge': True,
+                         'force': True, 'durability': opts['durability']})
+
+    report = Report()
+    if not _generate_project(project_opts, report, manifest):
         return False
 
+    sys.stdout.write("[skelpy] files: {}\n".format(report.summary()))
     return True
 
 
@@ -181,26 +854,162 @@ def _license(opts, parser):
             "Either '-l/--list' option or 'LICENSE' argument is required.")
         return False
 
+    from skelpy.makers import get_maker
+
     maker_cls = get_maker('license_change')
     if not maker_cls:
         sys.stderr.write(
             "[skelpy] Maker module not found: 'license_change.py'\n")
         return False
 
-    maker = maker_cls(**opts)
-    return maker.generate()
+    maker = maker_cls(list_option=opts.get('list'),
+                      license=opts.get('license') or maker_cls.default_license)
+    try:
+        return maker.generate()
+    finally:
+        maker.settings.sync_queue.sync()
+
+
+def _bench(opts, parser):
+    """run the benchmark suite and write the results as JSON
+
+    See :mod:`skelpy.bench`.
+
+    Args:
+        opts (dict): arguments passed from command line, i.e, sys.argv[1:]
+        |FYI, sub-command is not passed
+        parser (obj): instance of :class:`DefaultSubcommandArgParser` class
+
+    Returns:
+        bool
+
+    """
+    import json
+    from skelpy import bench
+
+    if opts['number'] < 1 or opts['repeat'] < 1:
+        parser.bench_parser.error("'-n/--number' and '-r/--repeat' must be positive integers.")
+        return False
+
+    try:
+        results = bench.run(opts['number'], opts['repeat'], opts['dir'],
+                            opts['durability'], opts['only'])
+    except (ValueError, RuntimeError, IOError, OSError) as e:
+        sys.stderr.write("[skelpy] " + repr(e) + "\n")
+        return False
+
+    text = json.dumps(results, indent=2, sort_keys=True) + '\n'
+    if opts['output'] == '-':
+        sys.stdout.write(text)
+    else:
+        with open(opts['output'], 'w') as f:
+            f.write(text)
+
+    return True
+
+
+def _serve(opts, parser):
+    """run the *skelpy* server until interrupted
+
+    Args:
+        opts (dict): arguments passed from command line, i.e, sys.argv[1:]
+        |FYI, sub-command is not passed
+        parser (obj): instance of :class:`DefaultSubcommandArgParser` class
+
+    Returns:
+        bool
+
+    """
+    try:
+        from skelpy.server import serve
+    except SyntaxError:  # python 2
+        sys.stderr.write("[skelpy] 'serve' requires python 3.5+\n")
+        return False
+
+    return serve(opts['socket'])
+
+
+def _execute(opts, parser):
+    """run the front-end function of a sub-command
+
+    Args:
+        opts (dict): parsed arguments, including ``func`` and ``verbose``
+        parser (obj): instance of :class:`DefaultSubcommandArgParser` class
+
+    Returns:
+        int: exit status
+
+    """
+    #: left in *opts* for the worker processes of the 'batch' sub-command
+    if not opts['verbose']:
+        import logging
+        logging.disable(logging.CRITICAL)
+
+    trace = opts.pop('trace', None)
+    timings = opts.pop('timings', False)
+    if trace or timings:
+        from skelpy.utils.trace import tracer
+        tracer.clear()
+        tracer.enabled = True
+
+    func = opts.pop('func')
+    try:
+        ok = func(opts, parser)
+    finally:
+        if trace or timings:
+            tracer.enabled = False
+            _report_trace(tracer, trace, timings, _message_stream(opts))
+
+    if ok:
+        _message_stream(opts).write('Successfully done.\n')
+        return 0
+    else:
+        _message_stream(opts).write('Failed.\n')
+        #: never into the standard output, which may carry an archive
+        parser.print_usage(sys.stderr)
+        return 1
+
+
+def _report_trace(tracer, trace, timings, stream):
+    """export and/or summarize the spans recorded
+
+    Args:
+        tracer (:class:`skelpy.utils.trace.Tracer`): the tracer
+        trace (str): path of the trace file to write, if any
+        timings (bool): whether to print the summary
+        stream (file): where the summary and messages go
+
+    Returns:
+        None
+
+    """
+    if trace:
+        try:
+            count = tracer.export(trace)
+            stream.write("[skelpy] trace: {} spans written to '{}'\n".format(count, trace))
+        except (IOError, OSError) as e:
+            sys.stderr.write("[skelpy] Failed to write the trace: " + repr(e) + "\n")
+    if timings:
+        stream.write(tracer.summary() + '\n')
 
 
 def run(argv=None):
     """driver to run ``skelpy``
 
-    """
-    _setup_logger()
+    If a *skelpy* server is running--see :mod:`skelpy.client`--, the
+    invocation is forwarded to the server.
 
+    """
     if argv is None:
         argv = sys.argv[1:]
+
+    from skelpy.client import forward
+    status = forward(argv)
+    if status is not None:
+        return status
+
     try:
-        parser = _setup_arg_parser()
+        parser = _setup_arg_parser(_find_sub_command(argv))
         opts = vars(parser.parse_args(argv))
 
     except Exception as e:
@@ -208,18 +1017,8 @@ def run(argv=None):
         sys.stderr.write("For help, use --help\n")
         return 2
 
-    # MAIN BODY #
-    if not opts.pop('verbose'):
-        logging.disable(logging.CRITICAL)
-
-    func = opts.pop('func')
-    if func(opts, parser):
-        sys.stdout.write('Successfully done.\n')
-        return 0
-    else:
-        sys.stdout.write('Failed.\n')
-        parser.print_usage()
-        return 1
+    _setup_logger()
+    return _execute(opts, parser)
 
 
 if __name__ == "__main__":
@@ -4,20 +4,230 @@
 """Collection of *Maker* modules
 
 A *Maker* is a class that generates a template.
-This package also provides a package-level attribute(dict) and a function:
-``settings`` and ``get_maker()``.
+This package also provides package-level classes and a function:
+:class:`Settings`, :class:`Lazy` and ``get_maker()``.
 
-Attributes:
-    settings: container(dict) for sharing data across *Makers*
+Every generation--i.e., every project--gets its own :class:`Settings`
+instance, which is passed to all the *Makers* taking part in the generation.
+Hence, many projects can be generated at the same time, e.g., in threads,
+without sharing any state.
 
 """
 
 from __future__ import absolute_import, print_function
 
 import sys
+import copy
+import threading
 from importlib import import_module
 
-settings = {}
+from skelpy.utils.durability import SyncQueue
+from skelpy.utils.report import Report
+from skelpy.utils.backends import filesystem
+
+try:
+    from collections.abc import MutableMapping  # python 3
+except ImportError:
+    from collections import MutableMapping  # python 2
+
+
+class Lazy(object):
+    """value computed on its first use
+
+    A :class:`Settings` layer may hold ``Lazy`` values for those which are
+    costly to compute, e.g., the user's identity. The value is computed
+    when it is first looked up--typically, when a template refers to it--and
+    memoized.
+
+    Args:
+        func (callable): function computing the value
+        args: positional arguments to pass to *func*
+        kwargs: keyword arguments to pass to *func*
+
+    """
+    def __init__(self, func, *args, **kwargs):
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self.evaluated = False
+        self._value = None
+
+    def get(self):
+        """compute the value, if not yet, and return it"""
+
+        with self._lock:
+            if not self.evaluated:
+                self._value = self._func(*self._args, **self._kwargs)
+                self.evaluated = True
+                self._func = self._args = self._kwargs = None
+
+        return self._value
+
+    def __repr__(self):
+        if self.evaluated:
+            return 'Lazy({!r})'.format(self._value)
+        return 'Lazy(<pending>)'
+
+
+class Settings(MutableMapping):
+    """container for sharing data across *Makers* during a generation
+
+    ``Settings`` works like :class:`collections.ChainMap`. It is a chain
+    of layers--dictionaries--which are searched from the top down.
+    Writes go to the top-most layer.
+
+    A generation typically stacks the layers below, from the bottom up::
+
+        * defaults, e.g., version, license
+        * command-line options, e.g., projectName, format
+        * user info, e.g., author, description
+        * one layer per *Maker*, e.g., docsDir, packageDir
+
+    Values may be :class:`Lazy`, which are computed on their first lookup.
+
+    .. note::
+
+        Layers are added by rebinding :attr:`maps` instead of mutating it
+        in place, so adding a layer never disturbs a lookup running in
+        another thread.
+
+    Args:
+        maps (dict): initial layers, from the top down
+
+    Attributes:
+        maps (list): layers, from the top down
+        sync_queue (:class:`SyncQueue`): files and directories to sync at the
+            end of the generation under the ``batch`` durability policy
+        journal (:class:`skelpy.utils.journal.Journal`): journal of the changes
+            the generation makes, or None if the generation is not journaled
+        staging (tuple): (project directory, staging directory) if the project
+            is being rendered into a staging directory, otherwise None
+        report (:class:`skelpy.utils.report.Report`): what happened to the files
+            written in the generation
+        manifest (:class:`skelpy.utils.manifest.Manifest`): manifest of the
+            project, or None if not recorded
+        backend (:class:`skelpy.utils.backends.Backend`): where the directories
+            and files are created. The local file system by default.
+
+    """
+    def __init__(self, *maps):
+        self.maps = list(maps) or [{}]
+        self.sync_queue = SyncQueue()
+        self.journal = None
+        self.staging = None
+        self.report = Report()
+        self.manifest = None
+        self.backend = filesystem
+
+    def __getitem__(self, key):
+        for mapping in self.maps:
+            if key in mapping:
+                value = mapping[key]
+                return value.get() if isinstance(value, Lazy) else value
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self.maps[0][key] = value
+
+    def __delitem__(self, key):
+        del self.maps[0][key]
+
+    def __contains__(self, key):
+        return any(key in mapping for mapping in self.maps)
+
+    def __iter__(self):
+        seen = set()
+        for mapping in self.maps:
+            for key in mapping:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self):
+        return len(set().union(*self.maps))
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__,
+                               ', '.join(map(repr, self.maps)))
+
+    def resolve(self, keys):
+        """look up only the given keys
+
+        Args:
+            keys (iterable): keys to look up, e.g., the placeholders of a template
+
+        Returns:
+            dict: values of the keys in :class:`Settings`. Keys not found are left out.
+
+        """
+        return dict((key, self[key]) for key in keys if key in self)
+
+    def eager(self):
+        """get the values which do not need computing
+
+        Returns:
+            dict: all the values but :class:`Lazy` ones not computed yet
+
+        """
+        values = {}
+        for mapping in reversed(self.maps):
+            for key, value in mapping.items():
+                if not isinstance(value, Lazy):
+                    values[key] = value
+                elif value.evaluated:
+                    values[key] = value.get()
+                else:
+                    values.pop(key, None)
+
+        return values
+
+    def push(self, layer=None):
+        """add a layer on the top
+
+        Args:
+            layer (dict): layer to add. A new empty dict if not given.
+
+        Returns:
+            dict: the layer added
+
+        """
+        layer = {} if layer is None else layer
+        self.maps = [layer] + self.maps
+        return layer
+
+    def new_child(self, layer=None):
+        """create a private view with a new layer on the top
+
+        Writes to the child go to the new layer and are not seen by this
+        :class:`Settings`. Layers added to this :class:`Settings` later are
+        not seen by the child either. Other state, e.g., :attr:`sync_queue`,
+        :attr:`journal`, :attr:`staging`, :attr:`report`, :attr:`manifest` and
+        :attr:`backend`, is shared.
+
+        Args:
+            layer (dict): layer to add. A new empty dict if not given.
+
+        Returns:
+            :class:`Settings`: the child
+
+        """
+        child = copy.copy(self)
+        child.maps = [{} if layer is None else layer] + self.maps
+        return child
+
+    def add_defaults(self, layer):
+        """add a layer at the bottom, i.e., below all the other layers
+
+        Args:
+            layer (dict): layer to add
+
+        Returns:
+            dict: the layer added
+
+        """
+        self.maps = self.maps + [layer]
+        return layer
 
 
 def get_maker(mod_name):
@@ -9,10 +9,16 @@ import os
 import logging
 from abc import ABCMeta, abstractmethod
 
+from skelpy.utils import durability, report
+from skelpy.utils.dedup import dedup_index
 from skelpy.utils.helpers import add_metaclass
 from skelpy.utils.logger import Logger
-from skelpy.templates import get_template
-from . import settings
+from skelpy.templates import get_template, placeholders
+from skelpy.utils.trace import traced
+from . import Settings
+
+#: methods of *Makers* traced, to the index of the argument holding the path
+TRACED_METHODS = {'generate': None, 'create_dir': 1, 'write_file': 2}
 
 
 class MakerMeta(ABCMeta):
@@ -24,6 +30,10 @@ class MakerMeta(ABCMeta):
     with extra works of calling :func:`_export` and :func:`_get_logger`
     functions when they are first imported.
 
+    The methods in :data:`TRACED_METHODS` the class defines are wrapped to
+    record a span per call, e.g., ``DocMaker.write_file``, while tracing is
+    enabled. See :mod:`skelpy.utils.trace`.
+
     Args:
         className (str): class name
         superClasses (:obj:`class`): parent classes
@@ -34,14 +44,44 @@ class MakerMeta(ABCMeta):
         super(MakerMeta, cls).__init__(className, superClasses, attrDict)
         cls._export()
         cls._get_logger()
+        cls._trace_methods(attrDict)
+
+    def _trace_methods(cls, attrDict):
+        """wrap the methods to trace the class defines"""
+
+        for method, arg in TRACED_METHODS.items():
+            func = attrDict.get(method)
+            if func is None or getattr(func, '__isabstractmethod__', False):
+                continue
+            setattr(cls, method, traced(method, arg=arg, method=True)(func))
 
 
 @add_metaclass(MakerMeta)
 class BaseMaker(object):
-    """Abstract class for *Maker* classes"""
+    """Abstract class for *Maker* classes
+
+    Args:
+        settings (:class:`Settings`): settings of the generation the *Maker*
+            takes part in. A new, empty :class:`Settings` if not given.
+
+    """
+
+    def __init__(self, settings=None):
+        self.settings = Settings() if settings is None else settings
+
+    @classmethod
+    def from_settings(cls, settings):
+        """create a *Maker* taking its arguments from *settings*
+
+        Args:
+            settings (:class:`Settings`): settings of the generation
+
+        Returns:
+            an instance of the *Maker* class
 
-    def __init__(self):
-        pass
+        """
+        #: :class:`Lazy` values are left to be computed when a template needs them
+        return cls(settings=settings, **settings.eager())
 
     @classmethod
     def _export(cls):
@@ -85,11 +125,45 @@ class BaseMaker(object):
 
         cls.logger = Logger(logging.getLogger('skelpy'), {'maker': cls.__name__})
 
+    def staged_path(self, path):
+        """get the path where a file of the project is actually created
+
+        While the project is rendered into a staging directory--see
+        :attr:`Settings.staging`--, paths in the project directory are
+        redirected into the staging directory. Other paths are returned as is.
+
+        Args:
+            path (str): path of a file or a directory
+
+        Returns:
+            str: the path redirected, or *path* itself
+
+        """
+        staging = self.settings.staging
+        if staging:
+            projectDir, stagingDir = staging
+            abspath = os.path.abspath(path)
+            if abspath == projectDir or abspath.startswith(projectDir + os.sep):
+                return stagingDir + abspath[len(projectDir):]
+
+        return path
+
     def create_dir(self, target_dir, recursive=False):
         """create a directory
 
+        The directory is created through :attr:`Settings.backend`--see
+        :mod:`skelpy.utils.backends`--, the local file system by default.
         The default mode is 0777 (octal). If the directory to create exists,
-        this method does nothing.
+        this method does nothing. Under the ``batch`` durability policy, the new
+        directory is queued to be synced at the end of the generation.
+
+        If :attr:`Settings.journal` is set, the new directory is recorded in it.
+        A directory the journal already owns, i.e., created by an interrupted
+        generation being resumed, is taken as newly created.
+
+        In the staging directory--see :meth:`staged_path`--, the directory is
+        created without checking if it exists, since the staging directory
+        starts out empty.
 
         Args:
             target_dir (str): directory path to create
@@ -105,9 +179,24 @@ class BaseMaker(object):
             OSError(python 2.7) or PermissionError(python 3.x)
 
         """
-        cmd = os.makedirs if recursive else os.mkdir
-            
-        if os.path.exists(target_dir):
+        backend = self.settings.backend
+        journal = self.settings.journal
+        path = self.staged_path(target_dir)
+        batch = backend.local and self.settings.get('durability') == durability.BATCH
+
+        if path != target_dir:
+            backend.mkdir(path, recursive)
+            if batch:
+                self.settings.sync_queue.add_dir(path)
+            self.logger.info("created directory: '{}'".format(target_dir))
+            return 1
+
+        if backend.exists(target_dir):
+            if journal and journal.owns(target_dir):
+                #: created by the interrupted generation being resumed
+                self.logger.info("directory resumed: '{}'".format(target_dir))
+                return 1
+
             self.logger.info("directory exists: '{}'".format(target_dir))
 
             if self.merge:
@@ -120,7 +209,18 @@ class BaseMaker(object):
                     "try -m/--merge option.")
                 return 0
 
-        cmd(target_dir, 0o755)
+        if journal:
+            #: the top-most directory to create, recorded in the journal
+            top = os.path.abspath(target_dir)
+            while not os.path.exists(os.path.dirname(top)) and \
+                    os.path.dirname(top) != top:
+                top = os.path.dirname(top)
+
+        backend.mkdir(target_dir, recursive)
+        if journal:
+            journal.created_dir(top)
+        if batch:
+            self.settings.sync_queue.add_dir(target_dir)
         self.logger.info("created directory: '{}'".format(target_dir))
 
         return 1
@@ -129,20 +229,53 @@ class BaseMaker(object):
         """create a file based on the given *template*.
 
         *template* could be a string(template-file-name) or
-        an instance of :class:`string.Template`.
+        an instance of :class:`string.Template`. Template names are
+        resolved through the process-wide template cache,
+        i.e., :func:`skelpy.templates.get_template`.
         If the file to create exists already, the behavior of this method
         depends on the ``--force`` option. If ``force`` option is True,
         the new file will overwrite the existing file. Otherwise,
         it does noting.
 
         Before writing the file, this method performs
-        :meth:`string.Template.safe_substitute` with values in :attr:`makers.settings`.
+        :meth:`string.Template.safe_substitute` with values in :attr:`settings`.
+        Only the values the template refers to are looked up, so :class:`Lazy`
+        values no template needs are never computed.
 
         .. note::
 
             Functions in ``post_jobs`` list are run after ``safe_substitute()``
             and before writing the final target_file.
 
+        The file is written through :attr:`Settings.backend`--see
+        :mod:`skelpy.utils.backends`--, the local file system by default.
+        On the file system, unless ``atomic`` is False in :attr:`settings`,
+        the file is written atomically, i.e., into a temporary file which then
+        replaces the target file. See :func:`skelpy.utils.durability.atomic_write`.
+
+        How the file is synced to the disk depends on the ``durability`` value
+        in :attr:`settings`: ``strict``(default) syncs the file right away,
+        ``batch`` queues it to be synced at the end of the generation and
+        ``none`` does not sync at all. Under ``strict``, the directory holding
+        an atomically written file is queued to be synced at the end of the
+        generation, so each directory is synced only once.
+
+        If :attr:`Settings.journal` is set, the file--and its pre-image if it
+        exists--is recorded in it before being written. Files the journal
+        already owns are overwritten without ``--force``, and those already
+        written with the same content by an interrupted generation are not
+        written again. In the staging directory--see :meth:`staged_path`--,
+        the file is written neither checking if it exists nor atomically.
+
+        An existing file already holding the content to write is left alone,
+        i.e., neither written nor synced. Whatever happens to the file is
+        recorded in :attr:`Settings.report`.
+
+        If :attr:`Settings.manifest` is set, the file is recorded in it.
+        While updating--see :mod:`skelpy.utils.manifest`--, an existing file
+        is not rendered at all if neither its template nor the values have
+        changed, and is left alone if modified since it was generated.
+
         Args:
             template (:obj:`string.Template` or str): :obj:`string.Template` object
                 or the name of a template file.
@@ -161,7 +294,12 @@ class BaseMaker(object):
                 if successful, None otherwise.
 
         """
+        names = None
+        name = None
         if type(template) is str:
+            name = template
+            #: the placeholders of a template file are indexed by the template cache
+            names = placeholders(template)
             tpl = get_template(template)
             if not tpl:
                 self.logger.warning(
@@ -170,7 +308,30 @@ class BaseMaker(object):
             else:
                 template = tpl
 
-        if os.path.exists(target_file):
+        journal = self.settings.journal
+        path = self.staged_path(target_file)
+        backend = self.settings.backend
+        exists = path == target_file and backend.exists(target_file)
+        if names is None:
+            names = placeholders(template)
+        values = None
+
+        manifest = self.settings.manifest
+        if manifest and manifest.updating and exists:
+            values = self.settings.resolve(names)
+            if manifest.is_current(target_file, template, values):
+                #: neither the template nor the values have changed
+                self.logger.info("file up to date: '{}'".format(target_file))
+                self.settings.report.add(report.UNCHANGED, target_file)
+                return target_file
+            if manifest.keep_modified and manifest.is_modified(target_file):
+                self.logger.info(
+                    "file modified since generated: '{}'\n".format(target_file)
+                    + "skipping... To overwrite, try -f/--force option")
+                self.settings.report.add(report.SKIPPED, target_file)
+                return target_file
+
+        if exists and not (journal and journal.owns(target_file)):
             self.logger.info("file exists: '{}'".format(target_file))
 
             if self.force:
@@ -180,9 +341,12 @@ class BaseMaker(object):
                 self.logger.info(
                     "skipping... "
                     "To overwrite, try -f/--force option")
+                self.settings.report.add(report.SKIPPED, target_file)
                 return
 
-        content = template.safe_substitute(**settings)
+        if values is None:
+            values = self.settings.resolve(names)
+        content = template.safe_substitute(values)
         try:
             if post_jobs:
                 for f in post_jobs:
@@ -192,19 +356,79 @@ class BaseMaker(object):
                 "Error: failed to apply the post-job function '{}'\n".format(f.__name__) + repr(e))
             return
 
+        if journal and journal.is_written(target_file, content):
+            self.logger.info("file resumed: '{}'".format(target_file))
+            self.settings.report.add(report.UNCHANGED, target_file)
+        elif exists and backend.same_content(target_file, content):
+            #: neither written nor synced, so its mtime is kept
+            self.logger.info("file unchanged: '{}'".format(target_file))
+            self.settings.report.add(report.UNCHANGED, target_file)
+        elif not self.write_content(target_file, content):
+            return
+        else:
+            self.settings.report.add(report.OVERWRITTEN if exists else report.CREATED,
+                                     target_file, len(content.encode('utf-8')))
+            self.logger.info("created file: '{}'".format(target_file))
+
+        #: recorded only once the file holds the content
+        if manifest:
+            manifest.record(target_file, name, template, values, content)
+
+        return target_file
+
+    def write_content(self, target_file, content):
+        """write a text file the way :meth:`write_file` does, without a template
+
+        The file is journaled, staged, written atomically and synced as
+        :attr:`settings` says. See :meth:`write_file`.
+
+        If ``dedup`` is set in :attr:`settings`, i.e., ``link`` or ``clone``,
+        a file identical to one already written in the run is materialized out
+        of it instead of being written. See :mod:`skelpy.utils.dedup`.
+
+        Args:
+            target_file (str): file path to write
+            content (str): text to write
+
+        Returns:
+            bool: True if successful, False otherwise
+
+        """
+        backend = self.settings.backend
+        journal = self.settings.journal
+        path = self.staged_path(target_file)
+        policy = self.settings.get('durability', durability.STRICT) \
+            if backend.local else durability.NONE
+        strict = policy not in (durability.NONE, durability.BATCH)
+        #: nobody sees a file in the staging directory before it is complete
+        atomic = self.settings.get('atomic', True) and path == target_file
+        dedup = backend.local and self.settings.get('dedup')
+        linked = False
         try:
-            with open(target_file, 'wt') as f:
-                f.write(content)
-                f.flush()
-                os.fsync(f.fileno())
+            if journal:
+                journal.before_write(target_file)
+            if dedup:
+                linked = dedup_index.materialize(content, path, dedup, fsync=strict)
+            if linked:
+                self.logger.info("materialized out of an identical file ({}): '{}'"
+                                 .format(dedup, target_file))
+            else:
+                backend.write(path, content, fsync=strict, atomic=atomic)
+                if dedup:
+                    dedup_index.add(content, path)
         except Exception as e:
             self.logger.error(
                 "Error: failed to write '{}'\n".format(target_file) + repr(e))
-            return
+            return False
 
-        self.logger.info("created file: '{}'".format(target_file))
+        if journal:
+            journal.written(target_file, content)
+        if policy == durability.BATCH:
+            self.settings.sync_queue.add_file(path)
+        elif strict and (atomic or linked):
+            self.settings.sync_queue.add_entry(path)
 
-        return target_file
+        return True
 
     @abstractmethod
     def generate(self):
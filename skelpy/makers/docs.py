@@ -6,7 +6,6 @@ from __future__ import absolute_import, print_function
 
 import os
 
-from . import settings
 from .base import BaseMaker
 
 
@@ -31,11 +30,13 @@ class DocMaker(BaseMaker):
         merge (bool): Whether to overlap docs directory if the directory
             already exists
         force (bool): whether to overwrite if the file with the same name already exists
+        settings (:class:`Settings`): settings of the generation
         kwargs: extra keyword arguments
 
     """
 
-    def __init__(self, projectDir, merge, force, **kwargs):
+    def __init__(self, projectDir, merge, force, settings=None, **kwargs):
+        super(DocMaker, self).__init__(settings)
         self.projectDir = projectDir
         self.docsDir = os.path.join(projectDir, 'docs')
         self.merge = merge
@@ -45,16 +46,16 @@ class DocMaker(BaseMaker):
         self._update_settings()
 
     def _update_settings(self):
-        """update :attr:`maker.settings` dictionary"""
+        """add the layer of this *Maker* to :attr:`settings`"""
 
-        doc_title = settings.get('projectName') + self.TITLE_SUFFIX
+        doc_title = self.settings.get('projectName') + self.TITLE_SUFFIX
         info = {
             'docsDir': self.docsDir,
             'doc_title': doc_title,
             'doc_title_line': '*' * len(doc_title),
         }
 
-        settings.update(info)
+        self.settings.push(info)
 
     def _create_dirs(self):
         """create sub-directories"""
@@ -7,7 +7,7 @@ from __future__ import absolute_import, print_function
 import os
 import datetime
 
-from . import settings
+from . import Lazy
 from .base import BaseMaker
 
 
@@ -39,6 +39,7 @@ class LicenseMaker(BaseMaker):
         projectDir (str): absolute path of project directory to create
         force (bool): option for overwriting  if the file exists.
         license (str): license to create.
+        settings (:class:`Settings`): settings of the generation
 
     Attributes:
         default_license (str): default license(class variable)
@@ -46,7 +47,8 @@ class LicenseMaker(BaseMaker):
     """
     default_license = 'MIT'
 
-    def __init__(self, projectDir, force, license, **kwargs):
+    def __init__(self, projectDir, force, license, settings=None, **kwargs):
+        super(LicenseMaker, self).__init__(settings)
         self.projectDir = projectDir
         self.force = force
         self.license = license
@@ -54,14 +56,22 @@ class LicenseMaker(BaseMaker):
         self._update_settings()
 
     def _update_settings(self):
-        """update :attr:`maker.settings` dictionary"""
+        """add the layer of this *Maker* to :attr:`settings`
 
+        Dates already in :attr:`settings`--e.g., those of the project being
+        updated--take precedence over today's.
+
+        """
+        today = Lazy(datetime.date.today)
         info = {
-            'today': datetime.date.today().isoformat(),
-            'year': str(datetime.date.today().year),
+            'today': Lazy(lambda: today.get().isoformat()),
+            'year': Lazy(lambda: str(today.get().year)),
         }
+        for key in list(info):
+            if self.settings.get(key):
+                del info[key]
 
-        settings.update(info)
+        self.settings.push(info)
 
     @staticmethod
     def is_supported_license(license):
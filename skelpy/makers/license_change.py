@@ -7,7 +7,7 @@ from __future__ import absolute_import, print_function
 import os
 
 from skelpy.utils.helpers import read_setup_cfg, get_userName
-from . import settings
+from . import Lazy
 from .license import LicenseMaker
 
 
@@ -28,9 +28,12 @@ class LicenseChanger(LicenseMaker):
         list (bool): if True, print the list of supported licenses without changing
             (default: False)
         license (str): license to change to
+        settings (:class:`Settings`): settings of the generation
 
     """
-    def __init__(self, list_option, license=LicenseMaker.default_license):
+    def __init__(self, list_option, license=LicenseMaker.default_license, settings=None):
+        #: LicenseMaker.__init__ is skipped on purpose; attributes are set below
+        super(LicenseMaker, self).__init__(settings)
         self.list_option = list_option
         self.license = license.upper()
         self.projectDir = os.getcwd()
@@ -40,14 +43,17 @@ class LicenseChanger(LicenseMaker):
         self._update_settings()
 
     def _update_settings(self):
-        """update :attr:`maker.settings` dictionary"""
+        """add the layer of this *Maker* to :attr:`settings`"""
 
         super(LicenseChanger, self)._update_settings()
-        if not settings.get('author'):
-            settings['author'] = get_userName()
+        info = {}
+        if not self.settings.get('author'):
+            info['author'] = Lazy(get_userName)
         # set the current directory to the project name
-        if not settings.get('projectName'):
-            settings['projectName'] = os.path.split(os.getcwd())[-1]
+        if not self.settings.get('projectName'):
+            info['projectName'] = os.path.split(os.getcwd())[-1]
+
+        self.settings.push(info)
 
     def _replace_license(self, file):
         """replace license type in contents of the given file
@@ -104,7 +110,7 @@ class LicenseChanger(LicenseMaker):
         if os.path.exists(cfgFile):
             self._replace_license(cfgFile)
             self.logger.info("modified 'setup.cfg'")
-            settings.update(read_setup_cfg(cfgFile))
+            self.settings.push(read_setup_cfg(cfgFile))
 
         #: modify setup.py if exists
         setupFile = os.path.join(self.projectDir, 'setup.py')
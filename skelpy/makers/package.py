@@ -7,7 +7,6 @@ from __future__ import absolute_import, print_function
 import os
 import string
 
-from . import settings
 from .base import BaseMaker
 
 
@@ -36,10 +35,12 @@ class PackageMaker(BaseMaker):
         merge (bool): whether to overlap package directory if the directory
             already exits
         force (bool): whether to overwrite if the file with the same name already exists
+        settings (:class:`Settings`): settings of the generation
         kwargs : extra keyword arguments
 
     """
-    def __init__(self, projectDir, projectName, format, merge, force, **kwargs):
+    def __init__(self, projectDir, projectName, format, merge, force, settings=None, **kwargs):
+        super(PackageMaker, self).__init__(settings)
         self.projectDir = projectDir
         self.projectName = projectName
         self.format = format
@@ -53,13 +54,13 @@ class PackageMaker(BaseMaker):
         self._update_settings()
 
     def _update_settings(self):
-        """update :attr:`maker.settings` dictionary"""
+        """add the layer of this *Maker* to :attr:`settings`"""
 
         info = {
             'packageDir': self.packageDir,
         }
 
-        settings.update(info)
+        self.settings.push(info)
 
     def _create_package_dir(self):
         """create package directory structure"""
@@ -7,12 +7,20 @@
 from __future__ import absolute_import, print_function
 
 import os
-import sys
+import errno
+import shutil
+import binascii
 import subprocess
-from tempfile import gettempdir
-
-from skelpy.utils import opener, helpers
-from . import get_maker, settings
+from tempfile import mkstemp
+from timeit import default_timer as timer
+
+from skelpy.utils import opener, helpers, durability
+from skelpy.utils.dedup import dedup_index
+from skelpy.utils.journal import Journal, JOURNAL_FILE
+from skelpy.utils.manifest import Manifest
+from skelpy.utils.scheduler import run_graph
+from skelpy.templates import get_template, placeholders
+from . import Lazy, get_maker
 from .base import BaseMaker
 from .license import LicenseMaker
 
@@ -33,6 +41,8 @@ class ProjectMaker(BaseMaker):
     Then ``ProjectMaker`` creates and runs three sub-makers:
     ``PackageMaker``, ``DockMaker``, ``TestMaker``.
 
+    The *Makers* run concurrently as far as :attr:`MAKER_DEPENDENCIES` allows.
+
     Args:
         projectName (str): project name, in effect, the directory to create.
         projectDir (str): absolute path of project directory to be created.
@@ -46,8 +56,40 @@ class ProjectMaker(BaseMaker):
         merge (bool): whether to overlap the project directory if the directory
             already exists
         force (bool): whether to overwrite if the file with the same name already exists
+        durability (str): when to sync the files created to the disk, i.e.,
+            ``none``, ``batch`` or ``strict``(default). Read from *settings*.
+        staging (bool): whether to render a new project into a staging
+            directory and rename it to the project directory at last.
+            Read from *settings*.
+        settings (:class:`Settings`): settings of the generation, shared with
+            all the sub-makers
+
+    Attributes:
+        MAKERS (tuple): modules defining the sub-makers to run
+        OPTIONAL_MAKERS (tuple): sub-makers skipped, instead of failing the
+            generation, if their modules are not found
+        MAKER_DEPENDENCIES (dict): sub-maker to the sub-makers it depends on
+        MANIFEST_OPTIONS (tuple): options and project information recorded in
+            the manifest, so that ``skelpy update`` generates the project with
+            the same values. Paths are not recorded, so that the project can
+            be moved.
+
     """
-    def __init__(self, projectDir, projectName, quiet, merge, force, **kwargs):
+    MAKERS = ('setup_cfg', 'setup', 'license', 'readme', 'package', 'docs', 'tests')
+
+    OPTIONAL_MAKERS = ('setup_cfg', 'setup', 'license', 'readme')
+
+    MANIFEST_OPTIONS = ('projectName', 'format', 'test', 'license', 'version',
+                        'description', 'url', 'author', 'author_email', 'year', 'today')
+
+    MAKER_DEPENDENCIES = {
+        'setup': ('setup_cfg',),        # reads setup.cfg back
+        'readme': ('license',),         # ${today}
+        'docs': ('package', 'license'),  # ${packageDir}, ${year}
+    }
+
+    def __init__(self, projectDir, projectName, quiet, merge, force, settings=None, **kwargs):
+        super(ProjectMaker, self).__init__(settings)
         self.projectDir = projectDir
         self.projectName = projectName
         self.quiet = quiet
@@ -57,16 +99,33 @@ class ProjectMaker(BaseMaker):
         self._update_info()
 
     def _update_info(self):
-        """update :attr:`maker.settings` dictionary"""
+        """add the user info and the defaults layers to :attr:`settings`
+
+        Values already in :attr:`settings`--e.g., those given in a batch
+        manifest--take precedence over the defaults. The user's identity is
+        looked up only when it is not given and a template refers to it.
+
+        """
+        info = {}
+        if not self.settings.get('author'):
+            info['author'] = Lazy(helpers.get_userName)
+        if not self.settings.get('author_email'):
+            info['author_email'] = Lazy(helpers.get_email)
+        self.settings.push(info)
 
         defaults = {
-            'author': helpers.get_userName(),
-            'author_email': helpers.get_email(),
             'version': '1.0.0',
             'license': LicenseMaker.default_license,
-            'description': 'ADD SHORT DESCRIPTION ON THE PROJECT HERE'}
+            'description': 'ADD SHORT DESCRIPTION ON THE PROJECT HERE',
+            'url': Lazy(self._default_url)}
+
+        self.settings.add_defaults(defaults)
 
-        settings.update(defaults)
+    def _default_url(self):
+        """URL of the project if not given, i.e., on GitHub under the author's name"""
+
+        return 'https://github.com/{}/{}'.format(self.settings.get('author', ''),
+                                                 self.settings['projectName'])
 
     def _get_info(self):
         """collect project information from the user
@@ -76,38 +135,57 @@ class ProjectMaker(BaseMaker):
         short description of the project.
         Collected information is used to create setup.py and setup.cfg.
 
+        In the quiet mode, the editor is skipped. The information may be given
+        in :attr:`settings` instead, e.g., by the command-line options or
+        ``--info FILE``.
+
+        The file edited is created by :func:`tempfile.mkstemp`, i.e., with a
+        unique name and readable only by the user, so concurrent runs on a host
+        never share it. It is removed however the method exits.
+
         Returns:
             bool: True if successful, False otherwise
 
         """
         if self.quiet:
-            return
-
-        try:
-            from configparser import ConfigParser  # python3
-        except ImportError:
-            from ConfigParser import ConfigParser  # python2
+            return True
 
-        infoFile = os.path.join(gettempdir(), 'info.txt')
-        if not self.write_file('info', infoFile):
+        template = get_template('info')
+        if not template:
+            self.logger.warning("failed to retrieve the template file: 'info.tpl'")
             return False
 
-        if opener.open_with_associated_application(infoFile, block=True) == -1:
+        #: a scratch file on the local file system, whatever the backend is.
+        #: '.txt' lets the opener find the editor associated with text files.
+        try:
+            fd, infoFile = mkstemp(prefix='skelpy-info-', suffix='.txt', text=True)
+        except (IOError, OSError) as e:
+            self.logger.error("Error: failed to create the info file\n" + repr(e))
             return False
 
-        parser = ConfigParser()
         try:
-            with open(infoFile, 'r') as f:
-                if sys.version_info[0] == 2:
-                    parser.readfp(f)
-                else:
-                    parser.read_file(f)
-        except Exception:
-            return False
+            try:
+                with os.fdopen(fd, 'wt') as f:
+                    f.write(template.safe_substitute(
+                        self.settings.resolve(placeholders('info'))))
+            except (IOError, OSError) as e:
+                self.logger.error(
+                    "Error: failed to write '{}'\n".format(infoFile) + repr(e))
+                return False
+
+            if opener.open_with_associated_application(infoFile, block=True) == -1:
+                return False
+
+            info = helpers.read_info_file(infoFile)
+            if info is None:
+                return False
+        finally:
+            try:
+                os.remove(infoFile)
+            except (IOError, OSError):
+                pass
 
-        os.remove(infoFile)
-        for section in parser.sections():
-            settings.update(parser.items(section))
+        self.settings.push(info)
 
         return True
 
@@ -118,7 +196,7 @@ class ProjectMaker(BaseMaker):
         the default license(MIT) is used instead.
 
         """
-        license = settings.get('license')
+        license = self.settings.get('license')
 
         if not LicenseMaker.is_supported_license(license):
             self.logger.info(
@@ -126,33 +204,71 @@ class ProjectMaker(BaseMaker):
                 + "default '{}' license will be used.\n".format(LicenseMaker.default_license)
                 + "* You can change the license later with 'license' sub-command.\n"
                 + "For help, see 'skelpy license -h/--help'.")
-            settings['license'] = LicenseMaker.default_license
+            self.settings['license'] = LicenseMaker.default_license
         else:
-            settings['license'] = license.upper()
+            self.settings['license'] = license.upper()
 
-    def _create_config_files(self):
-        """create configuration files
+    def _make_job(self, mod_name):
+        """create a job that creates and runs the sub-maker defined in *mod_name*
+
+        The sub-maker is created when the job runs, i.e., after all the
+        sub-makers it depends on have finished.
+
+        Args:
+            mod_name (str): name of the module defining the sub-maker
+
+        Returns:
+            callable: job returning True if successful, False otherwise
+
+        """
+        def job():
+            maker_cls = get_maker(mod_name)
+            if not maker_cls:
+                if mod_name in self.OPTIONAL_MAKERS:
+                    self.logger.warning('   skipping...')
+                    return True
+                return False
+
+            maker = maker_cls.from_settings(self.settings)
+            return maker.generate()
+
+        return job
+
+    def _run_makers(self):
+        """create & run sub-makers, including the miscellaneous files
+
+        Sub-makers independent of each other run concurrently in a thread pool.
+        See :attr:`MAKER_DEPENDENCIES`. How long each one takes is recorded
+        in :attr:`Settings.report`.
 
         Returns:
             bool: True if successful, False otherwise
         """
+        jobs = [(m, self._timed(m, self._make_job(m))) for m in self.MAKERS]
+        jobs.append(('miscellaneous',
+                     self._timed('miscellaneous', self._create_miscellaneous)))
 
-        makers = ['setup_cfg',
-                  'setup',
-                  'license',
-                  'readme']
+        return run_graph(jobs, self.MAKER_DEPENDENCIES)
 
-        for m in makers:
-            maker_cls = get_maker(m)
-            if not maker_cls:
-                self.logger.warning('   skipping...')
-                continue
+    def _timed(self, name, job):
+        """wrap a job to record how long it takes
 
-            maker = maker_cls(**settings)
-            if not maker.generate():
-                return False
+        Args:
+            name (str): name the time is recorded under
+            job (callable): job to run
 
-        return True
+        Returns:
+            callable: job returning what *job* returns
+
+        """
+        def timed_job():
+            start = timer()
+            try:
+                return job()
+            finally:
+                self.settings.report.add_timing(name, timer() - start)
+
+        return timed_job
 
     def _create_miscellaneous(self):
         """create other miscellaneous configuration files
@@ -183,31 +299,160 @@ class ProjectMaker(BaseMaker):
 
         return True
 
-    def _run_subworkers(self):
-        """ create & run sub-makers
+    def generate(self):
+        """Worker method of :class:`ProjectMaker`
+
+        Every file generated is recorded in the manifest of the project--see
+        :mod:`skelpy.utils.manifest`--, which is written at the end.
+
+        The generation is journaled--see :mod:`skelpy.utils.journal`--unless
+        the durability policy is ``none``. If it fails, all the changes made
+        are rolled back. If the journal of an interrupted generation is found
+        in the project directory, the generation resumes from it, whatever the
+        policy is.
+
+        If ``staging`` is True in :attr:`settings` and the project directory
+        does not exist, the project is rendered into a staging directory
+        instead, which is then renamed to the project directory. See
+        :meth:`_generate_staged`.
+
+        Under the ``batch`` durability policy, all the files and directories
+        created are synced in one pass at the end, even if the generation fails.
+
+        Journaling, staging and syncing apply only to the local file system.
+        With other backends--see :attr:`Settings.backend`--, the project is
+        just generated.
 
         Returns:
             bool: True if successful, False otherwise
+
         """
-        makers = [
-            'package',
-            'docs',
-            'tests',
-        ]
-
-        for m in makers:
-            maker_cls = get_maker(m)
-            if not maker_cls:
-                return False
+        local = self.settings.backend.local
+        if self.settings.manifest is None:
+            self.settings.manifest = (local and Manifest.load(self.projectDir)) \
+                or Manifest(self.projectDir)
+
+        if not local:
+            #: neither journaled, staged nor synced
+            return self._generate()
+
+        if self.settings.get('staging') and not os.path.lexists(self.projectDir):
+            return self._generate_staged()
+
+        policy = self.settings.get('durability', durability.STRICT)
+        if policy == durability.NONE \
+                and not os.path.exists(os.path.join(self.projectDir, JOURNAL_FILE)):
+            #: not journaled, i.e., a failure leaves what was generated
+            try:
+                return self._generate()
+            finally:
+                self.settings.sync_queue.sync()
+
+        journal = Journal(self.projectDir, sync=policy == durability.STRICT)
+        if journal.resumed:
+            self.logger.info(
+                "resuming the interrupted generation: '{}'".format(journal.path))
+        self.settings.journal = journal
+
+        ok = False
+        try:
+            ok = self._generate()
+        finally:
+            try:
+                if ok:
+                    journal.commit()
+                else:
+                    undone = journal.rollback()
+                    self.logger.info("rolled back {} changes".format(undone))
+            finally:
+                self.settings.journal = None
+                self.settings.sync_queue.sync()
+
+        return ok
+
+    def _generate_staged(self):
+        """render the project into a staging directory and rename it at last
+
+        The staging directory is a hidden sibling of the project directory,
+        i.e., in the same file system, so the whole tree is published by a
+        single rename. Those watching the parent directory never see
+        a partial project. Since the staging directory starts out empty, files
+        and directories are created in it without checking if they exist.
+        If the generation fails, the staging directory is removed, and so are
+        the parent directories created for it.
+
+        Returns:
+            bool: True if successful, False otherwise
 
-            maker = maker_cls(**settings)
-            if not maker.generate():
+        """
+        projectDir = os.path.abspath(self.projectDir)
+        parent, name = os.path.split(projectDir)
+        stagingDir = os.path.join(parent, '.{}.{}.staging'.format(
+            name, binascii.hexlify(os.urandom(4)).decode('ascii')))
+        self.settings.staging = (projectDir, stagingDir)
+
+        #: parent directories missing now, i.e., to be created, deepest first
+        missing = []
+        while parent and not os.path.isdir(parent):
+            missing.append(parent)
+            parent = os.path.dirname(parent)
+
+        ok = False
+        try:
+            ok = self._generate()
+            if ok:
+                #: the files and directories are synced before they are published
+                self.settings.sync_queue.sync()
+                ok = self._publish(stagingDir, projectDir)
+        finally:
+            self.settings.staging = None
+            if not ok:
+                if os.path.isdir(stagingDir):
+                    shutil.rmtree(stagingDir, ignore_errors=True)
+                for dirname in missing:
+                    try:
+                        os.rmdir(dirname)
+                    except OSError:  # not empty, e.g., used by others meanwhile
+                        break
+            self.settings.sync_queue.sync()
+
+        return ok
+
+    def _publish(self, stagingDir, projectDir):
+        """rename the staging directory to the project directory
+
+        The project directory is never replaced, even if an empty one is
+        created while generating--see :func:`durability.rename_noreplace`.
+
+        Args:
+            stagingDir (str): staging directory
+            projectDir (str): project directory, which must not exist
+
+        Returns:
+            bool: True if successful, False otherwise
+
+        """
+        try:
+            durability.rename_noreplace(stagingDir, projectDir)
+        except OSError as e:
+            if e.errno == errno.EEXIST:
+                self.logger.error(
+                    "directory created while generating: '{}'".format(projectDir))
                 return False
+            self.logger.error(
+                "Error: failed to rename '{}'\n".format(stagingDir) + repr(e))
+            return False
+
+        if self.settings.get('dedup'):
+            dedup_index.moved(stagingDir, projectDir)
+        if self.settings.get('durability', durability.STRICT) != durability.NONE:
+            durability.fsync_path(os.path.dirname(projectDir))
+        self.logger.info("published directory: '{}'".format(projectDir))
 
         return True
 
-    def generate(self):
-        """Worker method of :class:`ProjectMaker`
+    def _generate(self):
+        """create the whole project tree
 
         Returns:
             bool: True if successful, False otherwise
@@ -221,13 +466,24 @@ class ProjectMaker(BaseMaker):
 
         self._check_license()
 
-        if not self._create_config_files():
-            return False
+        return self._run_makers() and self._write_manifest()
 
-        if not self._create_miscellaneous():
-            return False
+    def _write_manifest(self):
+        """write the manifest of the project, i.e., ``.skelpy/manifest.json``
+
+        See :mod:`skelpy.utils.manifest`.
 
-        if not self._run_subworkers():
+        Returns:
+            bool: True if successful, False otherwise
+
+        """
+        manifest = self.settings.manifest
+        manifest.record_settings(
+            dict((key, self.settings[key]) for key in self.MANIFEST_OPTIONS
+                 if key in self.settings))
+        manifestDir = os.path.dirname(manifest.path)
+        if not self.settings.backend.isdir(self.staged_path(manifestDir)) \
+                and not self.create_dir(manifestDir):
             return False
 
-        return True
+        return self.write_content(manifest.path, manifest.dumps())
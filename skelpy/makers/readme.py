@@ -6,7 +6,6 @@ from __future__ import absolute_import, print_function
 
 import os
 
-from . import settings
 from .base import BaseMaker
 
 
@@ -16,10 +15,12 @@ class ReadmeMaker(BaseMaker):
     Args:
         projectDir (str): absolute path of the project directory
         projectName (str): project name
+        settings (:class:`Settings`): settings of the generation
         kwargs: extra keyword arguments
 
     """
-    def __init__(self, projectDir, projectName, force, **kwargs):
+    def __init__(self, projectDir, projectName, force, settings=None, **kwargs):
+        super(ReadmeMaker, self).__init__(settings)
         self.projectDir = projectDir
         self.projectName = projectName
         self.force = force
@@ -27,13 +28,13 @@ class ReadmeMaker(BaseMaker):
         self._update_settings()
 
     def _update_settings(self):
-        """update :attr:`maker.settings` dictionary"""
+        """add the layer of this *Maker* to :attr:`settings`"""
 
         info = {
             'line': '*' * len(self.projectName),
         }
 
-        settings.update(info)
+        self.settings.push(info)
 
     def generate(self):
         """Worker method of :class:`ReadmeMaker`
@@ -9,7 +9,6 @@ import sys
 from functools import partial
 
 from skelpy.utils.helpers import read_setup_cfg
-from . import settings
 from .base import BaseMaker
 
 
@@ -19,18 +18,29 @@ class SetupMaker(BaseMaker):
     Args:
         projectDir (str): absolute path of project directory
         force (bool): whether to overwrite if ``setup.py`` already exists
+        settings (:class:`Settings`): settings of the generation
 
     """
-    def __init__(self, projectDir, force, **kwargs):
+    def __init__(self, projectDir, force, settings=None, **kwargs):
+        super(SetupMaker, self).__init__(settings)
         self.projectDir = projectDir
         self.force = force
 
         self._update_settings()
 
     def _update_settings(self):
-        """update :attr:`maker.settings` dictionary"""
+        """add the layer of this *Maker* to :attr:`settings`
 
-        settings.update(read_setup_cfg(os.path.join(self.projectDir, 'setup.cfg')))
+        The layer holds the values read from ``setup.cfg`` and the values
+        formatted for ``setup.py``. Unlike other *Makers*, ``SetupMaker`` keeps
+        its layer private--see :meth:`Settings.new_child`--so that the values
+        re-read from ``setup.cfg`` do not affect other *Makers* running at
+        the same time.
+
+        """
+        cfgFile = self.staged_path(os.path.join(self.projectDir, 'setup.cfg'))
+        layer = read_setup_cfg(cfgFile, self.settings.backend.read(cfgFile))
+        self.settings = self.settings.new_child(layer)
 
         _format_multi_line_list = self._format
         _format_single_line_list = partial(self._format, indent=0, sep=', ')
@@ -38,22 +48,22 @@ class SetupMaker(BaseMaker):
 
         info = {
             'exclude':
-                _format_single_line_list(settings.get('exclude')),
+                _format_single_line_list(self.settings.get('exclude')),
             'python_requires':
-                self._get_python_requires(settings.get('classifiers')),
+                self._get_python_requires(self.settings.get('classifiers')),
             'classifiers':
-                _format_multi_line_list(settings.get('classifiers')),
+                _format_multi_line_list(self.settings.get('classifiers')),
             'install_requires':
-                _format_multi_line_list(settings.get('install_requires')),
+                _format_multi_line_list(self.settings.get('install_requires')),
             'setup_requires':
-                _format_multi_line_list(settings.get('setup_requires')),
+                _format_multi_line_list(self.settings.get('setup_requires')),
             'tests_require':
-                _format_multi_line_list(settings.get('tests_require')),
+                _format_multi_line_list(self.settings.get('tests_require')),
             'extras_require':
-                _format_multi_line_dict(settings.get('extras_require')),
+                _format_multi_line_dict(self.settings.get('extras_require')),
         }
 
-        settings.update(info)
+        layer.update(info)
 
     @staticmethod
     def _format(text, quote=True, indent=8, sep=',\n'):
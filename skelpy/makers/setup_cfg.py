@@ -7,7 +7,7 @@ from __future__ import absolute_import, print_function
 import os
 
 from skelpy.utils import helpers
-from . import settings
+from . import Lazy
 from .base import BaseMaker
 
 
@@ -21,10 +21,12 @@ class SetupCfgMaker(BaseMaker):
         force (bool): whether to overwrite if ``setup.cfg`` already exists
         test (str): testing tool to use. i.e., ``unittest`` or ``pytest``
             See :class:`TestMaker`.
+        settings (:class:`Settings`): settings of the generation
 
     """
 
-    def __init__(self, projectDir, projectName, format, quiet, force, test, **kwargs):
+    def __init__(self, projectDir, projectName, format, quiet, force, test, settings=None, **kwargs):
+        super(SetupCfgMaker, self).__init__(settings)
         self.projectDir = projectDir
         self.projectName = projectName
         self.format = format
@@ -35,18 +37,18 @@ class SetupCfgMaker(BaseMaker):
         self._update_settings()
 
     def _update_settings(self):
-        """update :attr:`maker.settings` dictionary"""
+        """add the layer of this *Maker* to :attr:`settings`"""
 
         info = {
             'package_dir': '.' if self.format == 'basic' else 'src',
             'pytest': 'pytest' if self.test == 'pytest' else '',
             'pytest_runner': 'pytest-runner' if self.test == 'pytest' else '',
             'pytest_alias': 'test = pytest\n' if self.test == 'pytest' else '',
-            'python_version': helpers.get_python_version(),
-            'python_version_short': helpers.get_python_version(short=True),
+            'python_version': Lazy(helpers.get_python_version),
+            'python_version_short': Lazy(helpers.get_python_version, short=True),
         }
 
-        settings.update(info)
+        self.settings.push(info)
 
     def generate(self):
         """Worker method of :class:`SetupCfgMaker`"""
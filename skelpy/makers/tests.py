@@ -6,7 +6,6 @@ from __future__ import absolute_import, print_function
 
 import os
 
-from . import settings
 from .base import BaseMaker
 
 
@@ -20,10 +19,12 @@ class TestMaker(BaseMaker):
         force (bool): whether to overwrite if *test_main.py* already exists
         test (str): testing tool to use. *skelpy* supports two testing
             tools: :mod:`unittest` and `pytest(default)  <https://pytest.org/>`_
+        settings (:class:`Settings`): settings of the generation
 
     """
 
-    def __init__(self, projectDir, merge, force, test, **kwargs):
+    def __init__(self, projectDir, merge, force, test, settings=None, **kwargs):
+        super(TestMaker, self).__init__(settings)
         self.projectDir = projectDir
         self.testsDir = os.path.join(self.projectDir, 'tests')
         self.merge = merge
@@ -33,13 +34,13 @@ class TestMaker(BaseMaker):
         self._update_settings()
 
     def _update_settings(self):
-        """update :attr:`maker.settings` dictionary"""
+        """add the layer of this *Maker* to :attr:`settings`"""
 
         info = {
             'testsDir': self.testsDir,
         }
 
-        settings.update(info)
+        self.settings.push(info)
 
     def _create_config_files(self):
         """create general configuration files"""
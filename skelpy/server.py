@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""long-lived *skelpy* server
+
+``skelpy serve --socket PATH`` runs an :mod:`asyncio` server on a Unix socket.
+The server imports all the *Maker* modules and loads all the templates once,
+and then serves generation requests against those warm caches.
+
+A request is a single line of JSON, either the command-line arguments::
+
+    {"argv": ["-q", "my_project"], "cwd": "/home/dks/work"}
+
+or a sub-command with its options::
+
+    {"command": "template", "options": {"projectName": "my_project", "quiet": true},
+     "cwd": "/home/dks/work"}
+
+The server answers with a single line of JSON::
+
+    {"status": 0, "stdout": "Successfully done.\\n", "stderr": ""}
+
+See :mod:`skelpy.client` for forwarding command-line invocations to a server.
+
+.. note::
+
+    Requests are accepted concurrently but executed one at a time, because
+    each of them runs in its own working directory and with its own output.
+
+.. note::
+
+    This module requires python 3.5+.
+
+"""
+
+import os
+import sys
+import json
+import socket
+
+#: sub-commands a server accepts
+COMMANDS = ('template', 'license', 'batch')
+
+
+def _parse_request(request, parser):
+    """turn a request into the options of a sub-command
+
+    Args:
+        request (dict): request received
+        parser (obj): instance of :class:`DefaultSubcommandArgParser` class
+
+    Projects are always created in the quiet mode, as in a batch, since the
+    editor of the project information would block the server.
+
+    Returns:
+        dict: options, as parsed from the command line
+
+    Raises:
+        SystemExit: if the request is invalid, e.g., a batch manifest read from
+            the standard input, which would block the server
+
+    """
+    if 'argv' in request:
+        argv = request['argv']
+        if argv and argv[0] == 'serve':
+            parser.error("'serve' can not be forwarded to a server")
+        return _check_manifest(_force_quiet(vars(parser.parse_args(argv))), parser)
+
+    command = request.get('command', 'template')
+    if command not in COMMANDS:
+        parser.error("unsupported command: '{}'".format(command))
+
+    sub_parser = {'template': parser.main_parser,
+                  'license': parser.lic_parser,
+                  'batch': parser.batch_parser}[command]
+    options = request.get('options') or {}
+    if command == 'batch' and not options.get('manifest'):
+        parser.error("'batch' requires a manifest file")
+    #: positional arguments of 'license' and 'batch' are required or nullable
+    positional = {'license': [], 'batch': [options.get('manifest')]}
+    opts = vars(sub_parser.parse_args(positional.get(command, [])))
+    opts.update(options)
+
+    return _check_manifest(_force_quiet(opts), parser)
+
+
+def _force_quiet(opts):
+    """turn on the quiet mode of a 'template' request, i.e., no editor
+
+    Args:
+        opts (dict): options of a request
+
+    Returns:
+        dict: *opts*
+
+    """
+    if 'quiet' in opts:
+        opts['quiet'] = True
+
+    return opts
+
+
+def _check_manifest(opts, parser):
+    """reject a batch manifest read from the standard input
+
+    The server has no terminal, and reading its standard input would block
+    the only worker, i.e., all the requests after.
+
+    Args:
+        opts (dict): options of a request
+        parser (obj): instance of :class:`DefaultSubcommandArgParser` class
+
+    Returns:
+        dict: *opts*
+
+    Raises:
+        SystemExit: if the manifest is the standard input
+
+    """
+    if 'manifest' in opts and opts['manifest'] in (None, '', '-'):
+        parser.error("'batch' can not read the manifest from the standard input "
+                     "in a server")
+
+    return opts
+
+
+def execute(request):
+    """execute a request in the server process
+
+    The request runs in its working directory, and its standard output,
+    standard error and log messages are captured into the response.
+
+    .. warning::
+
+        This function changes the working directory and the standard streams
+        of the whole process, so it must not run concurrently.
+
+    Args:
+        request (dict): request received
+
+    Returns:
+        dict: response, i.e., ``status``, ``stdout`` and ``stderr``
+
+    """
+    import logging
+    from io import StringIO
+    import skelpy.main as main
+
+    out, err = StringIO(), StringIO()
+    handler = logging.StreamHandler(err)
+    handler.setFormatter(logging.Formatter(main.LOG_FORMAT))
+    logger = logging.getLogger('skelpy')
+
+    saved = os.getcwd(), sys.stdout, sys.stderr
+    logging.disable(logging.NOTSET)
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        os.chdir(request.get('cwd') or saved[0])
+        sys.stdout, sys.stderr = out, err
+        try:
+            parser = main._setup_arg_parser()
+            opts = _parse_request(request, parser)
+            status = main._execute(opts, parser)
+        except SystemExit as e:
+            status = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception as e:
+            err.write(u"[skelpy] " + repr(e) + u"\n")
+            status = 1
+    finally:
+        os.chdir(saved[0])
+        sys.stdout, sys.stderr = saved[1], saved[2]
+        logger.removeHandler(handler)
+        logger.propagate = True
+        logging.disable(logging.NOTSET)
+
+    return {'status': status, 'stdout': out.getvalue(), 'stderr': err.getvalue()}
+
+
+class Server(object):
+    """:mod:`asyncio` server serving generation requests over a Unix socket
+
+    Args:
+        socket_path (str): path of the Unix socket to listen on
+
+    """
+    def __init__(self, socket_path):
+        self.socket_path = os.path.abspath(socket_path)
+        self._loop = None
+        self._stop = None
+
+    def _remove_stale_socket(self):
+        """remove the socket file left by a server no longer running
+
+        Raises:
+            OSError: if another server is listening on the socket
+
+        """
+        if not os.path.exists(self.socket_path):
+            return
+
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(self.socket_path)
+        except (IOError, OSError):
+            os.remove(self.socket_path)
+        else:
+            raise OSError("another server is running on '{}'".format(self.socket_path))
+        finally:
+            conn.close()
+
+    def serve_forever(self, ready=None):
+        """run the server until :meth:`shutdown` is called or
+        the process gets SIGINT or SIGTERM
+
+        Args:
+            ready (callable): called without arguments once the server listens
+
+        Returns:
+            None
+
+        """
+        import asyncio
+        from skelpy.main import _warm_up
+
+        _warm_up()
+        self._remove_stale_socket()
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._main(ready))
+        finally:
+            self._loop.close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def shutdown(self):
+        """stop the server; safe to call from any thread"""
+
+        if self._loop and self._stop:
+            self._loop.call_soon_threadsafe(self._stop.set)
+
+    async def _main(self, ready):
+        import asyncio
+        import signal
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._stop = asyncio.Event()
+        #: one worker: requests are executed one at a time
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        async def handle(reader, writer):
+            try:
+                line = await reader.readline()
+                try:
+                    request = json.loads(line.decode('utf-8'))
+                    if not isinstance(request, dict):
+                        raise ValueError
+                except ValueError:
+                    response = {'status': 2, 'stdout': '',
+                                'stderr': '[skelpy] Invalid request\n'}
+                else:
+                    response = await self._loop.run_in_executor(executor, execute, request)
+                writer.write((json.dumps(response) + '\n').encode('utf-8'))
+                await writer.drain()
+            finally:
+                writer.close()
+
+        server = await asyncio.start_unix_server(handle, path=self.socket_path)
+        #: only the user running the server may connect to it
+        os.chmod(self.socket_path, 0o600)
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(sig, self._stop.set)
+            except (RuntimeError, ValueError):  # not in the main thread
+                pass
+
+        if ready:
+            ready()
+        try:
+            await self._stop.wait()
+        finally:
+            server.close()
+            await server.wait_closed()
+            executor.shutdown(wait=True)
+
+
+def serve(socket_path):
+    """run a server on *socket_path* until SIGINT or SIGTERM
+
+    Args:
+        socket_path (str): path of the Unix socket to listen on
+
+    Returns:
+        bool: True if the server stopped normally, False otherwise
+
+    """
+    if getattr(socket, 'AF_UNIX', None) is None:
+        sys.stderr.write("[skelpy] 'serve' needs Unix sockets\n")
+        return False
+
+    try:
+        Server(socket_path).serve_forever()
+    except (IOError, OSError) as e:
+        sys.stderr.write("[skelpy] " + repr(e) + "\n")
+        return False
+
+    return True
@@ -1,21 +1,317 @@
 # -*- coding: utf-8 -*-
 """Collection of template files
 
-This package also provides a package-level function ``get_template()``.
+This package also provides package-level functions ``get_template()``,
+``template_names()``, ``placeholders()``, ``placeholder_index()``,
+``preload()``, ``cache_info()`` and ``cache_clear()``.
+
+Templates are compiled only once per process. :class:`TemplateCache` keeps the
+compiled templates keyed by name and reloads a template
+only when the modification time or the size of its source file changes.
+Along with a template, the cache keeps its placeholders, i.e., the identifiers
+of ``${...}`` and ``$...`` in the template, so that only the settings a template
+refers to need to be computed.
+
+Templates are compiled into :class:`CompiledTemplate`, which is split into
+literal and placeholder segments once and rendered by joining the segments.
+
+If the template bundle--see :mod:`skelpy.templates.bundle`--exists, templates
+are served from it rather than from the individual template files, unless
+``SKELPY_DEV_TEMPLATES`` is set.
 
 """
 
 from __future__ import absolute_import, print_function
 
+import os
 import string
+import threading
+from collections import namedtuple
 from pkgutil import get_data
 
+from skelpy.utils.trace import traced, TEMPLATE
+
+#: for python 2.7
+try:
+    FileNotFoundError
+except NameError:
+    FileNotFoundError = IOError
+
+_TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'currsize'])
+
+
+def _stamp(file):
+    """get the (mtime, size) pair of a template file
+
+    Args:
+        file (str): template file name, i.e., *tpl_name.tpl*
+
+    Returns:
+        tuple or None: (mtime, size) of the file, or None if the file is not
+        on the file system--e.g., when *skelpy* runs from the ezip distribution.
+
+    """
+    try:
+        st = os.stat(os.path.join(_TEMPLATE_DIR, file))
+    except (IOError, OSError):
+        return None
+
+    return st.st_mtime, st.st_size
+
+
+def find_placeholders(text):
+    """scan the text of a template for placeholders
+
+    Args:
+        text (str): template text
+
+    Returns:
+        frozenset: identifiers of the placeholders, e.g., ``projectName``
+        for both ``${projectName}`` and ``$projectName``. Escaped ones,
+        i.e., ``$$``, are not included.
+
+    """
+    names = set()
+    for match in string.Template.pattern.finditer(text):
+        name = match.group('named') or match.group('braced')
+        if name:
+            names.add(name)
+
+    return frozenset(names)
+
+
+class CompiledTemplate(string.Template):
+    """:class:`string.Template` split into segments once, when created
+
+    :meth:`string.Template.safe_substitute` scans the whole template text with
+    a regular expression on every call. ``CompiledTemplate`` does the scan
+    only once and renders the template by joining the literal segments and
+    the values of the placeholders in between. The result is exactly the same
+    as that of :meth:`string.Template.safe_substitute`, i.e., ``$$`` becomes
+    ``$`` and unknown or invalid placeholders are left intact.
+
+    Args:
+        template (str): template text
+
+    Attributes:
+        placeholders (frozenset): identifiers of the placeholders in the template
+
+    """
+    def __init__(self, template):
+        super(CompiledTemplate, self).__init__(template)
+        self._literals, self._placeholders = self._compile(template)
+        self.placeholders = frozenset(name for name, _ in self._placeholders)
+
+    def _compile(self, template):
+        """split the template text into segments
+
+        Args:
+            template (str): template text
+
+        Returns:
+            tuple: (literals, placeholders). Literals surround the placeholders,
+            i.e., there is one more literal than placeholders. Each placeholder is
+            a pair of its identifier and its text, e.g., ``('foo', '${foo}')``.
+
+        """
+        literals = []
+        placeholders = []
+        chunks = []
+        pos = 0
+        for match in self.pattern.finditer(template):
+            chunks.append(template[pos:match.start()])
+            pos = match.end()
+            name = match.group('named') or match.group('braced')
+            if name is not None:
+                literals.append(''.join(chunks))
+                chunks = []
+                placeholders.append((name, match.group()))
+            elif match.group('escaped') is not None or match.group('invalid') is not None:
+                chunks.append(self.delimiter)
+            else:
+                raise ValueError('Unrecognized named group in pattern', self.pattern)
+        chunks.append(template[pos:])
+        literals.append(''.join(chunks))
+
+        return literals, placeholders
+
+    def safe_substitute(self, *args, **kws):
+        """render the template like :meth:`string.Template.safe_substitute`
+
+        Each placeholder is looked up in *mapping* only once, however many times
+        it occurs in the template.
+
+        Args:
+            mapping (dict): values of the placeholders
+            kws: values of the placeholders, which take precedence over *mapping*
+
+        Returns:
+            str: rendered text
+
+        """
+        if len(args) > 1:
+            raise TypeError('Too many positional arguments')
+        mapping = args[0] if args else {}
+
+        literals = self._literals
+        parts = [literals[0]]
+        values = {}
+        for i, (name, text) in enumerate(self._placeholders, 1):
+            if name not in values:
+                try:
+                    values[name] = '%s' % (kws[name] if name in kws else mapping[name],)
+                except KeyError:
+                    #: unknown placeholders are left intact, as they are written
+                    values[name] = None
+            value = values[name]
+            parts.append(text if value is None else value)
+            parts.append(literals[i])
+
+        return ''.join(parts)
+
+
+class TemplateCache(object):
+    """Process-wide cache of compiled templates
+
+    Each entry holds the source file's stamp--see :func:`_stamp`--, or the
+    bundle if the template comes from it, the :class:`CompiledTemplate` and
+    its placeholders. An entry is reused as long as the stamp of the source
+    file does not change. Templates from the bundle are reused without
+    looking at their files at all.
+
+    Templates are loaded from the template bundle, which is loaded once, if it
+    exists. Otherwise, they are loaded from their own files.
+
+    Attributes:
+        hits (int): number of lookups served from the cache
+        misses (int): number of lookups that had to (re)load the template
+
+    """
+    def __init__(self):
+        self._entries = {}
+        self._bundle = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def bundle(self):
+        """get the template bundle, loading it on the first call
+
+        Returns:
+            :class:`skelpy.templates.bundle.Bundle` or None: the bundle, or None
+            if there is no bundle
+
+        """
+        with self._lock:
+            if self._bundle is None:
+                from . import bundle
+                self._bundle = bundle.load() or False
+            return self._bundle or None
+
+    def get(self, tpl_name):
+        """Retrieve the compiled template by name
+
+        Args:
+            tpl_name (str): template name
+
+        Returns:
+            :class:`string.Template` or None: an instance of :class:`string.Template`
+            class if successful, otherwise None.
+
+        """
+        entry = self._get_entry(tpl_name)
+        return entry[1] if entry else None
 
+    def placeholders(self, tpl_name):
+        """Retrieve the placeholders of a template by name
+
+        Args:
+            tpl_name (str): template name
+
+        Returns:
+            frozenset or None: identifiers of the placeholders in the template
+            if successful, otherwise None.
+
+        """
+        entry = self._get_entry(tpl_name)
+        return entry[2] if entry else None
+
+    def _get_entry(self, tpl_name):
+        """look up the entry of a template, (re)loading the template if needed
+
+        Args:
+            tpl_name (str): template name
+
+        Returns:
+            tuple or None: (stamp, template, placeholders) if successful,
+            otherwise None.
+
+        """
+        file = "{name}.tpl".format(name=tpl_name)
+        bundle = self.bundle()
+        #: the bundle is trusted, so the template file is not even looked at
+        bundled = bundle is not None and tpl_name in bundle
+        stamp = bundle if bundled else _stamp(file)
+
+        with self._lock:
+            entry = self._entries.get(tpl_name)
+            if entry and entry[0] == stamp:
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        text = bundle.get(tpl_name) if bundled else None
+        if text is None:
+            try:
+                text = get_data(__name__, file).decode(encoding='utf8')
+            except FileNotFoundError:
+                with self._lock:
+                    self._entries.pop(tpl_name, None)
+                return
+
+        template = CompiledTemplate(text)
+        entry = (stamp, template, template.placeholders)
+        with self._lock:
+            self._entries[tpl_name] = entry
+
+        return entry
+
+    def info(self):
+        """report cache statistics
+
+        Returns:
+            :class:`CacheInfo`: hits, misses and the number of cached templates
+
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, len(self._entries))
+
+    def clear(self):
+        """drop all cached templates and the bundle, and reset the counters"""
+
+        with self._lock:
+            self._entries.clear()
+            self._bundle = None
+            self.hits = 0
+            self.misses = 0
+
+
+#: the process-wide template cache
+template_cache = TemplateCache()
+
+
+@traced('get_template', TEMPLATE, arg=0, key='name')
 def get_template(tpl_name):
     """Retrieve the template by name
 
     copied from `pyscaffold project <http://pyscaffold.org>`_.
 
+    The template is served from :data:`template_cache`, so the same
+    :class:`string.Template` object is returned as long as the template
+    file does not change.
+
     Args:
         tpl_name (str): template name
 
@@ -24,21 +320,96 @@ def get_template(tpl_name):
         class if successful, otherwise None.
 
     Raises:
-        IOError(python2.7): if *tpl_name.tpl* file is not found
-        FileNotFoundError(python3.x): if *tpl_name.tpl* file is not found
         TypeError: if *tpl_name* is not given
 
     """
-    file = "{name}.tpl".format(name=tpl_name)
-    #: for python 2.7
-    try:
-        FileNotFoundError
-    except NameError:
-        FileNotFoundError = IOError
+    return template_cache.get(tpl_name)
+
 
+def template_names():
+    """list the names of all templates shipped with *skelpy*
+
+    Returns:
+        list: template names, i.e., file names without the *.tpl* extension
+
+    """
+    suffix = '.tpl'
+    bundle = template_cache.bundle()
+    names = set(bundle.names()) if bundle else set()
     try:
-        data = get_data(__name__, file)
-    except FileNotFoundError:
-        return
+        files = os.listdir(_TEMPLATE_DIR)
+    except (IOError, OSError):
+        #: running from the ezip distribution
+        files = []
+        loader = globals().get('__loader__')
+        archive = getattr(loader, 'archive', None)
+        if archive and not bundle:
+            import zipfile
+            prefix = os.path.relpath(_TEMPLATE_DIR, archive).replace(os.sep, '/') + '/'
+            with zipfile.ZipFile(archive) as z:
+                files = [n[len(prefix):] for n in z.namelist()
+                         if n.startswith(prefix) and '/' not in n[len(prefix):]]
+
+    names.update(f[:-len(suffix)] for f in files if f.endswith(suffix))
+
+    return sorted(names)
+
+
+def placeholders(template):
+    """get the placeholders of a template
+
+    Args:
+        template (:obj:`string.Template` or str): :obj:`string.Template` object
+            or the name of a template file. For names, the placeholders are
+            served from :data:`template_cache`.
+
+    Returns:
+        frozenset or None: identifiers of the placeholders in the template,
+        or None if *template* is an invalid name
+
+    """
+    if isinstance(template, CompiledTemplate):
+        return template.placeholders
+    if isinstance(template, string.Template):
+        return find_placeholders(template.template)
+
+    return template_cache.placeholders(template)
+
+
+def placeholder_index():
+    """build the index of placeholders of all templates shipped with *skelpy*
+
+    Returns:
+        dict: template name to the identifiers of its placeholders
+
+    """
+    return dict((name, placeholders(name)) for name in template_names())
+
+
+def preload():
+    """load all templates into the process-wide template cache
+
+    Useful before forking worker processes, so that the workers share
+    the compiled templates instead of loading them one by one.
+
+    Returns:
+        int: number of templates loaded
+
+    """
+    return len([name for name in template_names() if get_template(name)])
+
+
+def cache_info():
+    """report statistics of the process-wide template cache
+
+    Returns:
+        :class:`CacheInfo`: hits, misses and the number of cached templates
+
+    """
+    return template_cache.info()
+
+
+def cache_clear():
+    """clear the process-wide template cache"""
 
-    return string.Template(data.decode(encoding='utf8'))
+    template_cache.clear()
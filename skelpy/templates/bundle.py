@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""Single-file bundle of all templates
+
+Instead of reading each template file one by one--in the ezip distribution,
+each read is a look-up and a decompression of a zip member--, all templates
+can be packed into one bundle file, ``templates.bundle``, by :func:`build`.
+``setup.py`` does it when building the package or the ezip distribution,
+into the build directory or the release tree, never into the source tree.
+
+The bundle consists of::
+
+    * magic number, i.e., ``MAGIC``
+    * length of the index, 4-byte unsigned integer in big-endian
+    * index, JSON-encoded dict: template name to [offset, length]
+    * template texts encoded in utf-8, one after another
+
+Offsets are relative to the end of the index.
+
+The bundle is trusted as it is, i.e., the template files are not checked
+against it, because installed copies do not keep the modification times of
+the files. A source checkout has no bundle, so edited templates are read
+from their files. If one is built there by hand, set ``SKELPY_DEV_TEMPLATES``
+while editing the templates so that the files are read instead--see
+:data:`DEV_ENV`.
+
+When the bundle is on the file system, it is memory-mapped rather than read,
+so that only the pages of the templates used are loaded. Otherwise, e.g., in
+the ezip distribution, it is read with a single :func:`pkgutil.get_data` call.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import json
+import struct
+from pkgutil import get_data
+
+#: first bytes of a bundle file
+MAGIC = b'SKELPYT\x02'
+#: file name of the bundle, in the template directory
+BUNDLE_FILE = 'templates.bundle'
+#: environment variable which, if set, makes the bundle ignored
+DEV_ENV = 'SKELPY_DEV_TEMPLATES'
+
+_TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
+_HEADER = struct.Struct('>I')
+
+
+class Bundle(object):
+    """bundle of templates loaded in memory
+
+    Args:
+        data (bytes or :class:`mmap.mmap`): content of the bundle file
+
+    Raises:
+        ValueError: if *data* is not a valid bundle
+
+    """
+    def __init__(self, data):
+        start = len(MAGIC) + _HEADER.size
+        if len(data) < start or data[:len(MAGIC)] != MAGIC:
+            raise ValueError('not a template bundle')
+
+        size, = _HEADER.unpack(data[len(MAGIC):start])
+        index = json.loads(data[start:start + size].decode('utf-8'))
+        self._data = data
+        self._base = start + size
+        self._index = dict((name, (offset, length))
+                           for name, (offset, length) in index.items())
+
+    def __contains__(self, tpl_name):
+        return tpl_name in self._index
+
+    def names(self):
+        """list the names of the templates in the bundle
+
+        Returns:
+            list: template names, sorted
+
+        """
+        return sorted(self._index)
+
+    def get(self, tpl_name):
+        """get the text of a template
+
+        Args:
+            tpl_name (str): template name
+
+        Returns:
+            str or None: template text if the bundle has the template,
+            otherwise None
+
+        """
+        entry = self._index.get(tpl_name)
+        if not entry:
+            return None
+
+        offset, length = entry
+        start = self._base + offset
+        return self._data[start:start + length].decode('utf-8')
+
+
+def load(template_dir=None):
+    """load the bundle, memory-mapped if it is on the file system
+
+    Args:
+        template_dir (str): directory of the bundle. The directory of this
+            package if not given.
+
+    Returns:
+        :class:`Bundle` or None: the bundle, or None if there is no valid bundle
+        or :data:`DEV_ENV` is set
+
+    """
+    if os.environ.get(DEV_ENV):
+        return None
+
+    path = os.path.join(template_dir or _TEMPLATE_DIR, BUNDLE_FILE)
+    try:
+        with open(path, 'rb') as f:
+            import mmap
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError):  # ValueError: empty file
+        data = None
+
+    if data is None and template_dir is None:
+        #: not on the file system, e.g., in the ezip distribution
+        try:
+            data = get_data(__name__, BUNDLE_FILE)
+        except (IOError, OSError):
+            data = None
+
+    if data is None:
+        return None
+
+    try:
+        return Bundle(data)
+    except ValueError:
+        return None
+
+
+def build(template_dir=None, target=None):
+    """pack all the template files in a directory into a bundle
+
+    Args:
+        template_dir (str): directory of the template files. The directory of
+            this package if not given.
+        target (str): path of the bundle to create. ``templates.bundle`` in
+            *template_dir* if not given.
+
+    Returns:
+        int: number of templates packed
+
+    """
+    template_dir = template_dir or _TEMPLATE_DIR
+    target = target or os.path.join(template_dir, BUNDLE_FILE)
+    suffix = '.tpl'
+
+    index = {}
+    chunks = []
+    offset = 0
+    for file in sorted(os.listdir(template_dir)):
+        if not file.endswith(suffix):
+            continue
+        path = os.path.join(template_dir, file)
+        with open(path, 'rb') as f:
+            data = f.read()
+        #: validate the encoding now rather than when the template is used
+        data.decode('utf-8')
+        index[file[:-len(suffix)]] = [offset, len(data)]
+        chunks.append(data)
+        offset += len(data)
+
+    header = json.dumps(index, sort_keys=True).encode('utf-8')
+    tmp = target + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC)
+        f.write(_HEADER.pack(len(header)))
+        f.write(header)
+        for data in chunks:
+            f.write(data)
+    if os.path.exists(target):
+        os.remove(target)  # python 2.7 on Windows can not rename onto a file
+    os.rename(tmp, target)
+
+    return len(index)
+
+
+if __name__ == '__main__':
+    print('{} templates bundled'.format(build()))
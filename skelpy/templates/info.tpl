@@ -13,7 +13,7 @@
 name = ${projectName}
 version = 1.0.0
 description = ADD SHORT DESCRIPTION ON THE PROJECT HERE
-url = https://github.com/${author}/${projectName}
+url = ${url}
 license = MIT
 #--------------------------------------------------------------------
 # Supported Licenses
@@ -5,7 +5,7 @@ author = ${author}
 author_email = ${author_email}
 description = ${description}
 long-description = file: README.rst
-url = https://github.com/${author}/${projectName}
+url = ${url}
 license = ${license}
 platforms = any
 # https://pypi.python.org/pypi?%3Aaction=list_classifiers
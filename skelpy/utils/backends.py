@@ -0,0 +1,397 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""This module defines output backends, i.e., where the *Makers* put a project
+
+*Makers* create directories and write files through the backend of
+their :class:`~skelpy.makers.Settings`, i.e., :attr:`Settings.backend`:
+
+    * :class:`FileSystemBackend`: the local file system (default)
+    * :class:`MemoryBackend`: an in-memory tree, e.g., for tests and embedding
+    * :class:`ZipBackend`: a zip archive
+    * :class:`TarBackend`: a tar archive, which can be streamed, e.g.,
+      to the standard output
+
+Only the file system backend is *local*. Journaling, staging and syncing--
+which make sense only on the file system--are skipped on the others.
+
+Paths given to a backend are the paths the project would have on the file
+system. The archive backends store them relative to the directory holding
+the project, so the archive has the project directory at its top.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+import time
+import errno
+import threading
+
+from skelpy.utils import durability
+
+
+class Backend(object):
+    """interface of the output backends
+
+    Attributes:
+        local (bool): True if the files are written to the local file system
+
+    """
+    local = False
+
+    def exists(self, path):
+        """check if a file or a directory exists
+
+        Args:
+            path (str): path of the file or the directory
+
+        Returns:
+            bool
+
+        """
+        raise NotImplementedError
+
+    def mkdir(self, path, recursive=False):
+        """create a directory
+
+        Args:
+            path (str): path of the directory
+            recursive (bool): create all the intermediate directories as well
+
+        Raises:
+            OSError: if the directory exists, or its parent does not and
+                *recursive* is False
+
+        """
+        raise NotImplementedError
+
+    def isdir(self, path):
+        """check if a directory exists
+
+        Args:
+            path (str): path of the directory
+
+        Returns:
+            bool
+
+        """
+        raise NotImplementedError
+
+    def write(self, path, content, fsync=False, atomic=True):
+        """write a text file, replacing the existing one, if any
+
+        Args:
+            path (str): path of the file
+            content (str): text to write
+            fsync (bool): sync the file to the disk, if it applies
+            atomic (bool): write the file atomically, if it applies
+
+        Raises:
+            IOError or OSError: if failed to write
+
+        """
+        raise NotImplementedError
+
+    def read(self, path):
+        """read a text file
+
+        Args:
+            path (str): path of the file
+
+        Returns:
+            str or None: content of the file, or None if it can not be read
+
+        """
+        raise NotImplementedError
+
+    def same_content(self, path, content):
+        """check if a file holds the given text already
+
+        Args:
+            path (str): path of the file
+            content (str): text to write
+
+        Returns:
+            bool
+
+        """
+        return self.read(path) == content
+
+    def close(self):
+        """finish the output, e.g., write the end of an archive"""
+
+        pass
+
+
+class FileSystemBackend(Backend):
+    """the local file system"""
+
+    local = True
+
+    def exists(self, path):
+        return os.path.exists(path)
+
+    def isdir(self, path):
+        return os.path.isdir(path)
+
+    def mkdir(self, path, recursive=False):
+        cmd = os.makedirs if recursive else os.mkdir
+        cmd(path, 0o755)
+
+    def write(self, path, content, fsync=False, atomic=True):
+        if atomic:
+            durability.atomic_write(path, content, fsync=fsync)
+            return
+
+        with open(path, 'wt') as f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def read(self, path):
+        try:
+            with open(path, 'r') as f:
+                return f.read()
+        except (IOError, OSError):
+            return None
+
+    def same_content(self, path, content):
+        return durability.same_content(path, content)
+
+
+#: the local file system backend, shared since it has no state
+filesystem = FileSystemBackend()
+
+
+class MemoryBackend(Backend):
+    """in-memory tree of directories and files
+
+    The parents of a directory created non-recursively are not checked,
+    i.e., directories outside the tree are taken as existing.
+
+    Attributes:
+        files (dict): absolute path to the content of each file
+
+    """
+    def __init__(self):
+        self.files = {}
+        self._dirs = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path):
+        return os.path.normpath(os.path.abspath(path))
+
+    def exists(self, path):
+        key = self._key(path)
+        with self._lock:
+            return key in self.files or key in self._dirs
+
+    def isdir(self, path):
+        with self._lock:
+            return self._key(path) in self._dirs
+
+    def mkdir(self, path, recursive=False):
+        key = self._key(path)
+        with self._lock:
+            if key in self.files or key in self._dirs:
+                raise OSError(errno.EEXIST, os.strerror(errno.EEXIST), path)
+            created = [key]
+            parent = os.path.dirname(key)
+            while recursive and parent not in self._dirs \
+                    and parent != os.path.dirname(parent):
+                created.append(parent)
+                parent = os.path.dirname(parent)
+            for d in reversed(created):
+                self._dirs.add(d)
+                self._added_dir(d)
+
+    def write(self, path, content, fsync=False, atomic=True):
+        key = self._key(path)
+        with self._lock:
+            if key in self._dirs:
+                raise IOError(errno.EISDIR, os.strerror(errno.EISDIR), path)
+            self.files[key] = content
+            self._added_file(key, content)
+
+    def read(self, path):
+        with self._lock:
+            return self.files.get(self._key(path))
+
+    def tree(self, root):
+        """get the files under a directory
+
+        Args:
+            root (str): path of the directory, e.g., the project directory
+
+        Returns:
+            dict: path relative to *root*, with '/' as the separator, to content
+
+        """
+        root = self._key(root)
+        with self._lock:
+            return dict((path[len(root) + 1:].replace(os.sep, '/'), content)
+                        for path, content in self.files.items()
+                        if path.startswith(root + os.sep))
+
+    def _added_dir(self, path):
+        """hook called with the lock held when a directory is added"""
+
+        pass
+
+    def _added_file(self, path, content):
+        """hook called with the lock held when a file is written"""
+
+        pass
+
+
+class _ArchiveBackend(MemoryBackend):
+    """base of the archive backends
+
+    The tree is kept in memory as well--files of a project are small--,
+    so that the *Makers* can read back what they have written, e.g., setup.cfg.
+
+    Args:
+        root (str): directory the paths in the archive are relative to, e.g.,
+            the parent directory of the project directory
+
+    """
+    def __init__(self, root):
+        super(_ArchiveBackend, self).__init__()
+        self.root = self._key(root)
+
+    def _arcname(self, path):
+        """path in the archive, or None if *path* is not under :attr:`root`"""
+
+        if not path.startswith(self.root + os.sep):
+            return None
+        return path[len(self.root) + 1:].replace(os.sep, '/')
+
+
+class ZipBackend(_ArchiveBackend):
+    """zip archive
+
+    Args:
+        target (str or file): path of the archive to create, or a file object
+            opened for writing in binary mode
+        root (str): directory the paths in the archive are relative to
+
+    """
+    def __init__(self, target, root):
+        import zipfile
+
+        super(ZipBackend, self).__init__(root)
+        self._zipfile = zipfile
+        self._archive = zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED)
+
+    def _info(self, name, mode):
+        info = self._zipfile.ZipInfo(name, time.localtime()[:6])
+        info.external_attr = mode << 16
+        info.compress_type = self._zipfile.ZIP_DEFLATED
+        return info
+
+    def _added_dir(self, path):
+        name = self._arcname(path)
+        if name:
+            self._archive.writestr(self._info(name + '/', 0o40755), b'')
+
+    def _added_file(self, path, content):
+        name = self._arcname(path)
+        if name:
+            self._archive.writestr(self._info(name, 0o100644), content.encode('utf-8'))
+
+    def close(self):
+        with self._lock:
+            self._archive.close()
+
+
+class TarBackend(_ArchiveBackend):
+    """tar archive, written as a stream, i.e., each entry as soon as it is added
+
+    Args:
+        target (str or file): path of the archive to create, or a file object
+            opened for writing in binary mode, e.g., the standard output.
+            The standard output if not given.
+        root (str): directory the paths in the archive are relative to
+        compression (str): '', 'gz', 'bz2' or 'xz'
+
+    """
+    def __init__(self, target=None, root=None, compression=''):
+        import tarfile
+
+        super(TarBackend, self).__init__(root or os.getcwd())
+        if target is None:
+            target = getattr(sys.stdout, 'buffer', sys.stdout)  # python 3, 2
+        mode = 'w|' + compression
+        if hasattr(target, 'write'):
+            self._archive = tarfile.open(fileobj=target, mode=mode)
+        else:
+            self._archive = tarfile.open(target, mode=mode)
+        self._tarfile = tarfile
+
+    def _info(self, name, kind, mode, size=0):
+        info = self._tarfile.TarInfo(name)
+        info.type = kind
+        info.mode = mode
+        info.size = size
+        info.mtime = int(time.time())
+        return info
+
+    def _added_dir(self, path):
+        name = self._arcname(path)
+        if name:
+            self._archive.addfile(self._info(name, self._tarfile.DIRTYPE, 0o755))
+
+    def _added_file(self, path, content):
+        from io import BytesIO
+
+        name = self._arcname(path)
+        if name:
+            data = content.encode('utf-8')
+            info = self._info(name, self._tarfile.REGTYPE, 0o644, len(data))
+            self._archive.addfile(info, BytesIO(data))
+
+    def close(self):
+        with self._lock:
+            self._archive.close()
+
+
+def open_backend(output, root):
+    """create the backend writing to an output
+
+    Args:
+        output (str): where to write the project:
+
+            * None: the file system
+            * '-': a tar stream to the standard output
+            * ``*.zip``: a zip archive
+            * ``*.tar``, ``*.tar.gz``, ``*.tgz``, ``*.tar.bz2`` or ``*.tar.xz``:
+              a tar archive
+
+        root (str): directory the paths in an archive are relative to
+
+    Returns:
+        :class:`Backend`: the backend
+
+    Raises:
+        ValueError: if the type of the output is unknown
+
+    """
+    if not output:
+        return filesystem
+    if output == '-':
+        return TarBackend(root=root)
+
+    lower = output.lower()
+    if lower.endswith('.zip'):
+        return ZipBackend(output, root)
+    for suffixes, compression in ((('.tar',), ''),
+                                  (('.tar.gz', '.tgz'), 'gz'),
+                                  (('.tar.bz2', '.tbz2'), 'bz2'),
+                                  (('.tar.xz', '.txz'), 'xz')):
+        if lower.endswith(suffixes):
+            return TarBackend(output, root, compression)
+
+    raise ValueError("unknown type of output: '{}'".format(output))
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""This module offers :class:`DedupIndex` which lets identical files share their data
+
+When many projects are generated in one run, many files come out identical,
+e.g., ``LICENSE`` or ``docs/Makefile``. In the dedup mode, the first copy
+of each content is written as usual and indexed by its digest. The others are
+materialized out of the first one, instead of being written again:
+
+    * ``link``: as hard links, i.e., the files share the inode. Note that
+      editing one of them in place--rather than replacing it as *skelpy*
+      does--changes all of them.
+    * ``clone``: as reflinks, i.e., copy-on-write clones, by the ``FICLONE``
+      ioctl. Where not supported, :func:`os.copy_file_range` copies the data
+      in the kernel, which some file systems turn into a clone as well.
+
+Files are indexed per device, since neither can cross file systems.
+If a file can not be materialized, it is just written.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import errno
+import hashlib
+import threading
+
+from skelpy.utils.durability import temp_path, replace
+
+LINK = 'link'
+CLONE = 'clone'
+
+#: supported dedup modes
+MODES = (LINK, CLONE)
+
+#: ``FICLONE`` ioctl request of Linux, i.e., ``_IOW(0x94, 9, int)``
+FICLONE = 0x40049409
+
+
+def _stamp(path):
+    """get the (inode, size, mtime) of a file, or None if it does not exist"""
+
+    try:
+        st = os.stat(path)
+    except (IOError, OSError):
+        return None
+
+    return st.st_ino, st.st_size, st.st_mtime
+
+
+def _device(path):
+    """get the device of the directory which holds, or is to hold, a file"""
+
+    return os.stat(os.path.dirname(os.path.abspath(path))).st_dev
+
+
+def clone_file(src, dst, fsync=False):
+    """create a copy-on-write clone of a file
+
+    Args:
+        src (str): path of the file to clone
+        dst (str): path of the clone to create, which must not exist
+        fsync (bool): if True, sync the clone
+
+    Raises:
+        IOError or OSError: if the file system can clone neither by
+            ``FICLONE`` nor by :func:`os.copy_file_range`
+
+    """
+    with open(src, 'rb') as s:
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            try:
+                import fcntl
+                fcntl.ioctl(fd, FICLONE, s.fileno())
+            except (ImportError, IOError, OSError):
+                copy_file_range = getattr(os, 'copy_file_range', None)
+                if copy_file_range is None:  # python < 3.8, not Linux
+                    raise OSError(errno.EOPNOTSUPP, os.strerror(errno.EOPNOTSUPP), src)
+                size = os.fstat(s.fileno()).st_size
+                while size > 0:
+                    copied = copy_file_range(s.fileno(), fd, size)
+                    if copied == 0:
+                        raise OSError(errno.EIO, os.strerror(errno.EIO), src)
+                    size -= copied
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class DedupIndex(object):
+    """Process-wide index of the files written, by their content
+
+    Attributes:
+        hits (int): number of files materialized out of others
+        misses (int): number of files that had to be written
+
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        #: (digest, device) to (path, stamp) of the first file written
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(content, path):
+        return hashlib.sha1(content.encode('utf-8')).hexdigest(), _device(path)
+
+    def add(self, content, path):
+        """index a file just written, unless its content is indexed already
+
+        Args:
+            content (str): content of the file
+            path (str): path of the file
+
+        """
+        try:
+            key = self._key(content, path)
+        except (IOError, OSError):
+            return
+
+        stamp = _stamp(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if stamp and not (entry and _stamp(entry[0]) == entry[1]):
+                self._entries[key] = (os.path.abspath(path), stamp)
+
+    def materialize(self, content, path, mode, fsync=False):
+        """create a file out of an indexed file with the same content
+
+        The file is created under a temporary name, which then replaces *path*,
+        so the file is materialized atomically.
+
+        Args:
+            content (str): content of the file
+            path (str): path of the file
+            mode (str): one of :data:`MODES`
+            fsync (bool): if True, sync a clone
+
+        Returns:
+            bool: True if materialized, False if the file has to be written
+
+        """
+        try:
+            key = self._key(content, path)
+        except (IOError, OSError):
+            return False
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and _stamp(entry[0]) != entry[1]:
+                #: gone or changed since indexed
+                del self._entries[key]
+                entry = None
+            if not entry:
+                self.misses += 1
+                return False
+
+        src = entry[0]
+        tmp = temp_path(path)
+        try:
+            if mode == LINK:
+                os.link(src, tmp)
+            else:
+                clone_file(src, tmp, fsync)
+            replace(tmp, path)
+        except (IOError, OSError):
+            try:
+                os.remove(tmp)
+            except (IOError, OSError):
+                pass
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def moved(self, src_dir, dst_dir):
+        """re-point the files indexed under a directory which has been renamed
+
+        e.g., a staging directory published as the project directory. A rename
+        keeps the inodes, so the entries stay valid under the new paths.
+
+        Args:
+            src_dir (str): former path of the directory
+            dst_dir (str): new path of the directory
+
+        Returns:
+            int: number of entries re-pointed
+
+        """
+        src_dir = os.path.abspath(src_dir)
+        dst_dir = os.path.abspath(dst_dir)
+        moved = 0
+        with self._lock:
+            for key, (path, stamp) in list(self._entries.items()):
+                if path.startswith(src_dir + os.sep):
+                    self._entries[key] = (dst_dir + path[len(src_dir):], stamp)
+                    moved += 1
+
+        return moved
+
+    def clear(self):
+        """drop the index and reset the counters"""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+#: the process-wide dedup index
+dedup_index = DedupIndex()
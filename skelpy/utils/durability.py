@@ -0,0 +1,320 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""This module defines durability policies and :class:`SyncQueue` class
+
+A durability policy decides when the files and directories *skelpy* creates
+are synced to the disk:
+
+    * ``none``: never sync; leave it to the operating system
+    * ``batch``: sync everything once, at the end of the generation
+    * ``strict``: sync each file right after writing it (default)
+
+Files are written atomically by :func:`atomic_write`, i.e., into a temporary
+file which then replaces the target file, so a crash never leaves a truncated
+file behind. Directories holding replaced files are synced once each, at the
+end of the generation. Files already holding the content to write are not
+written at all--see :func:`same_content`.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+import hashlib
+import binascii
+import threading
+
+from skelpy.utils.trace import traced, SYNC
+
+NONE = 'none'
+BATCH = 'batch'
+STRICT = 'strict'
+
+#: supported durability policies
+POLICIES = (NONE, BATCH, STRICT)
+
+
+def fsync_path(path):
+    """sync a file or a directory by its path
+
+    Syncing a directory makes the entries in it--i.e., newly created
+    files and sub-directories--durable. Directories can not be synced
+    on Windows, in which case this function does nothing.
+
+    Args:
+        path (str): path of the file or the directory to sync
+
+    Returns:
+        bool: True if synced, False otherwise
+
+    """
+    flags = os.O_RDWR if sys.platform == 'win32' else os.O_RDONLY
+    try:
+        fd = os.open(path, flags)
+    except (IOError, OSError):
+        return False
+
+    try:
+        os.fsync(fd)
+    except (IOError, OSError):
+        return False
+    finally:
+        os.close(fd)
+
+    return True
+
+
+def replace(src, dst):
+    """rename *src* to *dst*, overwriting *dst* if it exists"""
+
+    try:
+        os.replace(src, dst)
+    except AttributeError:  # python 2.7
+        if sys.platform == 'win32' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+#: flag of renameat2(2) not to replace the target
+_RENAME_NOREPLACE = 1
+#: renameat2(2) of the C library, looked up on the first call; False if missing
+_renameat2 = None
+
+
+def _libc_renameat2():
+    """look up renameat2(2) of the C library
+
+    Returns:
+        callable or None: renameat2, or None if not available, e.g., not on Linux
+
+    """
+    global _renameat2
+
+    if _renameat2 is None:
+        _renameat2 = False
+        if sys.platform.startswith('linux'):
+            try:
+                import ctypes
+                func = ctypes.CDLL(None, use_errno=True).renameat2
+            except (ImportError, OSError, AttributeError):  # glibc < 2.28
+                pass
+            else:
+                func.argtypes = [ctypes.c_int, ctypes.c_char_p,
+                                 ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+                _renameat2 = func
+
+    return _renameat2 or None
+
+
+def rename_noreplace(src, dst):
+    """rename *src* to *dst*, failing if *dst* exists
+
+    Where available, renameat2(2) with ``RENAME_NOREPLACE`` checks and renames
+    atomically. Otherwise, *dst* is checked before renaming, and the rename
+    itself fails if a non-empty directory or, on Windows, anything shows up
+    at *dst* in between.
+
+    Args:
+        src (str): path to rename
+        dst (str): new path, which must not exist
+
+    Raises:
+        OSError: if failed to rename, with ``errno.EEXIST`` if *dst* exists
+
+    """
+    import errno
+
+    func = _libc_renameat2()
+    if func:
+        at_fdcwd = -100
+        fsencode = getattr(os, 'fsencode', str)  # python 2.7: already bytes
+        if func(at_fdcwd, fsencode(src), at_fdcwd, fsencode(dst), _RENAME_NOREPLACE) == 0:
+            return
+        import ctypes
+        err = ctypes.get_errno()
+        #: not supported by the kernel or the file system
+        if err not in (errno.ENOSYS, errno.EINVAL):
+            raise OSError(err, os.strerror(err), dst)
+
+    if os.path.lexists(dst):
+        raise OSError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno == errno.ENOTEMPTY:
+            raise OSError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+        raise
+
+
+def temp_path(path):
+    """get a path for a temporary file to replace a file with
+
+    The temporary file is a hidden sibling of the file, i.e., in the same file
+    system, so that it can replace the file atomically.
+
+    Args:
+        path (str): path of the file to replace
+
+    Returns:
+        str: path of the temporary file, which does not exist
+
+    """
+    dirname, basename = os.path.split(os.path.abspath(path))
+    return os.path.join(dirname, '.{}.{}.tmp'.format(
+        basename, binascii.hexlify(os.urandom(4)).decode('ascii')))
+
+
+def atomic_write(path, content, fsync=False):
+    """write a text file atomically
+
+    *content* is written into a temporary file in the same directory, which
+    then replaces *path*. Either the old or the new content is found at *path*
+    whenever the process is interrupted. The file keeps the permission bits of
+    the file it replaces. If *path* is a symbolic link, the file it points to
+    is replaced, and the link is left as it is.
+
+    Args:
+        path (str): path of the file to write
+        content (str): text to write
+        fsync (bool): if True, sync the temporary file before replacing *path*.
+            Note that the directory holding *path* is not synced.
+
+    Raises:
+        IOError or OSError: if failed to write, in which case *path* is untouched
+
+    """
+    #: the temporary file must be a sibling of the file the link points to
+    path = os.path.realpath(path)
+    tmp = temp_path(path)
+
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except (IOError, OSError):
+        mode = None
+
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            f = os.fdopen(fd, 'wt')
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp, mode)
+        replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except (IOError, OSError):
+            pass
+        raise
+
+
+def same_content(path, content):
+    """check if a file holds the given text already
+
+    The sizes are compared first, so the file is read only if they match.
+    Then the file is hashed chunk by chunk rather than read at once.
+
+    Args:
+        path (str): path of the file
+        content (str): text to write, as written in the text mode
+
+    Returns:
+        bool: True if *path* is a file whose bytes are those *content* would be
+        written as, False otherwise
+
+    """
+    data = content.encode('utf-8')
+    if os.linesep != '\n':  # newlines translated in the text mode
+        data = data.replace(b'\n', os.linesep.encode('ascii'))
+
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+    except (IOError, OSError):
+        return False
+
+    return digest.digest() == hashlib.sha1(data).digest()
+
+
+class SyncQueue(object):
+    """files and directories whose syncing is deferred
+
+    Used by the ``batch`` durability policy. Files are synced first, then
+    the directories holding them, each directory only once.
+
+    """
+    def __init__(self):
+        self._files = []
+        self._dirs = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._files) + len(self._dirs)
+
+    def add_file(self, path):
+        """queue a newly written file, and the directory holding it
+
+        Args:
+            path (str): path of the file
+
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            self._files.append(path)
+            self._dirs.add(os.path.dirname(path))
+
+    def add_entry(self, path):
+        """queue the directory holding a new or replaced file
+
+        Syncing the directory makes the file's directory entry durable.
+        The file itself is not synced.
+
+        Args:
+            path (str): path of the file
+
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            self._dirs.add(os.path.dirname(path))
+
+    def add_dir(self, path):
+        """queue a newly created directory, and its parent directory
+
+        Args:
+            path (str): path of the directory
+
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            self._dirs.add(path)
+            self._dirs.add(os.path.dirname(path))
+
+    @traced('SyncQueue.sync', SYNC)
+    def sync(self):
+        """sync all the queued files and directories and empty the queue
+
+        Returns:
+            int: number of files and directories synced
+
+        """
+        with self._lock:
+            files, self._files = self._files, []
+            dirs, self._dirs = self._dirs, set()
+
+        synced = [p for p in files if fsync_path(p)]
+        #: deeper directories first, so parents see their children's entries
+        synced += [d for d in sorted(dirs, reverse=True) if fsync_path(d)]
+
+        return len(synced)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""This module offers :func:`which` which finds an executable in ``$PATH``
+without running an external program
+
+:class:`ExecutableIndex` lists each directory in ``$PATH`` once and memoizes
+the results of lookups. Both are thrown away when ``$PATH`` or the modification
+time of a directory changes, e.g., when a program is installed.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+import threading
+
+
+def _is_executable(path):
+    """check if the path is an executable file"""
+
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _mtime(path):
+    """get the modification time of a directory, or None if it does not exist"""
+
+    try:
+        return os.stat(path).st_mtime
+    except (IOError, OSError):
+        return None
+
+
+class ExecutableIndex(object):
+    """Process-wide index of the executables in ``$PATH``
+
+    Attributes:
+        hits (int): number of lookups served from the memo
+        misses (int): number of lookups that had to search the index
+
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        #: directory to (mtime, names in the directory)
+        self._dirs = {}
+        #: (``$PATH``, mtimes of its directories) the memo is valid for
+        self._state = None
+        #: command to its path, or None if not found
+        self._memo = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _path_dirs():
+        """list the directories in ``$PATH``, in order and without duplicates"""
+
+        dirs = []
+        for d in os.environ.get('PATH', os.defpath).split(os.pathsep):
+            d = d.strip('"') or os.curdir
+            if d not in dirs:
+                dirs.append(d)
+
+        return dirs
+
+    @staticmethod
+    def _candidates(cmd):
+        """file names the command may have, i.e., with ``$PATHEXT`` on Windows"""
+
+        if sys.platform != 'win32':
+            return [cmd]
+
+        exts = os.environ.get('PATHEXT', '.COM;.EXE;.BAT;.CMD').lower().split(os.pathsep)
+        if os.path.splitext(cmd)[1].lower() in exts:
+            return [cmd.lower()]
+
+        return [(cmd + ext).lower() for ext in exts if ext]
+
+    def _refresh(self):
+        """re-list the directories whose modification time changed
+
+        Must be called with the lock held.
+
+        Returns:
+            list: (directory, names in it) for each directory in ``$PATH``
+
+        """
+        path = os.environ.get('PATH', os.defpath)
+        listing = []
+        mtimes = []
+        for d in self._path_dirs():
+            mtime = _mtime(d)
+            entry = self._dirs.get(d)
+            if entry is None or entry[0] != mtime:
+                try:
+                    names = os.listdir(d) if mtime is not None else []
+                except (IOError, OSError):
+                    names = []
+                if sys.platform == 'win32':
+                    names = [n.lower() for n in names]
+                entry = self._dirs[d] = (mtime, frozenset(names))
+            listing.append((d, entry[1]))
+            mtimes.append(mtime)
+
+        state = (path, tuple(mtimes))
+        if state != self._state:
+            self._state = state
+            self._memo.clear()
+
+        return listing
+
+    def which(self, cmd):
+        """find the path of a command
+
+        Args:
+            cmd (str): command name, or a path to the command
+
+        Returns:
+            str or None: path of the executable if found, otherwise None
+
+        """
+        if os.path.dirname(cmd):
+            return cmd if _is_executable(cmd) else None
+
+        with self._lock:
+            listing = self._refresh()
+            if cmd in self._memo:
+                self.hits += 1
+                return self._memo[cmd]
+            self.misses += 1
+
+            found = None
+            candidates = self._candidates(cmd)
+            for d, names in listing:
+                for name in candidates:
+                    if name in names and _is_executable(os.path.join(d, name)):
+                        found = os.path.join(d, name)
+                        break
+                if found:
+                    break
+            self._memo[cmd] = found
+
+        return found
+
+    def clear(self):
+        """drop the index and the memo, and reset the counters"""
+
+        with self._lock:
+            self._dirs.clear()
+            self._memo.clear()
+            self._state = None
+            self.hits = 0
+            self.misses = 0
+
+
+#: the process-wide executable index
+executable_index = ExecutableIndex()
+
+
+def which(cmd):
+    """find the path of a command in ``$PATH`` like ``which``--``where`` on Windows
+
+    Args:
+        cmd (str): command name, or a path to the command
+
+    Returns:
+        str or None: path of the executable if found, otherwise None
+
+    """
+    return executable_index.which(cmd)
@@ -7,6 +7,8 @@ from __future__ import print_function, absolute_import
 import sys
 import os
 
+from skelpy.utils.trace import traced, PROCESS
+
 
 def is_valid_identifier(string):
     """Check if the string is a valid project/package name.
@@ -38,28 +40,21 @@ def is_valid_identifier(string):
     return True
 
 
+@traced('has_command', PROCESS, arg=0, key='command')
 def has_command(cmd):
     """Check if the given command is available on the system
 
+    The command is looked up in the process-wide index of ``$PATH``, see
+    :mod:`skelpy.utils.executables`, so no external program is run.
+
     Args:
         cmd (str): command to check
     Returns:
         bool: True if available, otherwise False
     """
+    from skelpy.utils.executables import which
 
-    import subprocess
-
-    try:
-        from subprocess import DEVNULL
-    except ImportError:
-        DEVNULL = open(os.devnull, 'wb')
-
-    if sys.platform == 'win32':
-        checker = 'where'
-    else:  # linux, OSX, cygwin
-        checker = 'which'
-
-    return not bool(subprocess.call([checker, cmd], stdout=DEVNULL, stderr=DEVNULL))
+    return which(cmd) is not None
 
 
 def has_module(modName):
@@ -78,106 +73,36 @@ def has_module(modName):
     return modName in (name for loader, name, ispkg in iter_modules())
 
 
-def get_gitConfig():
-    """read ``.gitconfig`` file in the user's ``$HOME`` directory, if exists
-
-    Returns:
-        :class:`ConfigParser` or None: ConfigParser object filled with info
-        read from ``.gitconfig``
-
-    """
-    import errno
-    try:
-        from configparser import ConfigParser
-    except ImportError:
-        from ConfigParser import ConfigParser
-
-    home = 'HOMEPATH' if sys.platform == 'win32' else 'HOME'
-    git_config_file = os.path.join(os.environ[home], '.gitconfig')
-    try:
-        with open(git_config_file, 'r') as f:
-            data = f.readlines()
-    except (IOError, OSError) as e:   # no .gitconfig
-        if e.errno == errno.ENOENT:
-            return None
-
-    try:
-        from StringIO import StringIO  # python 2
-    except ImportError:
-        from io import StringIO  # python 3
-
-    # white space on the left side hinders ConfigParse's parsing
-    stripped_data = ''.join([line.lstrip() for line in data])
-    fp = StringIO(stripped_data)
-    gitConfig = ConfigParser()
-    if sys.version_info[0] == 2:
-        gitConfig.readfp(fp)
-    else:
-        gitConfig.read_file(fp)
-
-    return gitConfig
-
-
 def get_userName():
-    """read the user's name from ``.gitconfig`` file in the ``$HOME`` directory or
+    """read the user's name from git's global configuration files or
     the environmental variable ``USER``
 
+    The name is served from the process-wide identity cache, see
+    :mod:`skelpy.utils.identity`.
+
     Returns:
         str: user's name
 
     """
-    try:
-        from configparser import NoOptionError
-    except ImportError:
-        from ConfigParser import NoOptionError
+    from skelpy.utils.identity import get_identity
 
-    name = ''
-
-    # first, try .gitconfig
-    gitConfig = get_gitConfig()
-    if gitConfig:
-        try:
-            name = gitConfig.get('user', 'name')
-        except (KeyError, NoOptionError):
-            pass
-
-    # if fail, try environment variables
-    if not name:
-        user = 'USERNAME' if sys.platform == 'win32' else 'USER'
-        name = os.environ.get(user, '')
-
-    return name
+    return get_identity().name
 
 
 def get_email():
-    """read the user's name from ``.gitconfig`` file in the ``$HOME`` directory.
+    """read the user's email address from git's global configuration files.
 
-    If ``.gitconfig`` file does not exist, this function improvises an email
-    address by concatenating user's name and host name.
+    If not found, this function improvises an email address by concatenating
+    user's name and host name. The address is served from the process-wide
+    identity cache, see :mod:`skelpy.utils.identity`.
 
     Returns:
         str: user's email address
 
     """
-    from six.moves.configparser import NoOptionError
-
-    email = ''
-
-    gitConfig = get_gitConfig()
-    if gitConfig:
-        try:
-            email = gitConfig.get('user', 'email')
-        except (KeyError, NoOptionError):
-            pass
+    from skelpy.utils.identity import get_identity
 
-    # if not successful, we improvise
-    if not email:
-        import socket
-        user = get_userName()
-        host = socket.gethostname()
-        email = "{user}@{host}".format(user=user, host=host)
-
-    return email
+    return get_identity().email
 
 
 def get_python_version(short=False):
@@ -268,7 +193,49 @@ def remove_comment_lines_in_file(oldFile, newFile=None):
         os.fsync(f.fileno())
 
 
-def read_setup_cfg(cfg_file):
+def read_info_file(info_file):
+    """read a project information file, i.e., the format of ``info.tpl``
+
+    The file has ``[Project]`` and ``[Author]`` sections, e.g.::
+
+        [Project]
+        description = a short description
+        license = GPL3
+
+        [Author]
+        author = dks
+
+    Args:
+        info_file (str): path of the file
+
+    Returns:
+        dict or None: the fields of all the sections if successful, otherwise None
+
+    """
+    try:
+        from configparser import RawConfigParser  # python3
+    except ImportError:
+        from ConfigParser import RawConfigParser  # python2
+
+    #: no interpolation, so that values may contain '%'
+    parser = RawConfigParser()
+    try:
+        with open(info_file, 'r') as f:
+            if sys.version_info[0] == 2:
+                parser.readfp(f)
+            else:
+                parser.read_file(f)
+    except Exception:
+        return None
+
+    info = {}
+    for section in parser.sections():
+        info.update(parser.items(section))
+
+    return info
+
+
+def read_setup_cfg(cfg_file, text=None):
     """read ``setup.cfg`` file
 
     ``cfg_file`` may contain a path
@@ -279,6 +246,8 @@ def read_setup_cfg(cfg_file):
 
     Args:
         cfg_file (str): path of ``setup.cfg`` file
+        text (str): content of the file if already read, e.g., from an output
+            backend. The file is not read then.
 
     Returns:
         dict: information read from the setup.cfg file  if successful, otherwise an empty dict.
@@ -295,18 +264,20 @@ def read_setup_cfg(cfg_file):
         from io import StringIO  # python 3
 
     try:
-        from configparser import ConfigParser  # python3
+        from configparser import RawConfigParser  # python3
     except ImportError:
-        from ConfigParser import ConfigParser  # python2
+        from ConfigParser import RawConfigParser  # python2
 
-    try:
-        with open(cfg_file, 'r') as f:
-            data = f.read()
-            content = StringIO(remove_comment_lines_in_str(data))
-    except IOError:
-        return conf_dict
-
-    parser = ConfigParser()
+    if text is None:
+        try:
+            with open(cfg_file, 'r') as f:
+                text = f.read()
+        except IOError:
+            return conf_dict
+    content = StringIO(remove_comment_lines_in_str(text))
+
+    #: no interpolation, so that values may contain '%'
+    parser = RawConfigParser()
     if sys.version_info[0] == 2:
         parser.readfp(content)
     else:
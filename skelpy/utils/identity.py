@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""This module resolves the user's identity, i.e., the name and the email address
+
+The identity is read from git's global configuration files, as git does:
+
+    * ``$XDG_CONFIG_HOME/git/config``--``~/.config/git/config`` if
+      ``$XDG_CONFIG_HOME`` is not set
+    * ``~/.gitconfig``, whose values take precedence
+    * files included by ``include.path`` of the files above, recursively
+
+If a value is not found, the environment variable ``USER``--``USERNAME`` on
+Windows--gives the name, and the email address is improvised out of the name
+and the host name.
+
+The identity is resolved in one pass and cached for the lifetime of the process.
+:class:`IdentityCache` resolves it again only when any of the files read--or
+the environment variables involved--change.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+import threading
+from collections import namedtuple
+
+Identity = namedtuple('Identity', ['name', 'email'])
+
+#: how deep ``include.path`` is followed, as git does
+MAX_INCLUDE_DEPTH = 10
+
+
+def _user_env():
+    """name of the environment variable holding the user's name"""
+
+    return 'USERNAME' if sys.platform == 'win32' else 'USER'
+
+
+def _config_files():
+    """list git's global configuration files, in the order git reads them
+
+    Returns:
+        list: paths of the files, existing or not
+
+    """
+    xdg_home = os.environ.get('XDG_CONFIG_HOME') or os.path.join('~', '.config')
+    files = [os.path.join(xdg_home, 'git', 'config'),
+             os.path.join('~', '.gitconfig')]
+
+    return [os.path.expanduser(f) for f in files]
+
+
+def _stamp(path):
+    """get the (mtime, size) pair of a file, or None if it does not exist"""
+
+    try:
+        st = os.stat(path)
+    except (IOError, OSError):
+        return None
+
+    return st.st_mtime, st.st_size
+
+
+def _unquote(value):
+    """strip the inline comment and the double quotes of a git config value"""
+
+    result = []
+    quoted = False
+    i = 0
+    while i < len(value):
+        c = value[i]
+        if c == '\\' and i + 1 < len(value):
+            i += 1
+            result.append({'n': '\n', 't': '\t'}.get(value[i], value[i]))
+        elif c == '"':
+            quoted = not quoted
+        elif c in '#;' and not quoted:
+            break
+        else:
+            result.append(c)
+        i += 1
+
+    return ''.join(result).strip()
+
+
+def parse_git_config(text):
+    """parse the text of a git configuration file
+
+    Only what the identity needs is supported, i.e., sections, sub-sections
+    and single-line ``key = value`` pairs. Unlike :class:`ConfigParser`,
+    keys may occur many times and leading white space is allowed.
+
+    Args:
+        text (str): content of the file
+
+    Yields:
+        tuple: (section, key, value). Section and key are lowercase,
+        and the sub-section, if any, is joined to the section with a dot,
+        e.g., ``('includeif.gitdir:~/work/', 'path', '...')``.
+
+    """
+    section = ''
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in '#;':
+            continue
+
+        if line.startswith('['):
+            header = line[1:line.find(']')] if ']' in line else line[1:]
+            name, _, sub = header.partition(' ')
+            section = name.strip().lower()
+            sub = sub.strip().strip('"')
+            if sub:
+                section += '.' + sub
+            continue
+
+        key, sep, value = line.partition('=')
+        key = key.strip().lower()
+        #: a key without a value means true
+        yield section, key, _unquote(value) if sep else 'true'
+
+
+class IdentityCache(object):
+    """Process-wide cache of the user's identity
+
+    The entry is a pair of the stamps of everything the identity was resolved
+    from--the files read and the environment variables--and the identity.
+    The entry is reused as long as the stamps do not change.
+
+    Attributes:
+        hits (int): number of lookups served from the cache
+        misses (int): number of lookups that had to resolve the identity
+
+    """
+    def __init__(self):
+        self._entry = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _environ():
+        """the environment variables the identity depends on"""
+
+        return tuple(os.environ.get(var) for var in
+                     ('HOME', 'USERPROFILE', 'XDG_CONFIG_HOME', _user_env()))
+
+    def get(self):
+        """get the user's identity
+
+        Returns:
+            :class:`Identity`: name and email address, which may be empty strings
+
+        """
+        environ = self._environ()
+        with self._lock:
+            entry = self._entry
+            if entry and entry[0] == environ and \
+                    all(_stamp(path) == stamp for path, stamp in entry[1]):
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        stamps = []
+        identity = self._resolve(stamps)
+        with self._lock:
+            self._entry = (environ, tuple(stamps), identity)
+
+        return identity
+
+    def clear(self):
+        """drop the cached identity and reset the counters"""
+
+        with self._lock:
+            self._entry = None
+            self.hits = 0
+            self.misses = 0
+
+    def _resolve(self, stamps):
+        """resolve the user's identity
+
+        Args:
+            stamps (list): (path, stamp) of every file looked at is appended
+
+        Returns:
+            :class:`Identity`: the identity
+
+        """
+        values = {}
+        for path in _config_files():
+            self._read(path, values, stamps, 0)
+
+        name = values.get('name') or os.environ.get(_user_env(), '')
+        email = values.get('email')
+        if not email:
+            import socket
+            email = "{user}@{host}".format(user=name, host=socket.gethostname())
+
+        return Identity(name, email)
+
+    def _read(self, path, values, stamps, depth):
+        """read ``user.name`` and ``user.email`` out of a git configuration file
+
+        Files given by ``include.path`` are read in place, so values after
+        the include take precedence over those in the included file.
+
+        Args:
+            path (str): path of the file
+            values (dict): name and email found so far, updated in place
+            stamps (list): (path, stamp) of the file is appended
+            depth (int): depth of inclusion
+
+        """
+        stamps.append((path, _stamp(path)))
+        try:
+            with open(path, 'rb') as f:
+                text = f.read().decode('utf-8', 'replace')
+        except (IOError, OSError):
+            return
+
+        for section, key, value in parse_git_config(text):
+            if section == 'user' and key in ('name', 'email'):
+                values[key] = value
+            elif section == 'include' and key == 'path' and value \
+                    and depth < MAX_INCLUDE_DEPTH:
+                included = os.path.expanduser(value)
+                #: relative paths are relative to the including file
+                included = os.path.join(os.path.dirname(path), included)
+                self._read(os.path.normpath(included), values, stamps, depth + 1)
+
+
+#: the process-wide identity cache
+identity_cache = IdentityCache()
+
+
+def get_identity():
+    """get the user's identity from the process-wide cache
+
+    Returns:
+        :class:`Identity`: name and email address
+
+    """
+    return identity_cache.get()
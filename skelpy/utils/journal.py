@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""This module defines :class:`Journal` class which makes a generation transactional
+
+While a project is generated, every directory created, every file created and
+the pre-image--i.e., a backup copy--of every file overwritten is recorded
+in the journal, ``.skelpy-journal`` in the project directory, before the change
+is made.
+
+    * If the generation fails, :meth:`Journal.rollback` undoes all the changes
+      recorded, so no half-built project is left behind.
+    * If the generation succeeds, :meth:`Journal.commit` removes the journal.
+    * If the process dies halfway, e.g., killed or powered off, the journal
+      remains. The next run on the same project resumes from it: the paths
+      recorded belong to the generation--i.e., neither ``--merge`` nor
+      ``--force`` is needed for them--and files already written with the same
+      content are not written again.
+
+The journal is a text file of JSON records, one per line. It is kept open
+for the whole generation, and each record is flushed as soon as it is added.
+Under the ``strict`` durability policy, the records of the directories and the
+files created, and of the pre-images, are synced before the changes are made.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+
+from skelpy.utils.durability import fsync_path, replace
+
+#: file name of the journal, in the project directory
+JOURNAL_FILE = '.skelpy-journal'
+
+#: record types
+MKDIR = 'mkdir'
+CREATE = 'create'
+BACKUP = 'backup'
+WRITTEN = 'written'
+
+
+def digest(content):
+    """digest of the content of a file, to tell if a file needs writing again
+
+    Args:
+        content (str): content of the file
+
+    Returns:
+        str: hexadecimal digest
+
+    """
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+class Journal(object):
+    """journal of the changes a generation makes on the file system
+
+    Args:
+        projectDir (str): project directory, where the journal is kept
+        sync (bool): if True, the records of the directories and the files
+            created, and the pre-images and their records, are synced to the disk
+            before the changes are made
+
+    Attributes:
+        path (str): path of the journal file
+        resumed (bool): True if the journal of an interrupted generation is found
+
+    """
+    def __init__(self, projectDir, sync=False):
+        self.path = os.path.join(os.path.abspath(projectDir), JOURNAL_FILE)
+        self.sync = sync
+        self._lock = threading.Lock()
+        #: the journal file, opened on the first record
+        self._file = None
+        self._records = self._load()
+        self.resumed = bool(self._records)
+        #: path to its pre-image, or to None if created by the generation
+        self._owned = {}
+        #: path to the digest of the content written
+        self._written = {}
+        for record in self._records:
+            self._apply(record)
+
+    def _load(self):
+        """read the records of an interrupted generation, if any"""
+
+        records = []
+        try:
+            with open(self.path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:  # torn write of the last record
+                        break
+                    if isinstance(record, dict) and 'op' in record:
+                        records.append(record)
+        except (IOError, OSError):
+            pass
+
+        return records
+
+    def _apply(self, record):
+        """update the state by a record"""
+
+        path = record['path']
+        if record['op'] in (MKDIR, CREATE):
+            self._owned.setdefault(path, None)
+        elif record['op'] == BACKUP:
+            self._owned.setdefault(path, record['backup'])
+        elif record['op'] == WRITTEN:
+            self._written[path] = record.get('digest')
+
+    def _append(self, record, sync=False):
+        """add a record to the journal, creating the journal file if needed
+
+        Must be called with the lock held.
+
+        """
+        if self._file is None:
+            self._file = open(self.path, 'a')
+        self._file.write(json.dumps(record, sort_keys=True) + '\n')
+        #: flushed, so that the record survives the process being killed
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+        self._records.append(record)
+        self._apply(record)
+
+    def owns(self, path):
+        """check if the path was created--or its pre-image saved--by the generation
+
+        Args:
+            path (str): path of a file or a directory
+
+        Returns:
+            bool
+
+        """
+        with self._lock:
+            return os.path.abspath(path) in self._owned
+
+    def is_written(self, path, content):
+        """check if the file has already been written with the content
+
+        Args:
+            path (str): path of the file
+            content (str): content to write
+
+        Returns:
+            bool: True if the file needs not writing again
+
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            written = self._written.get(path)
+        return written == digest(content) and os.path.isfile(path)
+
+    def created_dir(self, path):
+        """record a directory created
+
+        Args:
+            path (str): path of the directory. If intermediate directories were
+                created as well, the top-most one.
+
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            if path not in self._owned:
+                self._append({'op': MKDIR, 'path': path}, self.sync)
+
+    def before_write(self, path):
+        """record a file about to be written
+
+        If the file exists, its pre-image is saved first. Files created--or
+        whose pre-images are saved--by the generation are not recorded again.
+
+        Args:
+            path (str): path of the file
+
+        Raises:
+            IOError or OSError: if failed to save the pre-image
+
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            if path in self._owned:
+                return
+            if not os.path.exists(path):
+                self._append({'op': CREATE, 'path': path}, self.sync)
+                return
+
+            backup_dir = self.path + '.d'
+            if not os.path.isdir(backup_dir):
+                os.mkdir(backup_dir)
+            backup = os.path.join(backup_dir, str(len(self._records)))
+            shutil.copy2(path, backup)
+            if self.sync:
+                fsync_path(backup)
+            self._append({'op': BACKUP, 'path': path, 'backup': backup}, self.sync)
+
+    def written(self, path, content):
+        """record a file written
+
+        Args:
+            path (str): path of the file
+            content (str): content written
+
+        """
+        with self._lock:
+            self._append({'op': WRITTEN, 'path': os.path.abspath(path),
+                          'digest': digest(content)})
+
+    def commit(self):
+        """finish the generation, i.e., remove the journal"""
+
+        with self._lock:
+            self._remove()
+
+    def rollback(self):
+        """undo all the changes recorded, newest first, and remove the journal
+
+        Returns:
+            int: number of changes undone
+
+        """
+        undone = 0
+        with self._lock:
+            for record in reversed(self._records):
+                path = record['path']
+                try:
+                    if record['op'] == MKDIR:
+                        shutil.rmtree(path)
+                    elif record['op'] == CREATE:
+                        os.remove(path)
+                    elif record['op'] == BACKUP:
+                        replace(record['backup'], path)
+                    else:
+                        continue
+                except (IOError, OSError):
+                    continue
+                undone += 1
+            self._remove()
+
+        return undone
+
+    def _remove(self):
+        """remove the journal file and the pre-images"""
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        for path in (self.path, self.path + '.d'):
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            elif os.path.exists(path):
+                os.remove(path)
+        self._records = []
+        self._owned = {}
+        self._written = {}
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""This module defines :class:`Manifest` class which records how a project was generated
+
+The manifest, ``.skelpy/manifest.json`` in the project directory, holds:
+
+    * ``files``: for each file generated--by its path relative to the project
+      directory--the template it came from, the digest of the template,
+      the digest of the values the template was rendered with, and the digest
+      of the content written
+    * ``settings``: the options and the project information the project was
+      generated with, e.g., ``format`` or ``description``, so that the project
+      can be rendered again the same way. Values derived from them, such as
+      the absolute paths of the directories, are not recorded, so the manifest
+      stays valid when the project is moved.
+
+With the manifest, ``skelpy update`` renders again only the files whose
+template or values have changed, and leaves alone the files modified since
+they were generated.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import json
+import threading
+
+from skelpy.utils.journal import digest
+
+#: directory of the manifest, in the project directory
+MANIFEST_DIR = '.skelpy'
+#: file name of the manifest
+MANIFEST_FILE = 'manifest.json'
+#: version of the manifest format
+VERSION = 1
+
+
+def template_digest(template):
+    """digest of a template
+
+    Args:
+        template (:obj:`string.Template`): template
+
+    Returns:
+        str: hexadecimal digest
+
+    """
+    return digest(template.template)
+
+
+def values_digest(values):
+    """digest of the values a template is rendered with
+
+    Args:
+        values (dict): placeholder to value
+
+    Returns:
+        str: hexadecimal digest
+
+    """
+    return digest(json.dumps(values, sort_keys=True, default=str))
+
+
+def _plain(value):
+    """check if a value can be stored in the manifest as is"""
+
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+class Manifest(object):
+    """manifest of a project
+
+    Args:
+        projectDir (str): project directory
+        files (dict): relative path to its entry, i.e., a dict with ``template``,
+            ``template_digest``, ``values_digest`` and ``content_digest``
+        settings (dict): options and project information the project was
+            generated with
+
+    Attributes:
+        path (str): path of the manifest file
+        files (dict): relative path to its entry
+        settings (dict): options and project information the project was
+            generated with
+        updating (bool): True while ``skelpy update`` runs, when files whose
+            template and values have not changed are not rendered at all
+        keep_modified (bool): whether files modified since generated are
+            left alone when updating
+
+    """
+    def __init__(self, projectDir, files=None, settings=None):
+        self.projectDir = os.path.abspath(projectDir)
+        self.path = os.path.join(self.projectDir, MANIFEST_DIR, MANIFEST_FILE)
+        self.files = dict(files or {})
+        self.settings = dict(settings or {})
+        self.updating = False
+        self.keep_modified = True
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, projectDir):
+        """read the manifest of a project
+
+        Args:
+            projectDir (str): project directory
+
+        Returns:
+            :class:`Manifest` or None: the manifest, or None if the project has
+            no valid manifest
+
+        """
+        manifest = cls(projectDir)
+        try:
+            with open(manifest.path, 'r') as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != VERSION:
+            return None
+
+        manifest.files = dict(data.get('files') or {})
+        manifest.settings = dict(data.get('settings') or {})
+        return manifest
+
+    def relpath(self, path):
+        """get the path of a file relative to the project directory
+
+        Args:
+            path (str): path of the file
+
+        Returns:
+            str or None: relative path with '/' as the separator, or None if
+            the file is not in the project directory
+        """
+        path = os.path.abspath(path)
+        if not path.startswith(self.projectDir + os.sep):
+            return None
+
+        return path[len(self.projectDir) + 1:].replace(os.sep, '/')
+
+    def lookup(self, path):
+        """get the entry of a file
+
+        Args:
+            path (str): path of the file
+
+        Returns:
+            dict or None: the entry, or None if the file is not recorded
+        """
+        rel = self.relpath(path)
+        with self._lock:
+            return self.files.get(rel) if rel else None
+
+    def is_current(self, path, template, values):
+        """check if a file was rendered from the same template and values
+
+        Args:
+            path (str): path of the file
+            template (:obj:`string.Template`): template to render
+            values (dict): values to render the template with
+
+        Returns:
+            bool: True if rendering the file again would give the same content
+        """
+        entry = self.lookup(path)
+        return bool(entry) \
+            and entry.get('template_digest') == template_digest(template) \
+            and entry.get('values_digest') == values_digest(values)
+
+    def is_modified(self, path):
+        """check if a file was modified since it was generated
+
+        Files not recorded in the manifest are taken as modified, i.e., as
+        the user's own files.
+
+        Args:
+            path (str): path of an existing file
+
+        Returns:
+            bool
+        """
+        entry = self.lookup(path)
+        if not entry:
+            return True
+
+        try:
+            with open(path, 'rb') as f:
+                content = f.read().decode('utf-8').replace(os.linesep, '\n')
+        except (IOError, OSError, ValueError):
+            return True
+
+        return digest(content) != entry.get('content_digest')
+
+    def record(self, path, name, template, values, content):
+        """record a file generated
+
+        Args:
+            path (str): path of the file
+            name (str or None): name of the template file, if any
+            template (:obj:`string.Template`): template rendered
+            values (dict): values the template was rendered with
+            content (str): content written
+
+        """
+        rel = self.relpath(path)
+        if not rel or rel.split('/')[0] == MANIFEST_DIR:
+            return
+
+        entry = {
+            'template': name,
+            'template_digest': template_digest(template),
+            'values_digest': values_digest(values),
+            'content_digest': digest(content),
+        }
+        with self._lock:
+            self.files[rel] = entry
+
+    def record_settings(self, values):
+        """record values the project was generated with, e.g., the options
+
+        Args:
+            values (dict): name to value
+
+        """
+        with self._lock:
+            self.settings.update((k, v) for k, v in values.items() if _plain(v))
+
+    def dumps(self):
+        """serialize the manifest
+
+        Returns:
+            str: JSON text
+        """
+        with self._lock:
+            data = {'version': VERSION, 'files': self.files, 'settings': self.settings}
+            return json.dumps(data, indent=2, sort_keys=True) + '\n'
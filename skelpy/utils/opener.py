@@ -12,6 +12,8 @@ import sys
 import subprocess
 
 from .helpers import has_command
+from .executables import which
+from .trace import traced, PROCESS
 
 
 def _byte2str(binary_str):
@@ -280,6 +282,7 @@ def _get_associated_application_cygwin(filePath):
 
 
 #: For the compatibility with python 2.7, we do not use keyword-only arguments here.
+@traced('open_with_associated_application', PROCESS, arg=0)
 def open_with_associated_application(filePath, block=False, *args):
     """Open the file with the associated application using the *"general-purpose opener"* program.
 
@@ -377,7 +380,7 @@ def open_with_associated_application(filePath, block=False, *args):
             """
             # if file name only
             if '\\' not in path and '/' not in path:
-                path = _byte2str(subprocess.check_output(['which', path]))
+                path = which(path) or path
                 if path.startswith('/cygdrive'):
                     return 'windows'
                 else:
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""This module defines :class:`Report` class which tallies the files a run writes
+
+Every file :meth:`skelpy.makers.base.BaseMaker.write_file` is asked for ends up
+in one of the following:
+
+    * ``created``: the file did not exist
+    * ``overwritten``: the file existed and was written with new content
+    * ``unchanged``: the file existed with the same content, so was not written
+    * ``skipped``: the file existed and was not overwritten, i.e., no ``--force``
+
+The report also tallies the bytes written and how long each *Maker* took.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import threading
+
+CREATED = 'created'
+OVERWRITTEN = 'overwritten'
+UNCHANGED = 'unchanged'
+SKIPPED = 'skipped'
+
+#: outcomes of a file, in the order they are reported
+OUTCOMES = (CREATED, OVERWRITTEN, UNCHANGED, SKIPPED)
+
+
+class Report(object):
+    """outcomes of the files of a run
+
+    Attributes:
+        files (dict): outcome to the paths of the files, in the order added
+        bytes_written (int): total size of the files created or overwritten
+        timings (dict): *Maker* name to the seconds it took
+
+    """
+    def __init__(self):
+        self.files = dict((outcome, []) for outcome in OUTCOMES)
+        self.bytes_written = 0
+        self.timings = {}
+        self._lock = threading.Lock()
+
+    def add(self, outcome, path, size=0):
+        """record the outcome of a file
+
+        Args:
+            outcome (str): one of :data:`OUTCOMES`
+            path (str): path of the file
+            size (int): number of bytes written
+
+        """
+        with self._lock:
+            self.files[outcome].append(path)
+            self.bytes_written += size
+
+    def add_timing(self, name, seconds):
+        """record how long a *Maker* took
+
+        Args:
+            name (str): name of the *Maker*
+            seconds (float): elapsed time
+
+        """
+        with self._lock:
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def count(self, outcome):
+        """number of the files with the outcome
+
+        Args:
+            outcome (str): one of :data:`OUTCOMES`
+
+        Returns:
+            int
+
+        """
+        with self._lock:
+            return len(self.files[outcome])
+
+    def summary(self):
+        """one-line summary, e.g., ``8 created, 0 overwritten, 2 unchanged, 0 skipped``
+
+        Returns:
+            str
+
+        """
+        return ', '.join('{} {}'.format(self.count(outcome), outcome)
+                         for outcome in OUTCOMES)
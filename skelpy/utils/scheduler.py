@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""This module offers :func:`run_graph` which runs interdependent jobs
+concurrently in a thread pool.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import sys
+from multiprocessing.pool import ThreadPool
+
+try:
+    from queue import Queue  # python 3
+except ImportError:
+    from Queue import Queue  # python 2
+
+
+def run_graph(jobs, dependencies, workers=None):
+    """run jobs concurrently, each one after the jobs it depends on
+
+    A job starts as soon as all the jobs it depends on have succeeded,
+    so the wall-clock time is dominated by the longest chain of dependencies
+    rather than by the sum of all jobs.
+
+    Like a chain of ``if not job(): return False``, this function fails fast:
+    once a job fails--i.e., returns a false value or raises--no more jobs
+    are started. Jobs already running are waited for, though.
+
+    Args:
+        jobs (list): (name, callable) pairs. Callables take no argument and
+            return True if successful. Jobs ready at the same time are started
+            in this order.
+        dependencies (dict): job name to the names of the jobs it depends on.
+            Dependencies on names not in *jobs* are ignored.
+        workers (int): number of threads. One thread per job if not given.
+
+    Returns:
+        bool: True if all jobs succeed, False otherwise
+
+    Raises:
+        ValueError: if the dependencies are circular
+        Exception: the first exception raised by a job, if any
+
+    """
+    order = [name for name, _ in jobs]
+    funcs = dict(jobs)
+    waiting = dict((name, set(dependencies.get(name, ())) & set(order))
+                   for name in order)
+    if not order:
+        return True
+
+    done = Queue()
+
+    def _call(name):
+        try:
+            result = bool(funcs[name]())
+        except BaseException:
+            done.put((name, False, sys.exc_info()))
+        else:
+            done.put((name, result, None))
+
+    pool = ThreadPool(workers or len(order))
+    running = 0
+    ok = True
+    exc_info = None
+    try:
+        while True:
+            if ok:
+                for name in [n for n in order if n in waiting and not waiting[n]]:
+                    del waiting[name]
+                    pool.apply_async(_call, (name,))
+                    running += 1
+            if not running:
+                break
+
+            name, result, error = done.get()
+            running -= 1
+            if error:
+                exc_info = exc_info or error
+                ok = False
+            elif not result:
+                ok = False
+            else:
+                for deps in waiting.values():
+                    deps.discard(name)
+    finally:
+        pool.close()
+        pool.join()
+
+    if exc_info:
+        raise exc_info[1]
+    if ok and waiting:
+        raise ValueError(
+            "circular dependencies among: {}".format(', '.join(sorted(waiting))))
+
+    return ok
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""This module offers :class:`Tracer` which records where a run spends its time
+
+A span is a named interval of time, e.g., a call of
+:meth:`~skelpy.makers.base.BaseMaker.write_file`. While :attr:`Tracer.enabled`
+is False--the default--, spans cost a single attribute lookup and nothing is
+recorded. Spans are recorded for:
+
+    * ``generate``, ``create_dir`` and ``write_file`` of every *Maker*--see
+      :class:`~skelpy.makers.base.MakerMeta`--, with the path as an argument
+    * :func:`~skelpy.templates.get_template`
+    * external programs, e.g., the editor of the project information, and
+      the lookups of external commands, e.g., ``git``
+    * :meth:`~skelpy.utils.durability.SyncQueue.sync`
+
+Recorded spans can be exported in the Chrome trace-event format--see
+:meth:`Tracer.export`--, which ``chrome://tracing`` or
+`Perfetto <https://ui.perfetto.dev>`_ open, or summarized in a table--see
+:meth:`Tracer.summary`.
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import threading
+from functools import wraps
+from timeit import default_timer as timer
+
+#: span categories
+MAKER = 'maker'
+TEMPLATE = 'template'
+PROCESS = 'process'
+SYNC = 'sync'
+
+
+class _NullSpan(object):
+    """span doing nothing, used while the tracer is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span(object):
+    """span recorded when it exits"""
+
+    def __init__(self, tracer, name, cat, args):
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+
+    def __enter__(self):
+        self._start = timer()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._tracer._record(self._name, self._cat, self._start, timer(), self._args)
+        return False
+
+
+class Tracer(object):
+    """Process-wide recorder of spans
+
+    Attributes:
+        enabled (bool): if False, spans are not recorded
+
+    """
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        #: (name, category, start, end, thread id, args)
+        self._spans = []
+        self._origin = timer()
+        #: names of the spans of :func:`traced` open on each thread
+        self._local = threading.local()
+
+    def _open_names(self):
+        """get the names of the :func:`traced` spans open on the current thread"""
+
+        names = getattr(self._local, 'names', None)
+        if names is None:
+            names = self._local.names = set()
+        return names
+
+    def span(self, name, cat=MAKER, args=None):
+        """create a span, used as a context manager::
+
+            with tracer.span('get_template', TEMPLATE, {'name': tpl_name}):
+                ...
+
+        Args:
+            name (str): name of the span
+            cat (str): category of the span
+            args (dict): arguments shown with the span, e.g., the path of a file
+
+        Returns:
+            context manager
+
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args or {})
+
+    def _record(self, name, cat, start, end, args):
+        with self._lock:
+            self._spans.append((name, cat, start, end, threading.current_thread().ident, args))
+
+    def spans(self):
+        """list the spans recorded
+
+        Returns:
+            list: (name, category, start, end, thread id, args), in the order
+            they ended. Times are in seconds.
+
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def export(self, path):
+        """write the spans recorded in the Chrome trace-event format
+
+        Args:
+            path (str): path of the JSON file to create
+
+        Returns:
+            int: number of spans written
+
+        """
+        import json
+
+        pid = os.getpid()
+        events = []
+        for name, cat, start, end, tid, args in self.spans():
+            events.append({'name': name, 'cat': cat, 'ph': 'X', 'pid': pid, 'tid': tid,
+                           'ts': round((start - self._origin) * 1e6, 3),
+                           'dur': round((end - start) * 1e6, 3),
+                           'args': args})
+
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+        return len(events)
+
+    def summary(self):
+        """summarize the spans recorded by name, the slowest first
+
+        Returns:
+            str: table of the count, the total and the longest time of each name
+
+        """
+        totals = {}
+        for name, _, start, end, _, _ in self.spans():
+            count, total, longest = totals.get(name, (0, 0.0, 0.0))
+            elapsed = end - start
+            totals[name] = (count + 1, total + elapsed, max(longest, elapsed))
+
+        width = max([len(name) for name in totals] + [len('span')])
+        row = '{:<%d}  {:>6}  {:>10}  {:>10}' % width
+        lines = [row.format('span', 'count', 'total(ms)', 'max(ms)')]
+        for name, (count, total, longest) in sorted(
+                totals.items(), key=lambda item: -item[1][1]):
+            lines.append(row.format(name, count, '{:.3f}'.format(total * 1e3),
+                                    '{:.3f}'.format(longest * 1e3)))
+
+        return '\n'.join(lines)
+
+    def clear(self):
+        """drop the spans recorded and reset the origin of time"""
+
+        with self._lock:
+            self._spans = []
+            self._origin = timer()
+
+
+#: the process-wide tracer
+tracer = Tracer()
+
+
+def traced(name, cat=MAKER, arg=None, key='path', method=False):
+    """decorator recording a span for each call of a function
+
+    Args:
+        name (str): name of the span
+        cat (str): category of the span
+        arg (int): index of the positional argument shown with the span, if any
+        key (str): name the argument is shown as
+        method (bool): if True, the function is a method and the span is named
+            after the class of the instance as well, e.g., ``DocMaker.write_file``
+
+    A call made while a span of the same name is open on the thread, e.g.,
+    an overriding method calling ``super()``, records no span of its own, so
+    its time is not counted twice.
+
+    Returns:
+        callable: decorator
+
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            span_args = {}
+            if arg is not None and len(args) > arg:
+                span_args[key] = str(args[arg])
+            span_name = type(args[0]).__name__ + '.' + name if method else name
+            names = tracer._open_names()
+            if span_name in names:
+                return func(*args, **kwargs)
+            names.add(span_name)
+            try:
+                with _Span(tracer, span_name, cat, span_args):
+                    return func(*args, **kwargs)
+            finally:
+                names.discard(span_name)
+
+        return wrapper
+
+    return decorator
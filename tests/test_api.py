@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_api - pytest module for skelpy.generate()
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+
+import pytest
+
+import skelpy
+from skelpy import api
+from skelpy.main import _setup_arg_parser
+from skelpy.utils.backends import MemoryBackend
+
+
+def test_defaults():
+    #: in step with the options of the 'template' sub-command
+    parser = _setup_arg_parser('template')
+    defaults = vars(parser.sub_parser('template').parse_args([]))
+    for key in ('func', 'verbose', 'trace', 'timings'):
+        defaults.pop(key)
+    defaults['quiet'] = True
+    assert api.DEFAULTS == defaults
+
+
+def test_generate(tmpdir):
+    projectDir = str(tmpdir.join('my_project'))
+    result = skelpy.generate({'projectName': projectDir, 'license': 'GPL3',
+                              'durability': 'none'})
+    assert result
+    assert result.projectDir == projectDir
+    assert tmpdir.join('my_project', 'LICENSE').check()
+    assert str(tmpdir.join('my_project', 'LICENSE')) in result.created
+    assert result.bytes_written == sum(os.path.getsize(p) for p in result.created)
+    assert 'license' in result.timings
+    assert not result.overwritten and not result.skipped
+
+    #: nothing to write the second time
+    result = skelpy.generate({'projectName': projectDir, 'license': 'GPL3',
+                              'merge': True, 'force': True, 'durability': 'none'})
+    assert result.ok
+    assert not result.created and not result.overwritten
+    assert str(tmpdir.join('my_project', 'LICENSE')) in result.unchanged
+    assert result.bytes_written == 0
+
+
+def test_generate_memory(tmpdir):
+    backend = MemoryBackend()
+    result = skelpy.generate({'projectName': str(tmpdir.join('foo'))}, output=backend)
+    assert result.ok
+    assert result.backend is backend
+    assert 'LICENSE' in backend.tree(result.projectDir)
+    assert not tmpdir.join('foo').check()
+    assert result.bytes_written == sum(
+        len(backend.read(p).encode('utf-8')) for p in result.created)
+
+
+def test_generate_invalid():
+    with pytest.raises(ValueError):
+        skelpy.generate({'format': 'src'})
+    with pytest.raises(ValueError):
+        skelpy.generate({'projectName': 'foo'}, output='foo.rar')
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_backends - pytest module for the output backends
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from skelpy.utils import backends
+from skelpy.makers import project, Settings
+from . import mock
+
+
+def test_memory(tmpdir):
+    backend = backends.MemoryBackend()
+    root = str(tmpdir.join('project'))
+    backend.mkdir(os.path.join(root, 'a', 'b'), recursive=True)
+    backend.mkdir(os.path.join(root, 'c'))
+    backend.write(os.path.join(root, 'a', 'file'), 'data')
+
+    assert backend.isdir(root)
+    assert backend.exists(os.path.join(root, 'a', 'file'))
+    assert not backend.exists(os.path.join(root, 'd'))
+    assert backend.read(os.path.join(root, 'a', 'file')) == 'data'
+    assert backend.same_content(os.path.join(root, 'a', 'file'), 'data')
+    assert backend.tree(root) == {'a/file': 'data'}
+    with pytest.raises(OSError):
+        backend.mkdir(os.path.join(root, 'c'))
+    with pytest.raises(IOError):
+        backend.write(os.path.join(root, 'c'), 'data')
+    #: nothing on the file system
+    assert tmpdir.listdir() == []
+
+
+def test_archives(tmpdir):
+    root = str(tmpdir)
+    target = str(tmpdir.join('project.zip'))
+    backend = backends.open_backend(target, root)
+    assert isinstance(backend, backends.ZipBackend)
+    backend.mkdir(str(tmpdir.join('project')), recursive=True)
+    backend.write(str(tmpdir.join('project', 'file')), 'data')
+    backend.close()
+    with zipfile.ZipFile(target) as f:
+        assert f.namelist() == ['project/', 'project/file']
+        assert f.read('project/file') == b'data'
+
+    stream = io.BytesIO()
+    backend = backends.TarBackend(stream, root, 'gz')
+    backend.mkdir(str(tmpdir.join('project')))
+    backend.write(str(tmpdir.join('project', 'file')), 'data')
+    backend.close()
+    stream.seek(0)
+    with tarfile.open(fileobj=stream, mode='r:gz') as f:
+        assert f.getnames() == ['project', 'project/file']
+        assert f.extractfile('project/file').read() == b'data'
+
+    assert isinstance(backends.open_backend('-', root), backends.TarBackend)
+    assert isinstance(backends.open_backend(str(tmpdir.join('p.tgz')), root),
+                      backends.TarBackend)
+    assert backends.open_backend(None, root) is backends.filesystem
+    with pytest.raises(ValueError):
+        backends.open_backend('project.rar', root)
+
+
+def test_generate_in_memory(tmpdir):
+    opts = {
+        'projectDir': str(tmpdir.join('project')),
+        'projectName': 'project',
+        'format': 'src',
+        'quiet': True,
+        'merge': False,
+        'force': False,
+        'test': 'pytest',
+        'author': 'dks',
+        'author_email': 'dks@email',
+    }
+    settings = Settings(opts)
+    settings.backend = backends.MemoryBackend()
+    maker = project.Maker.from_settings(settings)
+    with mock.patch.object(project.helpers, 'has_command', return_value=False):
+        assert maker.generate() is True
+
+    tree = settings.backend.tree(opts['projectDir'])
+    assert 'src/project/main.py' in tree
+    assert 'dks' in tree['LICENSE']
+    #: setup.py is made out of setup.cfg read back from the backend
+    assert "name='project'" in tree['setup.py']
+    assert '.skelpy/manifest.json' in tree
+    assert tmpdir.listdir() == []
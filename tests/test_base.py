@@ -6,12 +6,14 @@
 
 from __future__ import absolute_import, print_function
 
+import os
 import logging
 import pytest
 import inspect
 import string
 
-from skelpy.makers import base
+from skelpy.utils import backends
+from skelpy.makers import base, Settings, Lazy
 from . import mock
 
 
@@ -70,12 +72,16 @@ def test_create_dir(mocked_mkdir, mocked_makedirs, maker):
 
 @mock.patch('os.fsync')
 @mock.patch.object(base, "get_template", return_value=string.Template('some data${foo}'))
-def test_write_file(mocked_template, mocked_fsync, maker):
+def test_write_file(mocked_template, mocked_fsync, maker, tmpdir, monkeypatch):
+    #: 'target' is relative; nothing must land in the working directory
+    monkeypatch.chdir(tmpdir)
+    #: writes in place, so that mocked open() sees them
+    maker.settings['atomic'] = False
     #: invalid template file path
     maker.logger.info = mock.Mock()
     maker.logger.error = mock.Mock()
 
-    with mock.patch.object(base, 'open',
+    with mock.patch.object(backends, 'open',
                            mock.mock_open(read_data='some data${foo}'),
                            create=True) as mocked_open:
         #: file exist
@@ -88,7 +94,8 @@ def test_write_file(mocked_template, mocked_fsync, maker):
             mocked_fsync.assert_not_called()
 
             maker.force = True
-            maker.write_file('tpl', 'target')
+            with mock.patch.object(base.durability, 'same_content', return_value=False):
+                maker.write_file('tpl', 'target')
             maker.logger.info.assert_any_call(
                 'overwriting...')
             mocked_open.assert_called_with('target', 'wt')
@@ -110,7 +117,7 @@ def test_write_file(mocked_template, mocked_fsync, maker):
                 mocked_fsync.assert_not_called()
 
     #: file write error
-    with mock.patch.object(base, 'open',
+    with mock.patch.object(backends, 'open',
                            mock.mock_open(mock=mock.Mock(side_effect=Exception())),
                            create=True):
         maker.logger.error.reset_mock()
@@ -118,3 +125,165 @@ def test_write_file(mocked_template, mocked_fsync, maker):
             ret = maker.write_file('setup', 'target')
             assert ret is None
             maker.logger.error.assert_called()
+
+
+@mock.patch('os.fsync')
+def test_write_file_durability(mocked_fsync, maker, tmpdir):
+    maker.force = True
+    target = str(tmpdir.join('target'))
+    tpl = string.Template('some data')
+
+    #: strict(default)
+    maker.settings = Settings()
+    assert maker.write_file(tpl, target) == target
+    assert mocked_fsync.call_count == 1
+
+    #: none
+    mocked_fsync.reset_mock()
+    maker.settings = Settings({'durability': 'none'})
+    tpl = string.Template('other data')
+    assert maker.write_file(tpl, target) == target
+    mocked_fsync.assert_not_called()
+    assert len(maker.settings.sync_queue) == 0
+
+    #: batch
+    maker.settings = Settings({'durability': 'batch'})
+    maker.merge = False
+    assert maker.create_dir(str(tmpdir.join('dir'))) == 1
+    tpl = string.Template('new data')
+    assert maker.write_file(tpl, target) == target
+    mocked_fsync.assert_not_called()
+    #: the new directory, the file and their parent directory
+    assert len(maker.settings.sync_queue) == 3
+    assert maker.settings.sync_queue.sync() == 3
+    assert mocked_fsync.call_count == 3
+
+
+def test_write_file_lazy(maker, tmpdir):
+    maker.force = True
+    target = str(tmpdir.join('target'))
+    needed = mock.Mock(return_value='dks')
+    unneeded = mock.Mock(return_value='unused')
+    maker.settings = Settings({'durability': 'none',
+                               'author': Lazy(needed),
+                               'author_email': Lazy(unneeded)})
+
+    #: only the values the template refers to are computed
+    assert maker.write_file(string.Template('${author} and $author'), target) == target
+    assert tmpdir.join('target').read() == 'dks and dks'
+    needed.assert_called_once_with()
+    unneeded.assert_not_called()
+
+    #: template files, through the placeholder index
+    assert maker.write_file('license_mit', target) == target
+    assert 'dks' in tmpdir.join('target').read()
+    needed.assert_called_once_with()
+    unneeded.assert_not_called()
+
+
+def test_write_file_atomic(maker, tmpdir):
+    maker.force = True
+    maker.settings = Settings()
+    tpl = string.Template('new data')
+    targets = [str(tmpdir.join(name)) for name in ('a', 'b', 'c')]
+    tmpdir.join('a').write('old data')
+
+    with mock.patch('os.fsync') as mocked_fsync:
+        for target in targets:
+            assert maker.write_file(tpl, target) == target
+        #: files are synced right away, and their directory once at the end
+        assert mocked_fsync.call_count == 3
+        assert len(maker.settings.sync_queue) == 1
+
+    assert all(tmpdir.join(name).read() == 'new data' for name in ('a', 'b', 'c'))
+    assert len(tmpdir.listdir()) == 3
+
+    #: failed writes leave the existing file intact
+    maker.logger.error = mock.Mock()
+    with mock.patch('os.fdopen', side_effect=IOError('disk full')):
+        assert maker.write_file(string.Template('lost'), targets[0]) is None
+    maker.logger.error.assert_called()
+    assert tmpdir.join('a').read() == 'new data'
+    assert len(tmpdir.listdir()) == 3
+
+
+def test_write_file_manifest(maker, tmpdir):
+    from skelpy.utils.manifest import Manifest
+
+    maker.force = True
+    maker.settings = Settings()
+    maker.settings.manifest = Manifest(str(tmpdir))
+    maker.logger.error = mock.Mock()
+
+    #: a failed write leaves no entry behind
+    with mock.patch.object(maker, 'write_content', return_value=False):
+        assert maker.write_file(string.Template('data'), str(tmpdir.join('a'))) is None
+    assert maker.settings.manifest.files == {}
+
+    assert maker.write_file(string.Template('data'), str(tmpdir.join('a'))) is not None
+    #: unchanged files are recorded as well
+    assert maker.write_file(string.Template('data'), str(tmpdir.join('a'))) is not None
+    assert list(maker.settings.manifest.files) == ['a']
+
+
+def test_staged_path(maker, tmpdir):
+    maker.force = False
+    maker.settings = Settings()
+    projectDir = str(tmpdir.join('project'))
+    stagingDir = str(tmpdir.join('.project.staging'))
+    outside = str(tmpdir.join('project_other'))
+    assert maker.staged_path(projectDir) == projectDir
+
+    maker.settings.staging = (projectDir, stagingDir)
+    assert maker.staged_path(projectDir) == stagingDir
+    assert maker.staged_path(os.path.join(projectDir, 'a', 'b')) == \
+        os.path.join(stagingDir, 'a', 'b')
+    assert maker.staged_path(outside) == outside
+
+    #: created in the staging directory, without checking if they exist
+    with mock.patch('os.path.exists') as mocked_exists:
+        assert maker.create_dir(projectDir) == 1
+        target = os.path.join(projectDir, 'file')
+        assert maker.write_file(string.Template('data'), target) == target
+        mocked_exists.assert_not_called()
+    assert tmpdir.join('.project.staging', 'file').read() == 'data'
+    assert not tmpdir.join('project').check()
+
+
+def test_write_file_unchanged(maker, tmpdir):
+    maker.force = False
+    maker.settings = Settings()
+    target = str(tmpdir.join('target'))
+    tpl = string.Template('some data')
+    assert maker.write_file(tpl, target) == target
+    assert maker.write_file(tpl, target) is None
+
+    maker.force = True
+    tmpdir.join('target').setmtime(1000000000)
+    with mock.patch('os.fsync') as mocked_fsync:
+        assert maker.write_file(tpl, target) == target
+        mocked_fsync.assert_not_called()
+    #: not written again
+    assert tmpdir.join('target').mtime() == 1000000000
+    assert maker.write_file(string.Template('other data'), target) == target
+
+    assert maker.settings.report.summary() == \
+        '1 created, 1 overwritten, 1 unchanged, 1 skipped'
+
+
+@pytest.mark.skipif(not hasattr(os, 'link'), reason='no hard links')
+def test_write_file_dedup(maker, tmpdir):
+    from skelpy.utils.dedup import dedup_index
+
+    maker.force = False
+    maker.settings = Settings({'durability': 'none', 'dedup': 'link'})
+    dedup_index.clear()
+    tpl = string.Template('shared data')
+    targets = [str(tmpdir.join(name)) for name in ('a', 'b')]
+    try:
+        for target in targets:
+            assert maker.write_file(tpl, target) == target
+        assert os.path.samefile(*targets)
+        assert dedup_index.hits == 1
+    finally:
+        dedup_index.clear()
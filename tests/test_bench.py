@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_bench - pytest module for the benchmark suite
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import json
+
+import pytest
+
+from skelpy import bench, main
+
+
+def test_stats():
+    assert bench.stats([]) == {'runs': 0}
+    assert bench.stats([3.0, 1.0, 2.0]) == \
+        {'runs': 3, 'min': 1.0, 'median': 2.0, 'mean': 2.0, 'total': 6.0}
+    assert bench.stats([4.0, 1.0])['median'] == 2.5
+
+
+def test_scratch_root(tmpdir):
+    assert bench.scratch_root(str(tmpdir)) == str(tmpdir)
+    assert bench.scratch_root() in (bench.TMPFS_DIR, bench.tempfile.gettempdir())
+
+
+def test_run(tmpdir):
+    results = bench.run(number=2, repeat=3, directory=str(tmpdir), durability='none')
+    assert sorted(results['results']) == sorted(bench.BENCHMARKS)
+    assert results['results']['generate_cold_src']['runs'] == 2
+    assert results['results']['render_templates']['runs'] == 3
+    for how in bench.RENDER_WAYS:
+        assert results['results']['render_' + how]['runs'] == 3
+    #: the scratch directory is removed
+    assert tmpdir.listdir() == []
+
+    results = bench.run(1, 1, str(tmpdir), 'none', only=['read_setup_cfg'])
+    assert list(results['results']) == ['read_setup_cfg']
+
+    with pytest.raises(ValueError):
+        bench.run(1, 1, str(tmpdir), only=['unknown'])
+
+
+def test_bench_command(tmpdir):
+    output = tmpdir.join('results.json')
+    parser = main._setup_arg_parser()
+    opts = vars(parser.parse_args(['bench', '-n', '1', '-r', '1', '-d', str(tmpdir),
+                                   '-b', 'render_templates', '-o', str(output)]))
+    assert opts['func'] is main._bench
+    assert main._bench(opts, parser) is True
+
+    results = json.loads(output.read())
+    assert list(results['results']) == ['render_templates']
+    assert results['number'] == 1
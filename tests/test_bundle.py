@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_bundle - pytest module for the template bundle
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+
+import pytest
+
+from skelpy import templates
+from skelpy.templates import bundle
+from . import mock
+
+
+@pytest.fixture()
+def template_dir(tmpdir):
+    tmpdir.join('foo.tpl').write('foo ${bar}\n')
+    tmpdir.join('readme.tpl').write(u'bundled readme é\n'.encode('utf-8'), 'wb')
+    tmpdir.join('not_a_template.txt').write('ignored')
+    return tmpdir
+
+
+def test_build_and_load(template_dir):
+    assert bundle.build(str(template_dir)) == 2
+    assert template_dir.join(bundle.BUNDLE_FILE).check()
+
+    b = bundle.load(str(template_dir))
+    assert b.names() == ['foo', 'readme']
+    assert b.get('foo') == 'foo ${bar}\n'
+    assert b.get('readme') == u'bundled readme é\n'
+    assert b.get('invalid') is None
+
+    #: the bundle is trusted even if the template file changed, e.g., when installed
+    template_dir.join('foo.tpl').write('changed foo\n')
+    assert b.get('foo') == 'foo ${bar}\n'
+
+    with mock.patch.dict(os.environ, {bundle.DEV_ENV: '1'}):
+        assert bundle.load(str(template_dir)) is None
+
+
+def test_load_invalid(tmpdir):
+    assert bundle.load(str(tmpdir)) is None
+
+    tmpdir.join(bundle.BUNDLE_FILE).write('')
+    assert bundle.load(str(tmpdir)) is None
+
+    tmpdir.join(bundle.BUNDLE_FILE).write('not a bundle')
+    assert bundle.load(str(tmpdir)) is None
+
+    with pytest.raises(ValueError):
+        bundle.Bundle(b'not a bundle')
+
+
+def test_template_cache_with_bundle(template_dir):
+    bundle.build(str(template_dir))
+    cache = templates.TemplateCache()
+
+    with mock.patch.object(bundle, 'load', return_value=bundle.load(str(template_dir))):
+        #: the template file is neither read nor looked at
+        with mock.patch.object(templates, '_stamp') as mocked_stamp, \
+                mock.patch.object(templates, 'get_data') as mocked_get_data:
+            assert cache.get('readme').template == u'bundled readme é\n'
+            assert cache.get('readme').template == u'bundled readme é\n'
+            mocked_get_data.assert_not_called()
+            mocked_stamp.assert_not_called()
+        assert cache.info().hits == 1
+
+        #: not in the bundle
+        assert cache.get('setup') is not None
+
+    cache.clear()
+    assert cache._bundle is None
+
+    #: while editing the templates, the template files are read
+    with mock.patch.dict(os.environ, {bundle.DEV_ENV: '1'}):
+        assert 'bundled' not in cache.get('readme').template
+
+
+def test_template_names_with_bundle(template_dir):
+    bundle.build(str(template_dir))
+    with mock.patch.object(templates.template_cache, '_bundle',
+                           bundle.load(str(template_dir))):
+        names = templates.template_names()
+    assert 'foo' in names
+    assert 'setup' in names
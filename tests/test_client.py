@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_client - pytest module for the thin client of the skelpy server
+
+"""
+
+from __future__ import absolute_import, print_function
+
+from skelpy import client
+from . import mock
+
+
+def test_is_forwardable():
+    assert client._is_forwardable(['-q', 'project'])
+    assert client._is_forwardable(['-mqf', 'project'])
+    assert client._is_forwardable(['template', '--quiet', 'project'])
+    assert client._is_forwardable(['--help'])
+    assert client._is_forwardable(['update', 'project'])
+    assert not client._is_forwardable(['-q', '-o', '-', 'project'])
+    assert not client._is_forwardable(['-q', '--output=-', 'project'])
+    assert client._is_forwardable(['license', '-l'])
+    assert client._is_forwardable(['batch', 'manifest.jsonl'])
+
+    #: need the local terminal
+    assert not client._is_forwardable(['project'])
+    assert not client._is_forwardable([])
+    assert not client._is_forwardable(['batch', '-'])
+    assert not client._is_forwardable(['serve', '--socket', 'path'])
+    assert not client._is_forwardable(['bench', '-n', '5'])
+    with mock.patch.dict('os.environ', {'SKELPY_DESCRIPTION': 'from env'}):
+        assert not client._is_forwardable(['-q', 'project'])
+    #: tracing measures the local process
+    assert not client._is_forwardable(['-q', '--timings', 'project'])
+    assert not client._is_forwardable(['batch', '--trace=out.json', 'manifest.jsonl'])
+
+
+def test_forward_without_server(tmpdir):
+    #: no socket given
+    with mock.patch.dict('os.environ', clear=True):
+        assert client.forward(['-q', 'project']) is None
+
+    #: no server listening on the socket
+    socket_path = str(tmpdir.join('skelpy.sock'))
+    with mock.patch.dict('os.environ', {client.ENV_SOCKET: socket_path}):
+        assert client.forward(['-q', 'project']) is None
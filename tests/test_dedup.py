@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_dedup - pytest module for DedupIndex
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+
+import pytest
+
+from skelpy.utils import dedup
+from . import mock
+
+
+@pytest.fixture
+def index():
+    return dedup.DedupIndex()
+
+
+@pytest.mark.skipif(not hasattr(os, 'link'), reason='no hard links')
+def test_materialize_link(index, tmpdir):
+    first = tmpdir.join('first')
+    first.write('data')
+    second = tmpdir.join('second')
+    second.write('old data')
+
+    assert index.materialize('data', str(second), dedup.LINK) is False
+    index.add('data', str(first))
+    assert index.materialize('other', str(second), dedup.LINK) is False
+    assert index.materialize('data', str(second), dedup.LINK) is True
+    #: replaced by a hard link to the first file
+    assert os.path.samefile(str(first), str(second))
+    assert second.read() == 'data'
+    assert index.hits == 1
+    assert index.misses == 2
+    assert sorted(p.basename for p in tmpdir.listdir()) == ['first', 'second']
+
+
+def test_materialize_stale(index, tmpdir):
+    first = tmpdir.join('first')
+    first.write('data')
+    index.add('data', str(first))
+
+    #: changed since indexed, e.g., edited by the user
+    first.write('edited')
+    assert index.materialize('data', str(tmpdir.join('second')), dedup.LINK) is False
+    assert not tmpdir.join('second').check()
+
+    first.remove()
+    index.add('data', str(tmpdir.join('missing')))
+    assert index.materialize('data', str(tmpdir.join('second')), dedup.LINK) is False
+
+
+def test_materialize_fallback(index, tmpdir):
+    first = tmpdir.join('first')
+    first.write('data')
+    index.add('data', str(first))
+
+    #: e.g., the file system can not clone
+    with mock.patch.object(dedup, 'clone_file', side_effect=OSError('not supported')):
+        assert index.materialize('data', str(tmpdir.join('second')),
+                                 dedup.CLONE) is False
+    #: no temporary file is left behind
+    assert [p.basename for p in tmpdir.listdir()] == ['first']
+
+
+def test_clone_file(tmpdir):
+    src = tmpdir.join('src')
+    src.write('data' * 1000)
+    dst = tmpdir.join('dst')
+
+    try:
+        dedup.clone_file(str(src), str(dst), fsync=True)
+    except (IOError, OSError):
+        #: neither FICLONE nor copy_file_range is supported here
+        return
+    assert dst.read() == 'data' * 1000
+    assert not os.path.samefile(str(src), str(dst))
+
+    #: never overwrites
+    with pytest.raises(OSError):
+        dedup.clone_file(str(src), str(dst))
+
+
+def test_clear(index, tmpdir):
+    first = tmpdir.join('first')
+    first.write('data')
+    index.add('data', str(first))
+    index.materialize('other', str(tmpdir.join('second')), dedup.LINK)
+    index.clear()
+    assert (index.hits, index.misses) == (0, 0)
+    assert index.materialize('data', str(tmpdir.join('second')), dedup.LINK) is False
+
+
+def test_moved(index, tmpdir):
+    staging = tmpdir.mkdir('.project.staging')
+    staging.join('LICENSE').write('data')
+    index.add('data', str(staging.join('LICENSE')))
+    staging.rename(tmpdir.join('project'))
+
+    assert index.moved(str(staging), str(tmpdir.join('project'))) == 1
+    assert index.materialize('data', str(tmpdir.join('copy')), dedup.LINK) is True
+
+
+@pytest.mark.skipif(not hasattr(os, 'link'), reason='no hard links')
+def test_dedup_staging(tmpdir):
+    import skelpy
+
+    dedup.dedup_index.clear()
+    names = ['p1', 'p2', 'p3']
+    try:
+        for name in names:
+            result = skelpy.generate({'projectName': str(tmpdir.join(name)),
+                                      'author': 'dks', 'author_email': 'dks@email',
+                                      'durability': 'none', 'dedup': dedup.LINK,
+                                      'staging': True})
+            assert result.ok
+        #: identical files are shared across the projects published
+        assert dedup.dedup_index.hits >= 2
+        assert os.path.samefile(str(tmpdir.join('p1', 'LICENSE')),
+                                str(tmpdir.join('p3', 'LICENSE')))
+    finally:
+        dedup.dedup_index.clear()
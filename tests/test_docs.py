@@ -10,27 +10,28 @@ import os
 import pytest
 from tempfile import gettempdir
 
-from skelpy.makers import base, docs, settings
+from skelpy.utils import backends
+from skelpy.makers import base, docs, Settings
 from . import mock
 
 
 @pytest.fixture(scope='module')
 def maker():
-    settings.clear()
     info = {
         'projectDir': gettempdir(),
         'projectName': 'project',
         'merge': False,
         'force': False,
+        #: writes in place, so that mocked open() sees them
+        'atomic': False,
     }
-    settings['projectName'] = 'project'
-    return docs.Maker(**info)
+    return docs.Maker(settings=Settings(info), **info)
 
 
 def test_update_settings(maker):
     maker._update_settings()
-    assert settings.get('docsDir') == os.path.join(maker.projectDir, 'docs')
-    assert settings.get('doc_title') == "project Documentation"
+    assert maker.settings.get('docsDir') == os.path.join(maker.projectDir, 'docs')
+    assert maker.settings.get('doc_title') == "project Documentation"
 
 
 @mock.patch('os.mkdir')
@@ -60,7 +61,7 @@ def test_create_dirs(mocked_exit, mocked_mkdir, maker):
 def test_create_config_files(mocked_fsync, maker):
     maker.docsDir = gettempdir()
 
-    with mock.patch.object(base, 'open',
+    with mock.patch.object(backends, 'open',
                            mock.mock_open(read_data='some data${foo}'),
                            create=True) as mocked_open:
         with mock.patch('os.path.exists', return_value=True) as mocked_exists:
@@ -71,7 +72,8 @@ def test_create_config_files(mocked_fsync, maker):
 
             maker.force = True
             mocked_exists.reset_mock()
-            maker._create_config_files()
+            with mock.patch.object(base.durability, 'same_content', return_value=False):
+                maker._create_config_files()
             assert mocked_exists.call_count == 4
             assert mocked_open().write.call_count == 4
             mocked_open.assert_any_call(
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_durability - pytest module for durability policies and SyncQueue
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+import errno
+
+import pytest
+
+from skelpy.utils import durability
+from . import mock
+
+
+def test_fsync_path(tmpdir):
+    target = tmpdir.join('file')
+    target.write('data')
+
+    with mock.patch('os.fsync') as mocked_fsync:
+        assert durability.fsync_path(str(target)) is True
+        assert durability.fsync_path(str(tmpdir)) in (True, False)  # Windows
+        assert durability.fsync_path(str(tmpdir.join('invalid'))) is False
+        assert mocked_fsync.called
+
+
+def test_sync_queue(tmpdir):
+    queue = durability.SyncQueue()
+    subdir = tmpdir.mkdir('sub')
+    target = subdir.join('file')
+    target.write('data')
+
+    queue.add_dir(str(subdir))
+    queue.add_file(str(target))
+    #: a file, the sub-directory and its parent
+    assert len(queue) == 3
+
+    with mock.patch.object(durability, 'fsync_path', return_value=True) as mocked_fsync:
+        assert queue.sync() == 3
+        synced = [c[0][0] for c in mocked_fsync.call_args_list]
+        assert synced == [str(target), str(subdir), str(tmpdir)]
+
+    #: the queue is emptied
+    assert len(queue) == 0
+    with mock.patch.object(durability, 'fsync_path') as mocked_fsync:
+        assert queue.sync() == 0
+        mocked_fsync.assert_not_called()
+
+
+def test_atomic_write(tmpdir):
+    target = tmpdir.join('file')
+
+    with mock.patch('os.fsync') as mocked_fsync:
+        durability.atomic_write(str(target), 'new data')
+        mocked_fsync.assert_not_called()
+        durability.atomic_write(str(target), 'newer data', fsync=True)
+        assert mocked_fsync.call_count == 1
+    assert target.read() == 'newer data'
+    #: no temporary file left
+    assert tmpdir.listdir() == [target]
+
+    #: failed to replace
+    with mock.patch.object(durability, 'replace', side_effect=OSError('whoops')):
+        with pytest.raises(OSError):
+            durability.atomic_write(str(target), 'lost data')
+    assert target.read() == 'newer data'
+    assert tmpdir.listdir() == [target]
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='needs POSIX permission bits')
+def test_atomic_write_keeps_mode(tmpdir):
+    target = tmpdir.join('script')
+    target.write('old')
+    target.chmod(0o750)
+    durability.atomic_write(str(target), 'new')
+    assert target.read() == 'new'
+    assert os.stat(str(target)).st_mode & 0o777 == 0o750
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='needs symbolic links')
+def test_atomic_write_through_symlink(tmpdir):
+    real = tmpdir.mkdir('real').join('file')
+    real.write('old')
+    link = tmpdir.join('link')
+    link.mksymlinkto(real)
+
+    durability.atomic_write(str(link), 'new')
+    #: the file pointed to is written, and the link stays a link
+    assert link.islink()
+    assert real.read() == 'new'
+    assert sorted(p.basename for p in tmpdir.listdir()) == ['link', 'real']
+    assert tmpdir.join('real').listdir() == [real]
+
+
+def test_sync_queue_add_entry(tmpdir):
+    queue = durability.SyncQueue()
+    for name in ('a', 'b', 'c'):
+        queue.add_entry(str(tmpdir.join(name)))
+    #: one directory for all the files in it
+    assert len(queue) == 1
+    with mock.patch.object(durability, 'fsync_path', return_value=True) as mocked_fsync:
+        assert queue.sync() == 1
+        mocked_fsync.assert_called_once_with(str(tmpdir))
+
+
+def test_same_content(tmpdir):
+    target = tmpdir.join('file')
+    target.write_binary('line\n'.replace('\n', os.linesep).encode('utf-8'))
+
+    assert durability.same_content(str(target), 'line\n') is True
+    #: different sizes are told apart without reading the file
+    with mock.patch.object(durability, 'open', create=True) as mocked_open:
+        assert durability.same_content(str(target), 'line\nmore\n') is False
+        mocked_open.assert_not_called()
+    assert durability.same_content(str(target), 'lime\n') is False
+    assert durability.same_content(str(tmpdir.join('invalid')), 'line\n') is False
+
+
+@pytest.mark.parametrize('libc', [True, False])
+def test_rename_noreplace(tmpdir, libc):
+    src = tmpdir.mkdir('src')
+    src.join('file').write('data')
+    dst = tmpdir.join('dst')
+
+    with mock.patch.object(durability, '_libc_renameat2',
+                           wraps=durability._libc_renameat2 if libc else lambda: None):
+        durability.rename_noreplace(str(src), str(dst))
+        assert dst.join('file').read() == 'data'
+
+        #: an empty directory in the way is not replaced
+        src = tmpdir.mkdir('src2')
+        dst = tmpdir.mkdir('dst2')
+        with pytest.raises(OSError) as e:
+            durability.rename_noreplace(str(src), str(dst))
+        assert e.value.errno == errno.EEXIST
+        assert src.check(dir=1)
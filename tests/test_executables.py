@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_executables - pytest module for the index of executables in $PATH
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import sys
+
+import pytest
+
+from skelpy.utils.executables import ExecutableIndex, which
+from skelpy.utils import helpers
+from . import mock
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='needs the execute permission')
+
+
+def _make_executable(path):
+    path.write('#!/bin/sh\n')
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture()
+def bin_dirs(tmpdir):
+    first, second = tmpdir.mkdir('first'), tmpdir.mkdir('second')
+    path = os.pathsep.join([str(first), str(second)])
+    with mock.patch.dict('os.environ', {'PATH': path}):
+        yield first, second
+
+
+def test_which(bin_dirs):
+    first, second = bin_dirs
+    tool = _make_executable(second.join('tool'))
+    #: not executable
+    first.join('data').write('')
+
+    index = ExecutableIndex()
+    assert index.which('tool') == tool
+    assert index.which('data') is None
+    assert index.which('nothing') is None
+    #: path to the command
+    assert index.which(tool) == tool
+    assert index.which(str(first.join('data'))) is None
+
+    #: the first one in $PATH wins
+    assert index.which('tool') == tool
+    shadow = _make_executable(first.join('tool'))
+    mtime = os.stat(str(first)).st_mtime
+    os.utime(str(first), (mtime + 10, mtime + 10))
+    assert index.which('tool') == shadow
+
+
+def test_which_memo(bin_dirs):
+    first, second = bin_dirs
+    index = ExecutableIndex()
+
+    with mock.patch('os.listdir', side_effect=os.listdir) as mocked_listdir:
+        assert index.which('tool') is None
+        assert index.which('tool') is None
+        assert index.which('other') is None
+        #: each directory is listed once
+        assert mocked_listdir.call_count == 2
+        assert (index.hits, index.misses) == (1, 2)
+
+        #: newly installed
+        tool = _make_executable(second.join('tool'))
+        mtime = os.stat(str(second)).st_mtime
+        os.utime(str(second), (mtime + 10, mtime + 10))
+        assert index.which('tool') == tool
+        #: only the modified directory is listed again
+        assert mocked_listdir.call_count == 3
+
+        #: modified $PATH
+        with mock.patch.dict('os.environ', {'PATH': str(first)}):
+            assert index.which('tool') is None
+        assert index.which('tool') == tool
+
+    index.clear()
+    assert (index.hits, index.misses) == (0, 0)
+
+
+def test_has_command(bin_dirs):
+    first, _ = bin_dirs
+    _make_executable(first.join('git'))
+    with mock.patch('subprocess.call') as mocked_call:
+        assert helpers.has_command('git')
+        assert not helpers.has_command('no-such-command')
+        #: no external program is run
+        mocked_call.assert_not_called()
+    assert which('git') == str(first.join('git'))
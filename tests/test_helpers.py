@@ -13,7 +13,6 @@ from tempfile import gettempdir
 import pytest
 
 import skelpy.utils.helpers as helpers
-from . import mock
 
 
 test_data = ("#!/usr/bin/env python - shebang will remain.\n"
@@ -53,22 +52,6 @@ def test_file():
     os.remove(testFile)
 
 
-def test_get_gitConfig_with_gitconfig():
-    git_data = '[user]\n\tname = june3474\n\temail = june3474@email\n[core]\n\tautocrlf = true\n'
-
-    with mock.patch.object(helpers, 'open', mock.mock_open(read_data=git_data), create=True):
-        gitConfig = helpers.get_gitConfig()
-        assert gitConfig.__class__.__name__ == 'ConfigParser'
-        assert gitConfig.get('user', 'name') == 'june3474'
-        assert gitConfig.get('user', 'email') == 'june3474@email'
-
-
-@mock.patch('os.path.join', return_value='NOTEXIST')
-def test_get_gitConfig_without_gitconfig(mocked_join):
-    gitConfig = helpers.get_gitConfig()
-    assert gitConfig is None
-
-
 def test_get_userName():
     assert helpers.get_userName() not in ('', None)
 
@@ -102,6 +85,19 @@ def test_remove_comment_line_in_file(test_file):
     os.remove(destFile)
 
 
+def test_read_info_file(tmpdir):
+    assert helpers.read_info_file(str(tmpdir.join('missing'))) is None
+
+    info = tmpdir.join('info.txt')
+    info.write('# comment\n[Project]\ndescription = 100% python\nlicense = GPL3\n'
+               '[Author]\nauthor = dks\n')
+    assert helpers.read_info_file(str(info)) == \
+        {'description': '100% python', 'license': 'GPL3', 'author': 'dks'}
+
+    info.write('not an info file')
+    assert helpers.read_info_file(str(info)) is None
+
+
 def test_read_setup_cfg():
     # try to read an not-existing file
     assert helpers.read_setup_cfg('invalid.cfg') == {}
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_identity - pytest module for the cached identity resolution
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+
+import pytest
+
+from skelpy.utils import identity
+from skelpy.utils.identity import IdentityCache, parse_git_config
+from . import mock
+
+
+@pytest.fixture()
+def home(tmpdir):
+    env = {'HOME': str(tmpdir), 'USERPROFILE': str(tmpdir),
+           'USER': 'env_user', 'USERNAME': 'env_user'}
+    with mock.patch.dict('os.environ', env):
+        os.environ.pop('XDG_CONFIG_HOME', None)
+        yield tmpdir
+
+
+def test_parse_git_config():
+    text = ('[user]\n'
+            '\tname = "dks kim" # comment\n'
+            '  email=dks@email\n'
+            '[include]\n'
+            '    path = ~/.gitconfig.local\n'
+            '[remote "origin"]\n'
+            '    url = https://github.com/june3474/skelpy\n'
+            '; comment line\n'
+            '[core]\n'
+            '    bare\n')
+    assert list(parse_git_config(text)) == [
+        ('user', 'name', 'dks kim'),
+        ('user', 'email', 'dks@email'),
+        ('include', 'path', '~/.gitconfig.local'),
+        ('remote.origin', 'url', 'https://github.com/june3474/skelpy'),
+        ('core', 'bare', 'true')]
+
+
+def test_identity(home):
+    home.join('.gitconfig').write('[user]\n\tname = june3474\n\temail = june3474@email\n')
+    assert IdentityCache().get() == ('june3474', 'june3474@email')
+
+
+def test_identity_fallback(home):
+    cache = IdentityCache()
+    with mock.patch('socket.gethostname', return_value='host'):
+        assert cache.get() == ('env_user', 'env_user@host')
+
+
+def test_identity_include_and_xdg(home):
+    home.ensure('.config', 'git', 'config').write(
+        '[user]\n\tname = xdg\n\temail = xdg@email\n')
+    #: ~/.gitconfig takes precedence over XDG config
+    home.join('.gitconfig').write('[include]\n\tpath = .gitconfig.local\n')
+    home.join('.gitconfig.local').write('[user]\n\temail = local@email\n')
+
+    assert IdentityCache().get() == ('xdg', 'local@email')
+
+    #: $XDG_CONFIG_HOME
+    home.ensure('xdg', 'git', 'config').write('[user]\n\tname = other\n')
+    with mock.patch.dict('os.environ', {'XDG_CONFIG_HOME': str(home.join('xdg'))}):
+        assert IdentityCache().get() == ('other', 'local@email')
+
+
+def test_identity_circular_include(home):
+    home.join('.gitconfig').write('[user]\n\tname = me\n\temail = me@email\n'
+                                  '[include]\n\tpath = ~/.gitconfig\n')
+    assert IdentityCache().get() == ('me', 'me@email')
+
+
+def test_identity_cache(home):
+    gitconfig = home.join('.gitconfig')
+    gitconfig.write('[user]\n\tname = june3474\n\temail = june3474@email\n')
+    cache = IdentityCache()
+
+    with mock.patch.object(IdentityCache, '_resolve',
+                           side_effect=IdentityCache._resolve, autospec=True) as mocked:
+        cache.get()
+        cache.get()
+        assert mocked.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        #: modified file
+        gitconfig.write('[user]\n\tname = dks\n\temail = dks@email\n')
+        mtime = os.stat(str(gitconfig)).st_mtime
+        os.utime(str(gitconfig), (mtime + 10, mtime + 10))
+        assert cache.get() == ('dks', 'dks@email')
+        assert mocked.call_count == 2
+
+        #: newly created included file
+        gitconfig.write('[include]\n\tpath = ~/.gitconfig.local\n')
+        home.join('.gitconfig.local').write('[user]\n\tname = local\n')
+        mtime = os.stat(str(gitconfig)).st_mtime
+        os.utime(str(gitconfig), (mtime + 20, mtime + 20))
+        assert cache.get().name == 'local'
+
+        #: changed environment
+        with mock.patch.dict('os.environ', {'XDG_CONFIG_HOME': str(home)}):
+            cache.get()
+        assert mocked.call_count == 4
+
+    cache.clear()
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_get_identity():
+    identity.identity_cache.clear()
+    with mock.patch.object(identity, '_config_files', return_value=[]), \
+            mock.patch.dict('os.environ', {'USER': 'dks', 'USERNAME': 'dks'}), \
+            mock.patch('socket.gethostname', return_value='host') as mocked:
+        assert identity.get_identity() == ('dks', 'dks@host')
+        assert identity.get_identity() == ('dks', 'dks@host')
+        #: resolved only once
+        assert mocked.call_count == 1
+    identity.identity_cache.clear()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_journal - pytest module for Journal
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+
+from skelpy.utils import journal
+from . import mock
+
+
+def test_rollback(tmpdir):
+    existing = tmpdir.join('existing')
+    existing.write('old')
+    j = journal.Journal(str(tmpdir))
+    assert j.resumed is False
+
+    new_dir = tmpdir.join('a')
+    os.makedirs(str(new_dir.join('b')))
+    j.created_dir(str(new_dir))
+    new_file = tmpdir.join('new')
+    j.before_write(str(new_file))
+    new_file.write('new')
+    j.written(str(new_file), 'new')
+    j.before_write(str(existing))
+    existing.write('overwritten')
+    j.written(str(existing), 'overwritten')
+
+    assert j.owns(str(new_dir)) and j.owns(str(new_file)) and j.owns(str(existing))
+    assert tmpdir.join(journal.JOURNAL_FILE).check()
+    assert j.rollback() == 3
+    assert not new_dir.check()
+    assert not new_file.check()
+    assert existing.read() == 'old'
+    assert sorted(os.listdir(str(tmpdir))) == ['existing']
+
+
+def test_commit(tmpdir):
+    target = tmpdir.join('file')
+    target.write('old')
+    j = journal.Journal(str(tmpdir), sync=True)
+    j.before_write(str(target))
+    target.write('new')
+    j.commit()
+
+    assert target.read() == 'new'
+    assert os.listdir(str(tmpdir)) == ['file']
+
+
+def test_resume(tmpdir):
+    target = tmpdir.join('file')
+    j = journal.Journal(str(tmpdir))
+    j.before_write(str(target))
+    target.write('content')
+    j.written(str(target), 'content')
+    #: a torn record left by a crash
+    with open(j.path, 'a') as f:
+        f.write('{"op": "wri')
+
+    resumed = journal.Journal(str(tmpdir))
+    assert resumed.resumed is True
+    assert resumed.owns(str(target))
+    assert resumed.is_written(str(target), 'content')
+    assert not resumed.is_written(str(target), 'other')
+    assert not resumed.owns(str(tmpdir.join('other')))
+
+    assert resumed.rollback() == 1
+    assert not target.check()
+    assert journal.Journal(str(tmpdir)).resumed is False
+
+
+def test_sync(tmpdir):
+    target = tmpdir.join('file')
+    target.write('old')
+    with mock.patch('os.fsync') as mocked_fsync:
+        j = journal.Journal(str(tmpdir), sync=True)
+        j.created_dir(str(tmpdir.mkdir('dir')))
+        j.before_write(str(tmpdir.join('new')))
+        #: the records of the directory and the file created are synced
+        assert mocked_fsync.call_count == 2
+        j.before_write(str(target))
+        #: so are the pre-image and its record
+        assert mocked_fsync.call_count == 4
+        j.written(str(target), 'new')
+        assert mocked_fsync.call_count == 4
+
+        mocked_fsync.reset_mock()
+        j.rollback()
+        j = journal.Journal(str(tmpdir))
+        j.before_write(str(tmpdir.join('new')))
+        mocked_fsync.assert_not_called()
+        j.commit()
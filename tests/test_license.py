@@ -9,13 +9,13 @@ import pytest
 
 from tempfile import gettempdir
 
-from skelpy.makers import base, license, settings
+from skelpy.utils import backends
+from skelpy.makers import base, license
 from . import mock
 
 
 @pytest.fixture(scope='module')
 def maker():
-    settings.clear()
     opts = {'projectDir': gettempdir(),
             'force': False,
             'license': 'GPL2',
@@ -33,13 +33,15 @@ def test_is_supported_license(maker):
 @mock.patch.object(base, 'get_template')
 @mock.patch('os.fsync')
 def test_generate(mocked_fsync, mocked_get_template, maker):
+    #: writes in place, so that mocked open() sees them
+    maker.settings['atomic'] = False
     mocked_info = mock.Mock()
     maker.logger.info = mocked_info
 
     maker.license = 'CC0'
     licFile = os.path.join(maker.projectDir, 'LICENSE')
 
-    with mock.patch.object(base, 'open', mock.mock_open(),
+    with mock.patch.object(backends, 'open', mock.mock_open(),
                            create=True) as mocked_open:
         with mock.patch('os.path.exists', side_effect=[True, True, False]):
             # LICENSE file exists && force is False
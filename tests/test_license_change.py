@@ -10,7 +10,7 @@ import shutil
 import datetime
 from tempfile import gettempdir
 
-from skelpy.makers import license_change, settings
+from skelpy.makers import license_change
 from skelpy.utils.helpers import read_setup_cfg
 from . import mock
 
@@ -41,14 +41,13 @@ def setup():
 def changer(setup, setup_cfg):
     os.chdir(gettempdir())
 
-    settings.clear()
     return license_change.Maker(list_option=False, license='NEW-BSD')
 
 
 def test_update_settings(changer):
     # 'today' is set in the parent class, i.e., LicenseMaker
-    assert settings.get('today') == datetime.date.today().isoformat()
-    assert settings.get('projectName') == os.path.split(os.getcwd())[-1]
+    assert changer.settings.get('today') == datetime.date.today().isoformat()
+    assert changer.settings.get('projectName') == os.path.split(os.getcwd())[-1]
 
 
 def test_replace_license(changer):
@@ -7,8 +7,14 @@
 from __future__ import absolute_import, print_function
 
 import os
+import sys
+import subprocess
+
+import pytest
+
 from skelpy import main
 import skelpy.utils.helpers as helpers
+from . import mock
 
 
 def test_parse_projecName():
@@ -61,3 +67,267 @@ def test_parse_projecName():
 
 def test_main():
     pass
+
+
+def test_batch(tmpdir):
+    manifest = tmpdir.join('manifest.jsonl')
+    manifest.write('\n'.join([
+        '{"projectName": "%s", "description": "first one"}' % tmpdir.join('first'),
+        '# comment lines and blank lines are skipped',
+        '',
+        '{"projectName": "%s", "format": "src", "license": "gpl3"}' % tmpdir.join('second'),
+        'not a json line',
+    ]) + '\n')
+
+    parser = main._setup_arg_parser()
+    opts = vars(parser.parse_args(['batch', str(manifest)]))
+    assert opts['func'] is main._batch
+
+    with mock.patch.object(helpers, 'get_userName', return_value='dks') as mocked_name, \
+            mock.patch.object(helpers, 'get_email', return_value='dks@email') as mocked_email:
+        #: the invalid line fails the batch, but does not stop it
+        assert main._batch(opts, parser) is False
+        #: identity is looked up once for the whole batch
+        assert mocked_name.call_count == 1
+        assert mocked_email.call_count == 1
+
+    first = tmpdir.join('first')
+    assert first.join('first', 'main.py').check()
+    assert 'first one' in first.join('README.rst').read()
+    assert 'dks' in first.join('LICENSE').read()
+
+    second = tmpdir.join('second')
+    assert second.join('src', 'second', 'main.py').check()
+    assert 'GNU GENERAL PUBLIC LICENSE' in second.join('LICENSE').read()
+
+
+def test_batch_jobs(tmpdir):
+    names = ['p{}'.format(i) for i in range(5)]
+    manifest = tmpdir.join('manifest.jsonl')
+    manifest.write('\n'.join(
+        '{"projectName": "%s", "author": "dks"}' % tmpdir.join(n) for n in names)
+        + '\n{"projectName": ""}\n')
+
+    parser = main._setup_arg_parser()
+    opts = vars(parser.parse_args(['batch', '--jobs', '2', str(manifest)]))
+    assert opts['jobs'] == 2
+
+    with mock.patch.object(helpers, 'get_email', return_value='dks@email'):
+        assert main._batch(opts, parser) is False
+
+    for n in names:
+        assert tmpdir.join(n, n, '__init__.py').check()
+        assert tmpdir.join(n, 'docs', 'conf.py').check()
+
+
+def test_update(tmpdir):
+    import json
+
+    parser = main._setup_arg_parser()
+    project = tmpdir.join('proj')
+    opts = vars(parser.parse_args(['-q', '-F', 'src', '--durability', 'none', str(project)]))
+    opts.pop('func')
+    opts.pop('verbose')
+    opts.update({'author': 'dks', 'author_email': 'dks@email', 'description': 'old one'})
+    assert main._skel(opts, parser) is True
+
+    manifest = project.join('.skelpy', 'manifest.json')
+    data = json.loads(manifest.read())
+    assert data['settings']['format'] == 'src'
+    assert data['settings']['description'] == 'old one'
+    #: no machine paths, so the project can be moved
+    assert not set(['projectDir', 'packageDir', 'docsDir', 'testsDir']) & set(data['settings'])
+    assert data['files']['README.rst']['template'] == 'readme'
+
+    #: the values changed, e.g., by hand; README.rst and setup.cfg use it
+    data['settings']['description'] = 'new one'
+    manifest.write(json.dumps(data))
+    project.join('setup.cfg').write('# modified by the user\n', mode='a')
+    modified = project.join('setup.cfg').read()
+    license = project.join('LICENSE')
+    license.setmtime(1000000000)
+
+    opts = vars(parser.parse_args(['update', '--durability', 'none', str(project)]))
+    assert opts['func'] is main._update
+    assert main._update(opts, parser) is True
+    assert 'new one' in project.join('README.rst').read()
+    assert project.join('setup.cfg').read() == modified
+    #: not rendered again
+    assert license.mtime() == 1000000000
+
+    opts = vars(parser.parse_args(['update', '-f', '--durability', 'none', str(project)]))
+    assert main._update(opts, parser) is True
+    assert 'new one' in project.join('setup.cfg').read()
+
+    opts = vars(parser.parse_args(['update', str(tmpdir)]))
+    assert main._update(opts, parser) is False
+
+
+def test_collect_info(tmpdir):
+    parser = main._setup_arg_parser()
+    opts = vars(parser.parse_args(['project']))
+    #: options not given do not hide the defaults
+    assert 'description' not in opts and 'info' not in opts
+    assert main._collect_info(opts) is True
+    assert opts['quiet'] is False
+
+    info = tmpdir.join('info.txt')
+    info.write('[Project]\ndescription = from file\nurl = https://file\n'
+               '[Author]\nauthor = dks\n')
+    opts = vars(parser.parse_args(['--info', str(info), '--url', 'https://flag',
+                                   'project']))
+    with mock.patch.dict('os.environ', {'SKELPY_AUTHOR': 'env', 'SKELPY_VERSION': '2.0'}):
+        assert main._collect_info(opts) is True
+    #: flags, then the file, then the environment
+    assert opts['url'] == 'https://flag'
+    assert opts['description'] == 'from file'
+    assert opts['author'] == 'dks'
+    assert opts['version'] == '2.0'
+    assert opts['quiet'] is True
+
+    opts = vars(parser.parse_args(['--description', 'flag', 'project']))
+    assert main._collect_info(opts) is True
+    assert opts['quiet'] is True
+
+    opts = vars(parser.parse_args(['--info', str(tmpdir.join('missing')), 'project']))
+    assert main._collect_info(opts) is False
+
+
+def test_skel_info(tmpdir):
+    parser = main._setup_arg_parser()
+    projectDir = tmpdir.join('p3')
+    opts = vars(parser.parse_args(['--durability', 'none', '--author', 'dks',
+                                   '--url', 'https://example.org/p3', str(projectDir)]))
+    assert main._skel(opts, parser) is True
+    assert 'url = https://example.org/p3' in projectDir.join('setup.cfg').read()
+    assert "url='https://example.org/p3'" in projectDir.join('setup.py').read()
+
+    #: the default URL, if not given
+    projectDir = tmpdir.join('p4')
+    opts = vars(parser.parse_args(['--durability', 'none', '--author', 'dks',
+                                   str(projectDir)]))
+    assert main._skel(opts, parser) is True
+    assert 'url = https://github.com/dks/p4' in projectDir.join('setup.cfg').read()
+
+
+def test_skel_percent(tmpdir):
+    parser = main._setup_arg_parser()
+    projectDir = tmpdir.join('p2')
+    opts = vars(parser.parse_args(['--durability', 'none', '--author', 'dks',
+                                   '--description', '100% pure', str(projectDir)]))
+    assert main._skel(opts, parser) is True
+    assert "description='100% pure'" in projectDir.join('setup.py').read()
+
+    info = tmpdir.join('info.txt')
+    info.write('[Project]\ndescription = 100% python\n[Author]\nauthor = dks\n')
+    projectDir = tmpdir.join('p5')
+    opts = vars(parser.parse_args(['--durability', 'none', '--info', str(info),
+                                   str(projectDir)]))
+    assert main._skel(opts, parser) is True
+    assert 'description = 100% python' in projectDir.join('setup.cfg').read()
+
+
+def test_trace(tmpdir, capsys):
+    import json
+    from skelpy.utils.trace import tracer
+
+    target = tmpdir.join('trace.json')
+    parser = main._setup_arg_parser()
+    opts = vars(parser.parse_args(['-q', '-v', '--durability', 'none', '--timings',
+                                   '--trace', str(target), str(tmpdir.join('traced'))]))
+    assert main._execute(opts, parser) == 0
+    assert not tracer.enabled
+
+    names = set(e['name'] for e in json.loads(target.read())['traceEvents'])
+    assert set(['ProjectMaker.generate', 'DocMaker.write_file', 'DocMaker.create_dir',
+                'get_template']) <= names
+    assert 'ProjectMaker.generate' in capsys.readouterr().out
+
+
+def test_invalid_output(tmpdir, capsys):
+    parser = main._setup_arg_parser()
+    opts = vars(parser.parse_args(['-q', '-v', '-o', str(tmpdir.join('out.unknown')),
+                                   '--author', 'dks', str(tmpdir.join('p'))]))
+    with mock.patch.object(helpers, 'get_email', return_value='dks@email'):
+        assert main._execute(opts, parser) == 1
+
+    out, err = capsys.readouterr()
+    assert '[skelpy] Invalid output' in err
+    #: the usage goes to the standard error, which never carries an archive
+    assert 'usage:' in err
+    assert 'usage:' not in out
+
+
+def test_run_batch_task():
+    #: invalid spec
+    assert main._run_batch_task((3, None)) == (3, None, 'Invalid project spec')
+
+    #: errors are reported, not raised
+    with mock.patch.object(main, '_generate_project', side_effect=OSError('whoops')):
+        lineno, projectName, error = main._run_batch_task((1, {'projectName': 'foo'}))
+        assert (lineno, projectName) == (1, 'foo')
+        assert 'whoops' in error
+
+
+def test_imap_pool():
+    #: more tasks than may be in flight at a time
+    tasks = [(i, None) for i in range(100)]
+    results = main._imap_pool(iter(tasks), 2, True)
+    assert sorted(lineno for lineno, _, _ in results) == list(range(100))
+
+    #: stopping early does not hang the pool
+    results = main._imap_pool(iter(tasks), 1, True)
+    assert next(results)[2] == 'Invalid project spec'
+    results.close()
+
+
+#: import-time budget of ``skelpy --help``, in microseconds
+IMPORT_TIME_BUDGET = 100000
+
+
+def _import_times(*args):
+    """run ``python -X importtime -m skelpy`` and parse its report
+
+    Returns:
+        dict: module name to its cumulative import time in microseconds, and
+        whether it is imported at the top level, i.e., not by another module
+
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(main.__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    env.pop('SKELPY_SOCKET', None)
+    cmd = [sys.executable, '-X', 'importtime', '-m', 'skelpy'] + list(args)
+
+    #: the first run may compile the byte code
+    subprocess.call(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _, err = proc.communicate()
+
+    times = {}
+    for line in err.decode('utf-8').splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        #: nested imports are indented
+        times[name.strip()] = int(cumulative), not name.startswith('  ', 1)
+
+    return times
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='-X importtime requires python 3.7+')
+def test_import_time():
+    times = _import_times('--help')
+    assert 'skelpy.main' in times
+
+    #: not needed to show the help message
+    for mod in ('logging', 'skelpy.makers', 'skelpy.templates', 'skelpy.utils.helpers', 'json'):
+        assert mod not in times
+
+    total = sum(t for mod, (t, top) in times.items()
+                if top and mod.split('.')[0] == 'skelpy')
+    assert total < IMPORT_TIME_BUDGET
+
+    #: 'license --list' needs the makers, but not the other sub-commands
+    times = _import_times('license', '--list')
+    assert 'skelpy.makers.license' in times
+    assert 'skelpy.utils.scheduler' not in times
@@ -7,16 +7,65 @@
 from __future__ import absolute_import, print_function
 
 from tempfile import gettempdir
-from skelpy.makers import get_maker, settings
-from skelpy.makers.docs import DocMaker
 
-settings['projectName'] = 'project'
+from . import mock
+from skelpy.makers import get_maker, Settings, Lazy
+from skelpy.makers.docs import DocMaker
 
 
 def test_get_maker():
     M = get_maker('docs')
     assert M is not None
-    assert isinstance(M(gettempdir(), True, True), DocMaker)
+    settings = Settings({'projectName': 'project'})
+    assert isinstance(M(gettempdir(), True, True, settings), DocMaker)
 
     M = get_maker('invalid')
     assert M is None
+
+
+def test_settings():
+    options = {'projectName': 'project', 'format': 'basic'}
+    settings = Settings(options)
+    settings.add_defaults({'version': '1.0.0', 'format': 'src'})
+    layer = settings.push({'format': 'src'})
+
+    #: lookups go from the top down
+    assert settings['format'] == 'src'
+    assert settings['version'] == '1.0.0'
+    assert settings.get('invalid') is None
+    assert sorted(settings) == ['format', 'projectName', 'version']
+    assert len(settings) == 3
+
+    #: writes go to the top-most layer
+    settings['version'] = '2.0.0'
+    assert layer['version'] == '2.0.0'
+    assert settings.maps[-1]['version'] == '1.0.0'
+    del settings['format']
+    assert settings['format'] == 'basic'
+
+    #: settings of different generations are independent
+    assert 'version' not in Settings(options)
+
+
+def test_lazy_settings():
+    func = mock.Mock(return_value='dks')
+    lazy = Lazy(func)
+    settings = Settings({'author': lazy, 'projectName': 'project'})
+
+    assert not lazy.evaluated
+    #: lazy values are not computed until looked up
+    assert settings.eager() == {'projectName': 'project'}
+    assert settings.resolve(['projectName', 'invalid']) == {'projectName': 'project'}
+    func.assert_not_called()
+
+    #: computed once
+    assert settings['author'] == 'dks'
+    assert settings.resolve(['author']) == {'author': 'dks'}
+    func.assert_called_once_with()
+    assert lazy.evaluated
+    assert settings.eager() == {'author': 'dks', 'projectName': 'project'}
+
+    #: pending lazy values hide those in the lower layers
+    settings.push({'projectName': Lazy(str, 'other')})
+    assert settings.eager() == {'author': 'dks'}
+    assert settings['projectName'] == 'other'
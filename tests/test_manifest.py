@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_manifest - pytest module for Manifest
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import string
+
+from skelpy.utils import manifest as m
+
+
+def test_record(tmpdir):
+    manifest = m.Manifest(str(tmpdir))
+    target = tmpdir.join('dir', 'file')
+    tpl = string.Template('${foo} data')
+    values = {'foo': 'some'}
+
+    manifest.record(str(target), 'tpl', tpl, values, 'some data')
+    #: files outside the project directory are not recorded
+    manifest.record(str(tmpdir.join('..', 'outside')), 'tpl', tpl, values, 'data')
+    assert list(manifest.files) == ['dir/file']
+    assert manifest.files['dir/file']['template'] == 'tpl'
+    #: the values rendered with, e.g., absolute paths, are not settings
+    assert manifest.settings == {}
+
+    assert manifest.is_current(str(target), tpl, values)
+    assert not manifest.is_current(str(target), tpl, {'foo': 'other'})
+    assert not manifest.is_current(str(target), string.Template('${foo}'), values)
+    assert not manifest.is_current(str(tmpdir.join('other')), tpl, values)
+
+
+def test_is_modified(tmpdir):
+    manifest = m.Manifest(str(tmpdir))
+    target = tmpdir.join('file')
+    target.write('some data')
+    manifest.record(str(target), None, string.Template('some data'), {}, 'some data')
+
+    assert manifest.is_modified(str(target)) is False
+    target.write('changed')
+    assert manifest.is_modified(str(target)) is True
+    #: files not recorded belong to the user
+    assert manifest.is_modified(str(tmpdir.join('other'))) is True
+
+
+def test_load(tmpdir):
+    assert m.Manifest.load(str(tmpdir)) is None
+
+    manifest = m.Manifest(str(tmpdir))
+    manifest.record(str(tmpdir.join('file')), 'tpl', string.Template('data'),
+                    {'foo': 'bar'}, 'data')
+    manifest.record_settings({'format': 'src', 'unsupported': object()})
+    os.makedirs(os.path.dirname(manifest.path))
+    with open(manifest.path, 'w') as f:
+        f.write(manifest.dumps())
+
+    loaded = m.Manifest.load(str(tmpdir))
+    assert loaded.files == manifest.files
+    assert loaded.settings == {'format': 'src'}
+    assert loaded.updating is False
+
+    tmpdir.join(m.MANIFEST_DIR, m.MANIFEST_FILE).write('{"version": 0}')
+    assert m.Manifest.load(str(tmpdir)) is None
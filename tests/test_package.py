@@ -10,13 +10,13 @@ import os
 import pytest
 from tempfile import gettempdir, tempdir
 
-from skelpy.makers import base, package, settings
+from skelpy.utils import backends
+from skelpy.makers import base, package
 from . import mock
 
 
 @pytest.fixture(scope='module')
 def maker1():
-    settings.clear()
     info = {
         'projectDir': gettempdir(),
         'projectName': 'project',
@@ -29,7 +29,6 @@ def maker1():
 
 @pytest.fixture(scope='module')
 def maker2():
-    settings.clear()
     info = {
         'projectDir': gettempdir(),
         'projectName': 'project',
@@ -47,8 +46,8 @@ def test_init(maker1, maker2):
 
 def test_udpate_settings(maker1):
     maker1._update_settings()
-    assert settings.get('packageDir') == os.path.join(maker1.projectDir,
-                                                               maker1.projectName)
+    assert maker1.settings.get('packageDir') == os.path.join(maker1.projectDir,
+                                                             maker1.projectName)
 
 
 @mock.patch('os.makedirs')
@@ -81,7 +80,9 @@ def test_create_package_dir(mocked_mkdir, mocked_makedirs, maker1, maker2):
 
 @mock.patch('os.fsync')
 def test_write_init(mocked_fsync, maker1):
-    with mock.patch.object(base, 'open', mock.mock_open(),
+    #: writes in place, so that mocked open() sees them
+    maker1.settings['atomic'] = False
+    with mock.patch.object(backends, 'open', mock.mock_open(),
                            create=True) as mocked_open:
         with mock.patch('os.path.exists', return_value=True):
             # exist && force == False
@@ -12,12 +12,12 @@ import pytest
 from tempfile import gettempdir, tempdir
 
 from . import mock
-from skelpy.makers import project, settings
+from skelpy.makers import project, Settings
+from skelpy.utils.journal import JOURNAL_FILE
 
 
 @pytest.fixture()
 def maker():
-    settings.clear()
     opts = {
         'projectDir': gettempdir(),
         'projectName': 'project',
@@ -28,40 +28,98 @@ def maker():
         'verbose': True,
         'test': 'pytest',
     }
-    settings.update(opts)
-    return project.Maker(**opts)
+    return project.Maker(settings=Settings(opts), **opts)
 
 
 def test_get_info(maker):
     maker._get_info()
     # assert Not None
-    assert settings.get('license')
-    assert settings.get('description')
+    assert maker.settings.get('license')
+    assert maker.settings.get('description')
+
+
+def test_get_info_file(maker):
+    edited = []
+
+    def edit(path, block):
+        assert os.path.basename(path) != 'info.txt'
+        with open(path, 'a') as f:
+            f.write('\n[Extra]\nurl = https://edited\n')
+        edited.append(path)
+        return 0
+
+    open_with = 'skelpy.makers.project.opener.open_with_associated_application'
+    with mock.patch(open_with, side_effect=edit):
+        assert maker._get_info() is True
+        assert maker._get_info() is True
+    assert maker.settings['url'] == 'https://edited'
+    #: a file of its own each time, removed afterwards
+    assert edited[0] != edited[1]
+    assert not any(os.path.exists(path) for path in edited)
+
+    #: removed on failure too
+    with mock.patch(open_with, side_effect=lambda path, block: edited.append(path) or -1):
+        assert maker._get_info() is False
+    with mock.patch(open_with, side_effect=lambda path, block: edited.append(path) or 1 / 0):
+        with pytest.raises(ZeroDivisionError):
+            maker._get_info()
+    assert len(edited) == 4
+    assert not any(os.path.exists(path) for path in edited)
+
+
+def test_update_info(maker):
+    #: defaults lie under all the other layers
+    assert maker.settings.maps[-1]['version'] == '1.0.0'
+    maker.settings.push({'version': '2.0.0'})
+    assert maker.settings['version'] == '2.0.0'
 
 
 def test_check_license(maker):
     with mock.patch.object(maker.logger, 'info') as mocked_info:
-        with mock.patch.dict(settings, {'license': 'INVALID'}):
-            maker._check_license()
-            assert mocked_info.called
-            assert settings.get('license') == 'MIT'
-        with mock.patch.dict(settings, {'license': 'new-bsd'}):
-            maker._check_license()
-            assert mocked_info.not_called
-            assert settings.get('license') == 'NEW-BSD'
-
-
-def test_create_config_files(maker):
-    cfgFile = os.path.join(maker.projectDir, 'setup.cfg')
-    setupFile = os.path.join(maker.projectDir, 'setup.py')
-    licFile = os.path.join(maker.projectDir, 'LICENSE')
-    readmeFile = os.path.join(maker.projectDir, 'README.rst')
-    files = [cfgFile, setupFile, licFile, readmeFile]
-
-    maker._create_config_files()
+        maker.settings['license'] = 'INVALID'
+        maker._check_license()
+        assert mocked_info.called
+        assert maker.settings.get('license') == 'MIT'
+        maker.settings['license'] = 'new-bsd'
+        maker._check_license()
+        assert mocked_info.not_called
+        assert maker.settings.get('license') == 'NEW-BSD'
+
+
+def test_run_makers(tmpdir):
+    opts = {
+        'projectDir': str(tmpdir),
+        'projectName': 'project',
+        'format': 'basic',
+        'quiet': True,
+        'merge': True,
+        'force': True,
+        'test': 'pytest',
+        'author': 'dks',
+        'author_email': 'dks@email',
+    }
+    maker = project.Maker.from_settings(Settings(opts))
+    files = ['setup.cfg', 'setup.py', 'LICENSE', 'README.rst',
+             os.path.join('project', 'main.py'), os.path.join('docs', 'conf.py'),
+             os.path.join('tests', 'test_main.py')]
+
+    with mock.patch.object(project.helpers, 'has_command', return_value=False):
+        assert maker._run_makers() is True
     for f in files:
-        assert os.path.exists(f)
-        os.remove(f)
+        assert tmpdir.join(f).check()
+    #: values SetupMaker re-reads from setup.cfg stay private to it
+    assert 'python_requires' not in maker.settings
+
+    #: fail fast
+    with mock.patch.object(project, 'get_maker', return_value=None):
+        assert maker._run_makers() is False
+
+
+def test_maker_dependencies():
+    makers = set(project.Maker.MAKERS)
+    for m, deps in project.Maker.MAKER_DEPENDENCIES.items():
+        assert m in makers
+        assert set(deps) <= makers
 
 
 def test_create_miscellaneous(maker):
@@ -77,6 +135,171 @@ def test_create_miscellaneous(maker):
         assert mocked_write.assert_not_called
 
 
-def test_run_subworkers(maker):
-    # all tests are done in the tests of sub-makers and the maker package.
-    pass
+def test_concurrent_generation(tmpdir):
+    import threading
+
+    def generate(name, results):
+        opts = {
+            'projectDir': str(tmpdir.join(name)),
+            'projectName': name,
+            'format': 'basic',
+            'quiet': True,
+            'merge': False,
+            'force': False,
+            'test': 'pytest',
+            'author': name + '_author',
+            'author_email': name + '@email',
+            'description': name + ' description',
+        }
+        maker = project.Maker.from_settings(Settings(opts))
+        results[name] = maker.generate()
+
+    results = {}
+    threads = [threading.Thread(target=generate, args=(name, results))
+               for name in ('alpha', 'beta')]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {'alpha': True, 'beta': True}
+    for name, other in (('alpha', 'beta'), ('beta', 'alpha')):
+        readme = tmpdir.join(name, 'README.rst').read()
+        assert name + ' description' in readme
+        assert other not in readme
+        assert name + '_author' in tmpdir.join(name, 'LICENSE').read()
+
+
+def test_generate_syncs_once(maker):
+    maker.settings['durability'] = 'batch'
+    with mock.patch.object(maker.settings.sync_queue, 'sync') as mocked_sync:
+        with mock.patch.object(maker, '_generate', return_value=False):
+            assert maker.generate() is False
+        #: even when the generation fails
+        mocked_sync.assert_called_once_with()
+
+
+def test_generate_rolls_back(tmpdir):
+    opts = {
+        'projectDir': str(tmpdir.join('project')),
+        'projectName': 'project',
+        'format': 'basic',
+        'quiet': True,
+        'merge': False,
+        'force': False,
+        'test': 'pytest',
+        'author': 'dks',
+        'author_email': 'dks@email',
+        'description': 'description',
+    }
+    maker = project.Maker.from_settings(Settings(opts))
+    failing = mock.Mock(return_value=False)
+    with mock.patch.object(maker, '_create_miscellaneous', failing):
+        assert maker.generate() is False
+    #: nothing is left behind
+    assert not tmpdir.join('project').check()
+
+    #: an interrupted generation, i.e., died before committing, is resumed
+    #: without --merge
+    maker = project.Maker.from_settings(Settings(opts))
+    with mock.patch.object(project.helpers, 'has_command', return_value=False), \
+            mock.patch.object(project.Journal, 'commit'):
+        assert maker.generate() is True
+    assert tmpdir.join('project', JOURNAL_FILE).check()
+    readme = tmpdir.join('project', 'README.rst')
+    readme.setmtime(1000000000)
+
+    maker = project.Maker.from_settings(Settings(opts))
+    with mock.patch.object(project.helpers, 'has_command', return_value=False):
+        assert maker.generate() is True
+    #: files already written are not written again
+    assert readme.mtime() == 1000000000
+    assert sorted(os.listdir(str(tmpdir.join('project')))) == sorted(
+        ['.skelpy', 'LICENSE', 'README.rst', 'docs', 'project', 'setup.cfg',
+         'setup.py', 'tests'])
+
+
+def test_generate_not_journaled(tmpdir):
+    opts = {
+        'projectDir': str(tmpdir.join('project')),
+        'projectName': 'project',
+        'format': 'basic',
+        'quiet': True,
+        'merge': False,
+        'force': False,
+        'test': 'pytest',
+        'author': 'dks',
+        'author_email': 'dks@email',
+        'durability': 'none',
+    }
+    maker = project.Maker.from_settings(Settings(opts))
+    with mock.patch.object(project, 'Journal') as mocked_journal, \
+            mock.patch.object(maker, '_create_miscellaneous', return_value=False):
+        assert maker.generate() is False
+    mocked_journal.assert_not_called()
+    #: not rolled back
+    assert tmpdir.join('project').check(dir=1)
+
+    #: the journal of an interrupted generation is still resumed
+    tmpdir.join('project', JOURNAL_FILE).write('')
+    maker = project.Maker.from_settings(Settings(dict(opts, merge=True, force=True)))
+    with mock.patch.object(project, 'Journal', wraps=project.Journal) as mocked_journal, \
+            mock.patch.object(project.helpers, 'has_command', return_value=False):
+        assert maker.generate() is True
+    assert mocked_journal.called
+    assert not tmpdir.join('project', JOURNAL_FILE).check()
+
+
+def test_generate_staged(tmpdir):
+    opts = {
+        'projectDir': str(tmpdir.join('project')),
+        'projectName': 'project',
+        'format': 'basic',
+        'quiet': True,
+        'merge': False,
+        'force': False,
+        'test': 'pytest',
+        'author': 'dks',
+        'author_email': 'dks@email',
+        'staging': True,
+    }
+    maker = project.Maker.from_settings(Settings(opts))
+    with mock.patch.object(maker, '_create_miscellaneous', return_value=False):
+        assert maker.generate() is False
+    #: the staging directory is removed
+    assert tmpdir.listdir() == []
+
+    #: the parent directories created for the staging directory are removed too
+    nested = dict(opts, projectDir=str(tmpdir.join('a', 'b', 'project')))
+    maker = project.Maker.from_settings(Settings(nested))
+    with mock.patch.object(maker, '_create_miscellaneous', return_value=False):
+        assert maker.generate() is False
+    assert tmpdir.listdir() == []
+
+    #: an empty project directory created while generating is not replaced
+    maker = project.Maker.from_settings(Settings(opts))
+    with mock.patch.object(project.helpers, 'has_command', return_value=False), \
+            mock.patch.object(maker, '_create_miscellaneous',
+                              side_effect=lambda: tmpdir.mkdir('project') and True):
+        assert maker.generate() is False
+    assert tmpdir.join('project').listdir() == []
+    tmpdir.join('project').remove()
+
+    maker = project.Maker.from_settings(Settings(opts))
+    renames = []
+    rename = project.durability.rename_noreplace
+
+    def _rename(src, dst):
+        renames.append(dst)
+        rename(src, dst)
+
+    with mock.patch.object(project.helpers, 'has_command', return_value=False), \
+            mock.patch.object(project.durability, 'rename_noreplace', side_effect=_rename):
+        assert maker.generate() is True
+    assert renames == [str(tmpdir.join('project'))]
+    assert [p.basename for p in tmpdir.listdir()] == ['project']
+    #: templates refer to the project directory, not the staging directory
+    conf = tmpdir.join('project', 'docs', 'conf.py').read()
+    assert str(tmpdir.join('project')) in conf
+    assert 'staging' not in conf
+    assert maker.settings.staging is None
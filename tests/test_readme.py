@@ -10,13 +10,13 @@ import os
 import pytest
 from tempfile import gettempdir
 
-from skelpy.makers import base, readme, settings
+from skelpy.utils import backends
+from skelpy.makers import base, readme
 from . import mock
 
 
 @pytest.fixture()
 def maker():
-    settings.clear()
     opts = {
         'projectDir': gettempdir(),
         'projectName': 'My Awesome Project',
@@ -27,12 +27,14 @@ def maker():
 
 
 def test_update_settings(maker):
-    assert settings.get('line') == '*' * len('My Awesome Project')
+    assert maker.settings.get('line') == '*' * len('My Awesome Project')
 
 
 @mock.patch('os.fsync')
 def test_write_main(mocked_fsync, maker):
-    with mock.patch.object(base, 'open', mock.mock_open(),
+    #: writes in place, so that mocked open() sees them
+    maker.settings['atomic'] = False
+    with mock.patch.object(backends, 'open', mock.mock_open(),
                            create=True) as mocked_open:
         with mock.patch('os.path.exists', return_value=True):
             # exist && force == False
@@ -40,7 +42,8 @@ def test_write_main(mocked_fsync, maker):
             mocked_open().write.assert_not_called()
             # exist && force == True
             maker.force = True
-            assert maker.generate()
+            with mock.patch.object(base.durability, 'same_content', return_value=False):
+                assert maker.generate()
             assert mocked_open().write.called
         with mock.patch('os.path.exists', return_value=False):
             # not exist
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_report - pytest module for Report
+
+"""
+
+from __future__ import absolute_import, print_function
+
+from skelpy.utils import report
+
+
+def test_report():
+    r = report.Report()
+    assert r.summary() == '0 created, 0 overwritten, 0 unchanged, 0 skipped'
+
+    r.add(report.CREATED, 'a')
+    r.add(report.CREATED, 'b')
+    r.add(report.UNCHANGED, 'c')
+    assert r.count(report.CREATED) == 2
+    assert r.files[report.UNCHANGED] == ['c']
+    assert r.summary() == '2 created, 0 overwritten, 1 unchanged, 0 skipped'
+
+
+def test_report_bytes_and_timings():
+    r = report.Report()
+    r.add(report.CREATED, 'a', 10)
+    r.add(report.OVERWRITTEN, 'b', 5)
+    r.add(report.SKIPPED, 'c')
+    assert r.bytes_written == 15
+
+    r.add_timing('docs', 0.5)
+    r.add_timing('docs', 0.25)
+    assert r.timings == {'docs': 0.75}
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_scheduler - pytest module for run_graph
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import threading
+import time
+
+import pytest
+
+from skelpy.utils.scheduler import run_graph
+
+
+def _job(name, log, result=True, delay=0.0):
+    def job():
+        time.sleep(delay)
+        log.append(name)
+        return result
+    return job
+
+
+def test_run_graph_order():
+    log = []
+    jobs = [('a', _job('a', log, delay=0.05)),
+            ('b', _job('b', log)),
+            ('c', _job('c', log))]
+    #: 'b' waits for 'a', 'c' is independent
+    assert run_graph(jobs, {'b': ('a',), 'c': ('invalid',)}) is True
+    assert log.index('a') < log.index('b')
+    assert log[0] == 'c'
+
+
+def test_run_graph_concurrency():
+    barrier = []
+    lock = threading.Lock()
+
+    def job():
+        with lock:
+            barrier.append(1)
+        #: both jobs must be running at the same time to finish
+        deadline = time.time() + 5
+        while len(barrier) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        return len(barrier) == 2
+
+    assert run_graph([('a', job), ('b', job)], {}) is True
+
+
+def test_run_graph_fail_fast():
+    log = []
+    jobs = [('a', _job('a', log, result=False)),
+            ('b', _job('b', log)),
+            ('c', _job('c', log, delay=0.05))]
+    assert run_graph(jobs, {'b': ('a',)}) is False
+    #: jobs depending on the failed one never start; running ones finish
+    assert 'b' not in log
+    assert 'c' in log
+
+
+def test_run_graph_errors():
+    def boom():
+        raise OSError('whoops')
+
+    log = []
+    with pytest.raises(OSError):
+        run_graph([('a', boom), ('b', _job('b', log))], {'b': ('a',)})
+    assert log == []
+
+    #: circular dependencies
+    with pytest.raises(ValueError):
+        run_graph([('a', _job('a', log)), ('b', _job('b', log))],
+                  {'a': ('b',), 'b': ('a',)})
+
+    assert run_graph([], {}) is True
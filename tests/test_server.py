@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_server - pytest module for the skelpy server
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import sys
+import threading
+
+import pytest
+
+from skelpy import client, main
+from skelpy.utils import helpers
+from . import mock
+
+server = pytest.importorskip('skelpy.server')
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='needs Unix sockets')
+
+
+@pytest.fixture()
+def socket_path(tmpdir):
+    path = str(tmpdir.join('skelpy.sock'))
+    srv = server.Server(path)
+    ready = threading.Event()
+    thread = threading.Thread(target=srv.serve_forever, args=(ready.set,))
+    thread.start()
+    assert ready.wait(10)
+
+    yield path
+
+    srv.shutdown()
+    thread.join(10)
+    assert not tmpdir.join('skelpy.sock').check()
+
+
+def test_forward_template(socket_path, tmpdir, capsys):
+    with tmpdir.as_cwd(), \
+            mock.patch.object(helpers, 'get_email', return_value='dks@email'):
+        status = client.forward(['-q', 'project'], socket_path)
+    assert status == 0
+    assert 'Successfully done.' in capsys.readouterr().out
+    assert tmpdir.join('project', 'project', 'main.py').check()
+    assert tmpdir.join('project', 'docs', 'conf.py').check()
+
+
+def test_socket_mode(socket_path):
+    import os
+    import stat
+
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+
+def test_execute_not_quiet(tmpdir):
+    #: the editor would block the server
+    with mock.patch.object(helpers, 'get_email', return_value='dks@email'), \
+            mock.patch('skelpy.utils.opener.open_with_associated_application') as mocked_editor:
+        for request in ({'command': 'template',
+                         'options': {'projectName': 'p1', 'author': 'dks'}},
+                        {'argv': ['p2']}):
+            response = server.execute(dict(request, cwd=str(tmpdir)))
+            assert response['status'] == 0
+        mocked_editor.assert_not_called()
+    assert tmpdir.join('p1', 'setup.py').check()
+    assert tmpdir.join('p2', 'setup.py').check()
+
+
+def test_forward_license(socket_path, capsys):
+    assert client.forward(['license', '--list'], socket_path) == 0
+    assert 'Supported licenses' in capsys.readouterr().out
+
+    #: invalid arguments
+    assert client.forward(['license', '-q'], socket_path) == 2
+    assert 'unrecognized arguments' in capsys.readouterr().err
+
+
+def test_execute_options(tmpdir):
+    request = {'command': 'template',
+               'options': {'projectName': 'project', 'quiet': True,
+                           'author': 'dks', 'author_email': 'dks@email'},
+               'cwd': str(tmpdir)}
+    response = server.execute(request)
+    assert response['status'] == 0
+    assert tmpdir.join('project', 'setup.py').check()
+
+    response = server.execute({'command': 'invalid'})
+    assert response['status'] == 2
+    assert 'unsupported command' in response['stderr']
+
+
+def test_execute_batch_stdin(tmpdir):
+    #: would block the server on its own standard input
+    with mock.patch.object(sys, 'stdin') as mocked_stdin:
+        for request in ({'command': 'batch'},
+                        {'command': 'batch', 'options': {'manifest': '-'}},
+                        {'argv': ['batch', '-']}):
+            response = server.execute(dict(request, cwd=str(tmpdir)))
+            assert response['status'] == 2
+            assert 'manifest' in response['stderr']
+        assert not mocked_stdin.mock_calls
+
+    manifest = tmpdir.join('manifest.jsonl')
+    manifest.write('{"projectName": "p", "author": "dks", "author_email": "dks@email"}\n')
+    response = server.execute({'command': 'batch', 'options': {'manifest': str(manifest)},
+                               'cwd': str(tmpdir)})
+    assert response['status'] == 0
+    assert tmpdir.join('p', 'setup.py').check()
+
+
+def test_run_forwards(socket_path, capsys):
+    with mock.patch.dict('os.environ', {client.ENV_SOCKET: socket_path}), \
+            mock.patch.object(main, '_setup_logger') as mocked_setup_logger:
+        assert main.run(['license', '--list']) == 0
+        #: executed in the server, not locally
+        mocked_setup_logger.assert_not_called()
+    assert 'Supported licenses' in capsys.readouterr().out
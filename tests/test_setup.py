@@ -13,7 +13,7 @@ from tempfile import gettempdir
 
 from . import mock
 from skelpy.makers import setup as m
-from skelpy.makers import settings
+from skelpy.makers import Settings
 from skelpy.utils import helpers
 
 
@@ -146,10 +146,9 @@ def setup_cfg():
 
 @pytest.fixture(scope='module')
 def maker(setup_cfg):
-    settings.clear()
-    settings.update(helpers.read_setup_cfg(setup_cfg))
+    settings = Settings(helpers.read_setup_cfg(setup_cfg))
     settings['projectName'] = settings.get('name')
-    return m.SetupMaker(gettempdir(), True)
+    return m.SetupMaker(gettempdir(), True, settings)
 
 
 def test_format(maker):
@@ -201,6 +200,7 @@ Operating System :: Microsoft :: Windows"""
 
 
 def test_update_settings(maker, setup_cfg):
+    settings = maker.settings
     assert settings['author'] == 'dks, june3474'
     assert settings['install_requires'] == ("'six',"
                                                      + '\n        '
@@ -240,7 +240,9 @@ def test_generate(maker, setup_cfg):
             maker.force = True
             maker.generate()
             mocked_info.assert_any_call("overwriting...")
+            #: the same content is not written again
             mocked_info.assert_called_with(
-                "created file: '{}'".format(setupFile))
+                "file unchanged: '{}'".format(setupFile))
+            mocked_open.assert_not_called()
 
     os.remove(setupFile)
@@ -12,13 +12,11 @@ from tempfile import gettempdir, tempdir
 
 import skelpy.makers.setup_cfg as m
 from skelpy.utils.helpers import read_setup_cfg
-from skelpy.makers import settings
 from . import mock
 
 
 @pytest.fixture()
 def maker():
-    settings.clear()
     # 'description' and 'license' are not given
     opts = {'projectDir': gettempdir(),
             'projectName': 'project',
@@ -5,7 +5,10 @@
 from __future__ import absolute_import, print_function
 
 import string
+
+from skelpy import templates
 from skelpy.templates import get_template
+from . import mock
 
 
 def test_get_template():
@@ -21,3 +24,72 @@ def test_get_template():
     ret = get_template("setup")
     assert isinstance(ret, string.Template)
     assert "from setuptools import find_packages, setup" in ret.template
+
+
+def test_template_cache():
+    templates.cache_clear()
+
+    #: first lookup compiles the template, the second one hits the cache
+    first = get_template('readme')
+    second = get_template('readme')
+    assert first is second
+    info = templates.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    #: invalid templates are not cached
+    assert get_template('invalid') is None
+    assert templates.cache_info().currsize == 1
+
+    #: a changed source file invalidates the entry
+    with mock.patch.object(templates, '_stamp', return_value=(0, 0)):
+        third = get_template('readme')
+    assert third is not first
+    assert third.template == first.template
+    assert templates.cache_info().misses == 3
+
+    templates.cache_clear()
+    assert templates.cache_info() == (0, 0, 0)
+
+
+def test_placeholders():
+    assert templates.find_placeholders('${foo} $bar $$escaped ${foo} $') == {'foo', 'bar'}
+    assert templates.placeholders(string.Template('$foo')) == {'foo'}
+    assert templates.placeholders('invalid') is None
+
+    index = templates.placeholder_index()
+    assert sorted(index) == templates.template_names()
+    assert 'projectName' in index['setup_cfg']
+    assert {'author', 'year'} <= index['license_mit']
+    assert index['readme'] == templates.placeholders('readme')
+
+
+def test_compiled_template():
+    text = ('$$ ${foo} $foo $foo_bar ${unknown} $unknown $ ${in valid} $1 '
+            '$$foo $${foo} ${foo}${foo}')
+    mapping = {'foo': 'FOO', 'foo_bar': 1}
+    template = templates.CompiledTemplate(text)
+    assert template.placeholders == {'foo', 'foo_bar', 'unknown'}
+
+    expected = string.Template(text).safe_substitute(mapping)
+    assert template.safe_substitute(mapping) == expected
+    assert template.safe_substitute() == string.Template(text).safe_substitute()
+    assert template.safe_substitute(mapping, foo='kw') == \
+        string.Template(text).safe_substitute(mapping, foo='kw')
+    #: substitute() is inherited
+    assert templates.CompiledTemplate('$foo').substitute(foo=1) == '1'
+
+    #: each placeholder is looked up once
+    mocked_mapping = mock.MagicMock()
+    mocked_mapping.__getitem__.return_value = 'value'
+    templates.CompiledTemplate('$foo $foo ${foo}').safe_substitute(mocked_mapping)
+    mocked_mapping.__getitem__.assert_called_once_with('foo')
+
+    #: exactly the same as string.Template for all the templates shipped
+    mapping = dict((name, '<{}>'.format(name))
+                   for names in templates.placeholder_index().values() for name in names)
+    mapping.pop('projectName')
+    for name in templates.template_names():
+        template = get_template(name)
+        assert isinstance(template, templates.CompiledTemplate)
+        assert template.safe_substitute(mapping) == \
+            string.Template(template.template).safe_substitute(mapping)
@@ -10,13 +10,12 @@ import os
 import pytest
 from tempfile import gettempdir, tempdir
 
-from skelpy.makers import tests, settings
+from skelpy.makers import tests
 from . import mock
 
 
 @pytest.fixture(scope='module')
 def maker():
-    settings.clear()
     opts = {
         'projectDir': gettempdir(),
         'force': True,
@@ -27,7 +26,7 @@ def maker():
 
 
 def test_update_settings(maker):
-    assert settings['testsDir'] == os.path.join(maker.projectDir, 'tests')
+    assert maker.settings['testsDir'] == os.path.join(maker.projectDir, 'tests')
 
 def test_create_config_files(maker):
     with mock.patch.object(maker, 'write_file') as mocked_write:
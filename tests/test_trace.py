@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""test_trace - pytest module for Tracer
+
+"""
+
+from __future__ import absolute_import, print_function
+
+import json
+
+import pytest
+
+from skelpy.utils import trace
+
+
+@pytest.fixture
+def tracer():
+    trace.tracer.clear()
+    trace.tracer.enabled = True
+    yield trace.tracer
+    trace.tracer.enabled = False
+    trace.tracer.clear()
+
+
+class Demo(object):
+    @trace.traced('work', arg=1, method=True)
+    def work(self, path):
+        return path
+
+
+class SubDemo(Demo):
+    @trace.traced('work', arg=1, method=True)
+    def work(self, path):
+        return super(SubDemo, self).work(path)
+
+
+@trace.traced('double', trace.PROCESS, arg=0, key='value')
+def double(value):
+    return value * 2
+
+
+def test_disabled():
+    trace.tracer.clear()
+    assert double(2) == 4
+    with trace.tracer.span('nothing'):
+        pass
+    assert trace.tracer.spans() == []
+
+
+def test_traced(tracer):
+    assert double(2) == 4
+    assert Demo().work('a/b') == 'a/b'
+    with tracer.span('block', trace.TEMPLATE, {'name': 'x'}):
+        pass
+
+    spans = tracer.spans()
+    assert [(s[0], s[1], s[5]) for s in spans] == [
+        ('double', trace.PROCESS, {'value': '2'}),
+        ('Demo.work', trace.MAKER, {'path': 'a/b'}),
+        ('block', trace.TEMPLATE, {'name': 'x'})]
+    assert all(end >= start for _, _, start, end, _, _ in spans)
+
+    #: recorded even if the call raises
+    with pytest.raises(TypeError):
+        double(None)
+    assert len(tracer.spans()) == 4
+
+
+def test_traced_super(tracer):
+    #: the overridden method called through super() is not counted again
+    assert SubDemo().work('a') == 'a'
+    assert [s[0] for s in tracer.spans()] == ['SubDemo.work']
+    assert SubDemo().work('b') == 'b'
+    assert [s[0] for s in tracer.spans()] == ['SubDemo.work', 'SubDemo.work']
+
+
+def test_export_and_summary(tracer, tmpdir):
+    double(1)
+    double(2)
+    Demo().work('path')
+
+    target = tmpdir.join('trace.json')
+    assert tracer.export(str(target)) == 3
+    events = json.loads(target.read())['traceEvents']
+    assert [e['name'] for e in events] == ['double', 'double', 'Demo.work']
+    assert all(e['ph'] == 'X' and e['dur'] >= 0 and e['ts'] >= 0 for e in events)
+
+    lines = tracer.summary().splitlines()
+    assert lines[0].split() == ['span', 'count', 'total(ms)', 'max(ms)']
+    assert sorted(line.split()[:2] for line in lines[1:]) == \
+        [['Demo.work', '1'], ['double', '2']]